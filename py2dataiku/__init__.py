@@ -17,13 +17,9 @@ Visualization formats:
 - Interactive: Enhanced HTML with pan/zoom, search, and export
 """
 
-try:
-    from importlib.metadata import version as _get_version
-    __version__ = _get_version("py-iku")
-except Exception:
-    __version__ = "0.3.0"
-
-import warnings
+import functools
+from pathlib import PurePath
+from types import MappingProxyType
 from typing import Optional
 
 # Configuration
@@ -156,7 +152,7 @@ from py2dataiku.visualizers import (
     visualize_flow,
 )
 
-__all__ = [
+__all__ = (
     # LLM-based (recommended)
     "LLMCodeAnalyzer",
     "LLMFlowGenerator",
@@ -231,8 +227,10 @@ __all__ = [
     # Convenience functions
     "convert",
     "convert_with_llm",
+    "convert_batch_with_llm",
     "convert_file",
     "convert_file_with_llm",
+    "convert_files_with_llm",
     # Plugin system
     "PluginRegistry",
     "plugin_hook",
@@ -257,7 +255,48 @@ __all__ = [
     "ValidationError",
     "ExportError",
     "ConfigurationError",
-]
+)
+
+
+def __getattr__(name: str):
+    """Resolve ``__version__`` lazily (PEP 562).
+
+    Looking the version up through ``importlib.metadata`` scans installed
+    distributions, which is measurable on cold start, so it is deferred
+    until someone actually asks for it and then cached in module globals.
+    """
+    if name == "__version__":
+        try:
+            from importlib.metadata import version as _get_version
+            value = _get_version("py-iku")
+        except Exception:
+            value = "0.3.0"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=128)
+def _analyze_rule_based_cached(code: str) -> tuple:
+    """Parse and walk ``code`` once per distinct source string."""
+    return tuple(CodeAnalyzer().analyze(code))
+
+
+def _analyze_rule_based(code: str) -> list:
+    """
+    Run rule-based analysis, reusing earlier results for identical code.
+
+    The cache is process-local and bounded to the 128 most recent sources.
+    Callers get a deep copy because the flow generator and optimizer may
+    share and mutate the transformations' lists. Custom plugin method
+    handlers can have side effects or change between calls, so the cache is
+    bypassed while any are registered. Syntax errors are never cached.
+    """
+    import copy
+
+    if PluginRegistry.has_method_handlers():
+        return CodeAnalyzer().analyze(code)
+    return copy.deepcopy(list(_analyze_rule_based_cached(code)))
 
 
 def convert(code, optimize: bool = True) -> DataikuFlow:
@@ -289,8 +328,7 @@ def convert(code, optimize: bool = True) -> DataikuFlow:
     ):
         return convert_file(code, optimize=optimize)
 
-    analyzer = CodeAnalyzer()
-    transformations = analyzer.analyze(code)
+    transformations = _analyze_rule_based(code)
 
     generator = FlowGenerator()
     flow = generator.generate(transformations, optimize=optimize)
@@ -307,6 +345,8 @@ def convert_with_llm(
     flow_name: str = "converted_flow",
     on_progress=None,
     temperature: float = 0.0,
+    stream: bool = False,
+    cache=None,
 ) -> DataikuFlow:
     """
     Convert Python code to a Dataiku flow using LLM-based analysis.
@@ -333,11 +373,24 @@ def convert_with_llm(
             - ``"optimizing"`` — ``{"recipe_count": int}`` (only when ``optimize=True``)
             - ``"done"``       — ``{"recipes": int, "datasets": int}``
 
+            When ``stream=True`` an extra ``"step"`` phase is emitted
+            between ``"analyzing"`` and ``"analyzed"`` for each step as soon
+            as the LLM has produced it:
+            ``{"step_number": int, "operation": str, "description": str}``.
+
             Exceptions raised inside the callback are silently swallowed so
             that a buggy progress handler never aborts the conversion.
         temperature: Sampling temperature passed to the LLM (default ``0.0``).
             Keep at ``0.0`` for deterministic, reproducible flows. Raise only
             if you intentionally want run-to-run variation.
+        stream: When ``True``, read the LLM response as a stream (see
+            :meth:`LLMCodeAnalyzer.analyze_streaming`) so ``"step"`` progress
+            events arrive while the model is still generating. The final
+            flow is the same; token usage is not reported on this path.
+        cache: Optional :class:`~py2dataiku.llm.LLMCache`. Requests made at
+            ``temperature=0`` are answered from it when the same prompt was
+            seen before, and stored in it otherwise. Flows built from a
+            cached response carry no ``llm_usage``.
 
     Returns:
         DataikuFlow object representing the converted pipeline.
@@ -385,10 +438,22 @@ def convert_with_llm(
 
     # Initialize LLM analyzer
     llm_provider = get_provider(provider, api_key, model, temperature=temperature)
+    if cache is not None:
+        llm_provider = cache.wrap(llm_provider)
     _emit("analyzing", {"provider": provider, "model": llm_provider.model_name})
 
     analyzer = LLMCodeAnalyzer(provider=llm_provider)
-    analysis = analyzer.analyze(code)
+    if stream:
+        analysis = analyzer.analyze_streaming(
+            code,
+            on_step=lambda step: _emit("step", {
+                "step_number": step.step_number,
+                "operation": step.operation.value,
+                "description": step.description,
+            }),
+        )
+    else:
+        analysis = analyzer.analyze(code)
     _emit("analyzed", {
         "steps": len(analysis.steps),
         "datasets": len(analysis.datasets),
@@ -417,6 +482,87 @@ def convert_with_llm(
     return flow
 
 
+def _read_source_file(path: str) -> str:
+    """
+    Read a Python source file as UTF-8 text via a read-only memory map.
+
+    Decoding straight from the mapped pages avoids the intermediate
+    full-size buffer that ``f.read()`` allocates, so peak memory for large
+    generated scripts stays at roughly one copy of the source. Newlines are
+    left untranslated; both ``ast.parse`` and the LLM prompt handle ``\\r\\n``.
+
+    Args:
+        path: Path to a ``.py`` file on disk.
+
+    Returns:
+        The decoded file contents.
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist.
+        OSError: If the file cannot be read.
+    """
+    import mmap
+    import os
+
+    with open(path, "rb") as f:
+        # mmap refuses zero-length files; an empty script is just "".
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, "utf-8")
+
+
+def convert_batch_with_llm(
+    codes: list[str],
+    provider: str = "anthropic",
+    api_key: Optional[str] = None,
+    model: Optional[str] = None,
+    optimize: bool = True,
+    flow_name: str = "converted_flow",
+    temperature: float = 0.0,
+    max_batch_size: int = 8,
+) -> list[DataikuFlow]:
+    """
+    Convert many small Python snippets using batched LLM requests.
+
+    Instead of one request per snippet, snippets are packed several to a
+    prompt (see :meth:`LLMCodeAnalyzer.analyze_batch`), so per-request
+    overhead is paid once per batch. Best suited to many short scripts;
+    for a handful of large files prefer :func:`convert_files_with_llm`.
+
+    Args:
+        codes: Python source code strings.
+        provider: LLM provider (``"anthropic"`` or ``"openai"``).
+        api_key: API key (uses environment variable if not provided).
+        model: Model name override (uses provider default if not provided).
+        optimize: Whether to optimize each flow.
+        flow_name: Base name for the flows; the i-th flow (1-based) is
+            named ``f"{flow_name}_{i}"``.
+        temperature: Sampling temperature passed to the LLM (default ``0.0``).
+        max_batch_size: Maximum number of snippets per LLM request.
+
+    Returns:
+        List of DataikuFlow objects in the same order as ``codes``.
+
+    Raises:
+        ConfigurationError: If the API key for the requested provider is
+            missing (not passed and not set as an environment variable).
+    """
+    llm_provider = get_provider(provider, api_key, model, temperature=temperature)
+    analyzer = LLMCodeAnalyzer(provider=llm_provider)
+    analyses = analyzer.analyze_batch(list(codes), max_batch_size=max_batch_size)
+
+    flows = []
+    for i, analysis in enumerate(analyses, 1):
+        flow = LLMFlowGenerator().generate(
+            analysis, flow_name=f"{flow_name}_{i}", optimize=optimize
+        )
+        if getattr(analysis, "usage", None) is not None:
+            flow.llm_usage = dict(analysis.usage)
+        flows.append(flow)
+    return flows
+
+
 def convert_file(path: str, optimize: bool = True) -> DataikuFlow:
     """
     Convert a Python file to a Dataiku flow using rule-based analysis.
@@ -433,8 +579,7 @@ def convert_file(path: str, optimize: bool = True) -> DataikuFlow:
         FileNotFoundError: If ``path`` does not exist.
         OSError: If the file cannot be read.
     """
-    with open(path, encoding="utf-8") as f:
-        code = f.read()
+    code = _read_source_file(path)
     flow = convert(code, optimize=optimize)
     flow.source_file = path
     return flow
@@ -476,8 +621,7 @@ def convert_file_with_llm(
             missing (not passed and not set as an environment variable).
     """
     import os
-    with open(path, encoding="utf-8") as f:
-        code = f.read()
+    code = _read_source_file(path)
     if flow_name is None:
         flow_name = os.path.splitext(os.path.basename(path))[0]
     flow = convert_with_llm(
@@ -494,14 +638,130 @@ def convert_file_with_llm(
     return flow
 
 
+def convert_files_with_llm(
+    paths,
+    provider: str = "anthropic",
+    api_key: Optional[str] = None,
+    model: Optional[str] = None,
+    optimize: bool = True,
+    temperature: float = 0.0,
+    max_concurrency: int = 8,
+) -> list[DataikuFlow]:
+    """
+    Convert several Python files to Dataiku flows with concurrent LLM calls.
+
+    Each file is analyzed independently, but the LLM requests are issued
+    concurrently on one event loop (bounded by ``max_concurrency``), so the
+    wall time for a batch is close to that of the slowest single request
+    rather than the sum of all of them. Transient provider errors such as
+    rate limits are retried by the provider SDK (see ``max_retries`` on
+    :class:`AnthropicProvider` / :class:`OpenAIProvider`).
+
+    Args:
+        paths: Iterable of paths (``str`` or ``pathlib.Path``) to ``.py`` files.
+        provider: LLM provider (``"anthropic"`` or ``"openai"``).
+        api_key: API key (uses environment variable if not provided).
+        model: Model name override (uses provider default if not provided).
+        optimize: Whether to optimize each flow.
+        temperature: Sampling temperature passed to the LLM (default ``0.0``).
+        max_concurrency: Maximum number of LLM requests in flight at once.
+
+    Returns:
+        List of DataikuFlow objects in the same order as ``paths``. Each flow
+        is named after its file stem and has ``source_file`` set.
+
+    Raises:
+        ValueError: If ``max_concurrency`` is less than 1.
+        FileNotFoundError: If any path does not exist.
+        ConfigurationError: If the API key for the requested provider is
+            missing (not passed and not set as an environment variable).
+
+    Note:
+        This function starts its own event loop with ``asyncio.run`` and so
+        cannot be called from inside a running loop (e.g. a Jupyter cell
+        or an async web handler). There, await
+        :meth:`LLMCodeAnalyzer.analyze_async` directly.
+    """
+    import asyncio
+
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    llm_provider = get_provider(provider, api_key, model, temperature=temperature)
+    analyzer = LLMCodeAnalyzer(provider=llm_provider)
+    return asyncio.run(
+        _convert_files_async(
+            [str(p) for p in paths], analyzer, optimize, max_concurrency
+        )
+    )
+
+
+async def _convert_files_async(
+    paths: list[str],
+    analyzer: LLMCodeAnalyzer,
+    optimize: bool,
+    max_concurrency: int,
+) -> list[DataikuFlow]:
+    """Gather per-file conversions under a concurrency-limiting semaphore."""
+    import asyncio
+    import os
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _convert_one(path: str) -> DataikuFlow:
+        async with semaphore:
+            code = await asyncio.to_thread(_read_source_file, path)
+            analysis = await analyzer.analyze_async(code)
+
+        flow_name = os.path.splitext(os.path.basename(path))[0]
+        flow = LLMFlowGenerator().generate(
+            analysis, flow_name=flow_name, optimize=optimize
+        )
+        if getattr(analysis, "usage", None) is not None:
+            flow.llm_usage = dict(analysis.usage)
+        flow.source_file = path
+        return flow
+
+    return list(await asyncio.gather(*(_convert_one(p) for p in paths)))
+
+
+# File extension -> visualization format for save_visualization()
+_EXT_TO_FORMAT = MappingProxyType({
+    "svg": "svg",
+    "html": "html",
+    "htm": "html",
+    "txt": "ascii",
+    "puml": "plantuml",
+    "plantuml": "plantuml",
+    "png": "png",
+    "pdf": "pdf",
+})
+
+
 class Py2Dataiku:
     """
     Main converter class with hybrid LLM + rule-based approach.
 
     This class provides a unified interface for converting Python code
     to Dataiku flows, with LLM as primary and rule-based as fallback.
+
+    Instances use ``__slots__`` (services often hold one converter per
+    tenant or request), so arbitrary attributes cannot be set on them.
+    Subclasses that need extra state should declare their own
+    ``__slots__`` or omit it to regain a ``__dict__``.
     """
 
+    __slots__ = (
+        "use_llm",
+        "provider",
+        "api_key",
+        "model",
+        "diagram_generator",
+        "_diagram_dispatch",
+        "analyzer",
+        "flow_generator",
+    )
+
     def __init__(
         self,
         provider: str = "anthropic",
@@ -537,6 +797,12 @@ class Py2Dataiku:
 
         # Initialize components
         self.diagram_generator = DiagramGenerator()
+        self._diagram_dispatch = {
+            "mermaid": self.diagram_generator.to_mermaid,
+            "graphviz": self.diagram_generator.to_graphviz,
+            "ascii": self.diagram_generator.to_ascii,
+            "plantuml": self.diagram_generator.to_plantuml,
+        }
 
         if use_llm:
             try:
@@ -547,6 +813,7 @@ class Py2Dataiku:
                 # ConfigurationError = missing API key (typed) or unknown provider.
                 # ValueError = legacy unhandled-key paths (kept for backward-compat).
                 # ImportError = optional dependency (anthropic / openai) not installed.
+                import warnings
                 warnings.warn(
                     f"Could not initialize LLM ({e}). Falling back to rule-based.",
                     stacklevel=2,
@@ -586,6 +853,46 @@ class Py2Dataiku:
                 transformations, flow_name=flow_name, optimize=optimize
             )
 
+    async def convert_async(
+        self,
+        code: str,
+        flow_name: str = "converted_flow",
+        optimize: bool = True,
+    ) -> DataikuFlow:
+        """
+        Convert Python code to a Dataiku flow without blocking the event loop.
+
+        In LLM mode the provider request is awaited via
+        :meth:`LLMCodeAnalyzer.analyze_async` and flow generation runs in a
+        worker thread. In rule-based mode the whole conversion runs in a
+        worker thread. Suited to asyncio servers, where many conversions can
+        be awaited together with ``asyncio.gather``::
+
+            flows = await asyncio.gather(
+                *(converter.convert_async(code) for code in sources)
+            )
+
+        Args:
+            code: Python source code
+            flow_name: Name for the generated flow
+            optimize: Whether to optimize the flow
+
+        Returns:
+            DataikuFlow object
+        """
+        import asyncio
+
+        if not self.use_llm:
+            return await asyncio.to_thread(self.convert, code, flow_name, optimize)
+
+        analysis = await self.analyzer.analyze_async(code)
+        return await asyncio.to_thread(
+            self.flow_generator.generate,
+            analysis,
+            flow_name=flow_name,
+            optimize=optimize,
+        )
+
     def analyze(self, code: str) -> AnalysisResult:
         """
         Analyze code without generating flow (LLM mode only).
@@ -611,16 +918,13 @@ class Py2Dataiku:
         Returns:
             Diagram string in specified format
         """
-        if format == "mermaid":
-            return self.diagram_generator.to_mermaid(flow)
-        elif format == "graphviz":
-            return self.diagram_generator.to_graphviz(flow)
-        elif format == "ascii":
-            return self.diagram_generator.to_ascii(flow)
-        elif format == "plantuml":
-            return self.diagram_generator.to_plantuml(flow)
-        else:
-            raise ValueError(f"Unknown format: {format}")
+        render = self._diagram_dispatch.get(format)
+        if render is None:
+            raise ValueError(
+                f"Unknown format: {format}. "
+                f"Expected one of: {', '.join(self._diagram_dispatch)}"
+            )
+        return render(flow)
 
     def visualize(self, flow: DataikuFlow, format: str = "svg", **kwargs) -> str:
         """
@@ -655,18 +959,8 @@ class Py2Dataiku:
         """
         if format is None:
             # Auto-detect from extension
-            ext = output_path.rsplit('.', 1)[-1].lower()
-            format_map = {
-                'svg': 'svg',
-                'html': 'html',
-                'htm': 'html',
-                'txt': 'ascii',
-                'puml': 'plantuml',
-                'plantuml': 'plantuml',
-                'png': 'png',
-                'pdf': 'pdf',
-            }
-            format = format_map.get(ext, 'svg')
+            ext = PurePath(output_path).suffix[1:].lower()
+            format = _EXT_TO_FORMAT.get(ext, 'svg')
 
         if format == 'png':
             flow.to_png(output_path)
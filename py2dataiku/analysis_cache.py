@@ -0,0 +1,128 @@
+"""Persistent on-disk cache of rule-based analysis results.
+
+Re-running the CLI on an unchanged script re-parses and re-walks the same
+source every time. This module stores the ``Transformation`` list produced
+by :class:`~py2dataiku.parser.ast_analyzer.CodeAnalyzer` under a key derived
+from the source text, the py2dataiku version and the Python version, so warm
+runs load the result instead of analyzing again.
+
+The cache lives in the ``analysis`` subdirectory of the py2dataiku cache
+root (see :func:`py2dataiku.config.cache_dir`). Entries are pickles; the
+directory is private to the user and is never shared. Any I/O or
+unpickling problem is treated as a cache miss.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from py2dataiku.config import cache_dir
+from py2dataiku.models.transformation import Transformation
+from py2dataiku.parser.ast_analyzer import CodeAnalyzer
+from py2dataiku.plugins.registry import PluginRegistry
+
+
+def default_cache_dir() -> Path:
+    """Return the directory used when no explicit cache directory is given."""
+    return cache_dir("analysis")
+
+
+def cache_key(source: str) -> str:
+    """
+    Return the cache key for ``source``.
+
+    The key covers the py2dataiku and Python versions as well as the source,
+    so upgrading either invalidates earlier entries.
+    """
+    from py2dataiku import __version__
+
+    magic = f"py2dataiku-{__version__}-py{sys.version_info[0]}.{sys.version_info[1]}\0"
+    return hashlib.sha256((magic + source).encode("utf-8")).hexdigest()
+
+
+def load_or_analyze(
+    source: str,
+    cache_dir: Optional[Path] = None,
+) -> tuple[list[Transformation], bool]:
+    """
+    Analyze ``source``, reusing a cached result when one exists.
+
+    Custom plugin method handlers can change the analysis, so the cache is
+    bypassed while any are registered. Sources that fail to parse are never
+    cached; the ``InvalidPythonCodeError`` propagates as usual.
+
+    Args:
+        source: Python source code
+        cache_dir: Cache directory (defaults to :func:`default_cache_dir`)
+
+    Returns:
+        Tuple of ``(transformations, hit)`` where ``hit`` is ``True`` when
+        the result came from the cache.
+    """
+    if PluginRegistry.has_method_handlers():
+        return CodeAnalyzer().analyze(source), False
+
+    key = cache_key(source)
+    path = (cache_dir or default_cache_dir()) / key[:2] / f"{key}.pkl"
+
+    # Entries used earlier in this process are kept as pickled bytes, so a
+    # driver running several commands on one script reads the disk once and
+    # every caller still gets its own copy.
+    blob = _recent.get(path)
+    if blob is None:
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+            transformations = pickle.loads(blob)
+        except Exception:
+            # Missing, truncated or written by an incompatible build.
+            blob = None
+        else:
+            _remember(path, blob)
+            return transformations, True
+    else:
+        return pickle.loads(blob), True
+
+    transformations = CodeAnalyzer().analyze(source)
+    try:
+        blob = pickle.dumps(transformations, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # A plugin left something unpicklable in the result; just skip caching.
+        return transformations, False
+    _remember(path, blob)
+    _store(path, blob)
+    return transformations, False
+
+
+_RECENT_LIMIT = 32
+_recent: dict[Path, bytes] = {}
+
+
+def _remember(path: Path, blob: bytes) -> None:
+    """Keep ``blob`` in the in-process layer, evicting the oldest entry."""
+    _recent.pop(path, None)
+    if len(_recent) >= _RECENT_LIMIT:
+        del _recent[next(iter(_recent))]
+    _recent[path] = blob
+
+
+def _store(path: Path, blob: bytes) -> None:
+    """Write ``blob`` to ``path`` atomically; failures are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except Exception:
+        # Caching is best-effort: a read-only or full disk must not fail the
+        # conversion.
+        pass
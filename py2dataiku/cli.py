@@ -11,18 +11,43 @@ Usage:
 """
 
 import argparse
+import copy
+import functools
 import os
 import sys
-from typing import Optional
+import threading
+from typing import Any, Optional
 
 from py2dataiku import (
     CodeAnalyzer,
     DataikuFlow,
-    __version__,
     convert,
 )
 
 
+class _VersionAction(argparse.Action):
+    """``--version`` that resolves the package version only when used.
+
+    ``argparse``'s built-in version action needs the string up front, which
+    would make every invocation pay for the ``importlib.metadata`` lookup.
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, help=None):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=argparse.SUPPRESS,
+            nargs=0,
+            help=help or "show program's version number and exit",
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from py2dataiku import __version__
+
+        parser._print_message(f"{parser.prog} {__version__}\n", sys.stdout)
+        parser.exit()
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser for the CLI."""
     parser = argparse.ArgumentParser(
@@ -32,8 +57,7 @@ def create_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"%(prog)s {__version__}",
+        action=_VersionAction,
     )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -90,6 +114,11 @@ def create_parser() -> argparse.ArgumentParser:
         help="Name for the generated flow",
         default="converted_flow",
     )
+    convert_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse analysis results and LLM responses cached on disk for unchanged input",
+    )
     convert_parser.add_argument(
         "-q", "--quiet",
         action="store_true",
@@ -145,6 +174,11 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable flow optimization",
     )
+    viz_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse analysis results and LLM responses cached on disk for unchanged input",
+    )
     viz_parser.add_argument(
         "-q", "--quiet",
         action="store_true",
@@ -188,6 +222,11 @@ def create_parser() -> argparse.ArgumentParser:
         help="API key (or use environment variable)",
         default=None,
     )
+    analyze_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse analysis results and LLM responses cached on disk for unchanged input",
+    )
     analyze_parser.add_argument(
         "-q", "--quiet",
         action="store_true",
@@ -245,6 +284,11 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable flow optimization",
     )
+    export_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse analysis results and LLM responses cached on disk for unchanged input",
+    )
     export_parser.add_argument(
         "-q", "--quiet",
         action="store_true",
@@ -257,13 +301,22 @@ def create_parser() -> argparse.ArgumentParser:
 def read_input(input_path: str) -> str:
     """Read input from file or stdin."""
     if input_path == "-":
-        return sys.stdin.read()
+        # Read raw bytes and decode once, like the file path below, instead
+        # of going through the text layer's incremental decoder. Replaced
+        # streams (e.g. StringIO in tests) have no buffer and are read as-is.
+        stdin_buffer = getattr(sys.stdin, "buffer", None)
+        if stdin_buffer is None:
+            return sys.stdin.read()
+        return stdin_buffer.read().decode("utf-8")
 
     if not os.path.exists(input_path):
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    with open(input_path, encoding="utf-8") as f:
-        return f.read()
+    # A 1 MiB buffer reads typical scripts in one syscall, and decoding the
+    # raw bytes skips universal-newline translation: ast.parse and the LLM
+    # prompt both accept CRLF as-is, matching convert_file()'s raw decode.
+    with open(input_path, "rb", buffering=1 << 20) as f:
+        return f.read().decode("utf-8")
 
 
 def write_output(content: str, output_path: Optional[str]) -> None:
@@ -289,28 +342,165 @@ def convert_code(
     model: Optional[str] = None,
     optimize: bool = True,
     flow_name: str = "converted_flow",
+    use_cache: bool = False,
+    quiet: bool = True,
 ) -> DataikuFlow:
-    """Convert Python code to a Dataiku flow."""
+    """Convert Python code to a Dataiku flow.
+
+    LLM conversions are memoized in-process (128 most recent inputs), so a
+    driver calling :func:`main` repeatedly on the same script pays for one
+    round-trip. Calls that pass ``api_key`` explicitly are never memoized.
+    Each caller receives its own copy of the flow; use
+    :func:`clear_caches` to drop the memo.
+
+    With ``use_cache`` the rule-based analysis is read from (and stored in)
+    the on-disk cache in :mod:`py2dataiku.analysis_cache`, and LLM
+    responses go through a file-backed :class:`~py2dataiku.llm.LLMCache`.
+    Cache hits and misses are logged unless ``quiet``.
+    """
     if use_llm:
         try:
-            from py2dataiku import convert_with_llm
-            return convert_with_llm(
-                code,
-                provider=provider,
-                api_key=api_key,
-                model=model,
-                optimize=optimize,
-                flow_name=flow_name,
-            )
+            if api_key is not None:
+                flow, stats = _convert_with_llm(
+                    code, provider, api_key, model, optimize, flow_name, use_cache
+                )
+            else:
+                memo_hits = _convert_with_llm_cached.cache_info().hits
+                flow, stats = _convert_with_llm_cached(
+                    code, provider, model, optimize, flow_name, use_cache
+                )
+                flow = copy.deepcopy(flow)
+                if _convert_with_llm_cached.cache_info().hits > memo_hits:
+                    # Answered from the memo: no LLM cache lookups this call.
+                    stats = {"hits": 0, "misses": 0} if use_cache else None
+            if stats is not None:
+                _log_llm_cache(stats, quiet)
+            return flow
         except ImportError as e:
             raise ImportError(
                 f"LLM dependencies not installed. Install with: pip install py-iku[llm]\n"
                 f"Error: {e}"
             ) from e
+    elif use_cache:
+        from py2dataiku.generators.flow_generator import FlowGenerator
+
+        transformations = _analyze_source(code, use_cache, quiet)
+        return FlowGenerator().generate(transformations, optimize=optimize)
     else:
         return convert(code, optimize=optimize)
 
 
+def _analyze_source(code: str, use_cache: bool, quiet: bool) -> list:
+    """Rule-based analysis shared by every command.
+
+    With ``use_cache`` the result comes from :mod:`py2dataiku.analysis_cache`,
+    so ``convert``, ``visualize``, ``analyze`` and ``export`` on the same
+    source analyze it once between them.
+    """
+    if not use_cache:
+        return _get_code_analyzer(CodeAnalyzer, threading.get_ident()).analyze(code)
+
+    from py2dataiku.analysis_cache import load_or_analyze
+
+    transformations, hit = load_or_analyze(code)
+    log(f"Analysis cache {'hit' if hit else 'miss'}", quiet)
+    return transformations
+
+
+@functools.lru_cache(maxsize=4)
+def _get_code_analyzer(analyzer_cls: type[CodeAnalyzer], thread_id: int) -> CodeAnalyzer:
+    """Return a reusable analyzer for the calling thread.
+
+    ``CodeAnalyzer.analyze`` resets its state on every call, so one instance
+    can serve repeated calls but not concurrent ones; keying on the thread
+    keeps instances unshared. Keying on the class means a substituted
+    ``CodeAnalyzer`` (as in tests) gets its own instance.
+    """
+    return analyzer_cls()
+
+
+@functools.lru_cache(maxsize=4)
+def _llm_analyzer_slot(provider_name: str, key_digest: str) -> dict[str, Any]:
+    """Return the slot holding the LLM analyzer for a provider and key digest.
+
+    The slot starts empty and :func:`_get_llm_analyzer` fills it, so the
+    cache is keyed on the digest alone and never holds the key itself.
+    """
+    return {}
+
+
+def _get_llm_analyzer(provider_name: str, api_key: Optional[str]):
+    """Return a reusable LLM analyzer for ``provider_name`` and ``api_key``.
+
+    Building a provider creates its API client, so analyzers are kept per
+    provider and key. Keys are looked up by SHA-256 digest, never in the clear.
+    """
+    import hashlib
+
+    digest = "" if api_key is None else hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+    slot = _llm_analyzer_slot(provider_name, digest)
+    if "analyzer" not in slot:
+        from py2dataiku import LLMCodeAnalyzer, get_provider
+
+        slot["analyzer"] = LLMCodeAnalyzer(provider=get_provider(provider_name, api_key))
+    return slot["analyzer"]
+
+
+def _convert_with_llm(
+    code: str,
+    provider: str,
+    api_key: Optional[str],
+    model: Optional[str],
+    optimize: bool,
+    flow_name: str,
+    use_cache: bool = False,
+) -> tuple[DataikuFlow, Optional[dict[str, int]]]:
+    """Convert with an LLM; also return the LLM cache stats when ``use_cache``."""
+    from py2dataiku import convert_with_llm
+
+    kwargs = {}
+    if use_cache:
+        kwargs["cache"] = _file_llm_cache()
+    flow = convert_with_llm(
+        code,
+        provider=provider,
+        api_key=api_key,
+        model=model,
+        optimize=optimize,
+        flow_name=flow_name,
+        **kwargs,
+    )
+    return flow, kwargs["cache"].stats if use_cache else None
+
+
+@functools.lru_cache(maxsize=128)
+def _convert_with_llm_cached(
+    code: str,
+    provider: str,
+    model: Optional[str],
+    optimize: bool,
+    flow_name: str,
+    use_cache: bool = False,
+) -> tuple[DataikuFlow, Optional[dict[str, int]]]:
+    return _convert_with_llm(code, provider, None, model, optimize, flow_name, use_cache)
+
+
+def _file_llm_cache():
+    """Return an LLM response cache backed by the user cache directory."""
+    from py2dataiku.llm.cache import FileCacheBackend, LLMCache
+    return LLMCache(FileCacheBackend())
+
+
+def _log_llm_cache(stats: dict[str, int], quiet: bool) -> None:
+    log(f"LLM cache: {stats['hits']} hit(s), {stats['misses']} miss(es)", quiet)
+
+
+def clear_caches() -> None:
+    """Drop the in-process memo of LLM conversions and the reused LLM analyzers."""
+    _convert_with_llm_cached.cache_clear()
+    _llm_analyzer_slot.cache_clear()
+
+
 def format_flow(flow: DataikuFlow, fmt: str) -> str:
     """Format a flow for output."""
     if fmt == "json":
@@ -318,8 +508,8 @@ def format_flow(flow: DataikuFlow, fmt: str) -> str:
     elif fmt == "yaml":
         return flow.to_yaml()
     elif fmt == "dict":
-        import json
-        return json.dumps(flow.to_dict(), indent=2)
+        from py2dataiku.utils.serialization import dumps_json
+        return dumps_json(flow.to_dict())
     elif fmt == "summary":
         return flow.get_summary()
     else:
@@ -341,6 +531,8 @@ def cmd_convert(args: argparse.Namespace) -> int:
             model=args.model,
             optimize=not args.no_optimize,
             flow_name=args.name,
+            use_cache=args.cache,
+            quiet=args.quiet,
         )
 
         log(f"Generated flow with {len(flow.recipes)} recipes", args.quiet)
@@ -380,6 +572,8 @@ def cmd_visualize(args: argparse.Namespace) -> int:
             provider=args.provider,
             api_key=args.api_key,
             optimize=not args.no_optimize,
+            use_cache=args.cache,
+            quiet=args.quiet,
         )
 
         log(f"Generating {args.format} visualization...", args.quiet)
@@ -425,19 +619,25 @@ def cmd_analyze(args: argparse.Namespace) -> int:
 
         if args.llm:
             try:
-                from py2dataiku import LLMCodeAnalyzer, get_provider
-                provider = get_provider(args.provider, args.api_key)
-                analyzer = LLMCodeAnalyzer(provider=provider)
+                analyzer = _get_llm_analyzer(args.provider, args.api_key)
+                llm_cache = _file_llm_cache() if args.cache else None
+                if llm_cache is not None:
+                    from py2dataiku import LLMCodeAnalyzer
+                    analyzer = LLMCodeAnalyzer(
+                        provider=llm_cache.wrap(analyzer.provider)
+                    )
                 result = analyzer.analyze(code)
+                if llm_cache is not None:
+                    _log_llm_cache(llm_cache.stats, args.quiet)
 
                 if args.format == "text":
                     output = format_llm_analysis(result)
                 elif args.format == "json":
-                    import json
-                    output = json.dumps(result.to_dict(), indent=2)
+                    from py2dataiku.utils.serialization import dumps_json
+                    output = dumps_json(result.to_dict())
                 elif args.format == "yaml":
-                    import yaml
-                    output = yaml.dump(result.to_dict(), default_flow_style=False)
+                    from py2dataiku.utils.serialization import dumps_yaml
+                    output = dumps_yaml(result.to_dict())
                 else:
                     raise ValueError(f"Unknown format: {args.format}")
 
@@ -445,23 +645,16 @@ def cmd_analyze(args: argparse.Namespace) -> int:
                 print(f"LLM dependencies not installed. Error: {e}", file=sys.stderr)
                 return 1
         else:
-            analyzer = CodeAnalyzer()
-            transformations = analyzer.analyze(code)
+            transformations = _analyze_source(code, args.cache, args.quiet)
 
             if args.format == "text":
                 output = format_transformations(transformations)
             elif args.format == "json":
-                import json
-                output = json.dumps(
-                    [t.to_dict() for t in transformations],
-                    indent=2
-                )
+                from py2dataiku.utils.serialization import dumps_json
+                output = dumps_json([t.to_dict() for t in transformations])
             elif args.format == "yaml":
-                import yaml
-                output = yaml.dump(
-                    [t.to_dict() for t in transformations],
-                    default_flow_style=False
-                )
+                from py2dataiku.utils.serialization import dumps_yaml
+                output = dumps_yaml([t.to_dict() for t in transformations])
             else:
                 raise ValueError(f"Unknown format: {args.format}")
 
@@ -487,66 +680,65 @@ def format_transformations(transformations) -> str:
     """Format transformations for text output."""
     if not transformations:
         return "No transformations detected."
+    return "\n".join(_transformation_lines(transformations))
+
 
-    lines = [
-        f"Detected {len(transformations)} transformation(s):",
-        "",
-    ]
+def _transformation_lines(transformations):
+    """Yield the lines of :func:`format_transformations`' report."""
+    yield f"Detected {len(transformations)} transformation(s):"
+    yield ""
 
     for i, t in enumerate(transformations, 1):
-        lines.append(f"{i}. {t.transformation_type.value}")
+        yield f"{i}. {t.transformation_type.value}"
         if t.source_dataframe:
-            lines.append(f"   Source: {t.source_dataframe}")
+            yield f"   Source: {t.source_dataframe}"
         if t.target_dataframe:
-            lines.append(f"   Target: {t.target_dataframe}")
+            yield f"   Target: {t.target_dataframe}"
         if t.columns:
-            lines.append(f"   Columns: {', '.join(t.columns)}")
+            yield f"   Columns: {', '.join(t.columns)}"
         if t.suggested_recipe:
-            lines.append(f"   Suggested Recipe: {t.suggested_recipe}")
+            yield f"   Suggested Recipe: {t.suggested_recipe}"
         if t.suggested_processor:
-            lines.append(f"   Suggested Processor: {t.suggested_processor}")
+            yield f"   Suggested Processor: {t.suggested_processor}"
         if t.source_line:
-            lines.append(f"   Line: {t.source_line}")
+            yield f"   Line: {t.source_line}"
         if t.notes:
             for note in t.notes:
-                lines.append(f"   Note: {note}")
-        lines.append("")
-
-    return "\n".join(lines)
+                yield f"   Note: {note}"
+        yield ""
 
 
 def format_llm_analysis(result) -> str:
     """Format LLM analysis result for text output."""
-    lines = [
-        "LLM Analysis Result",
-        "=" * 50,
-        "",
-    ]
+    return "\n".join(_llm_analysis_lines(result))
+
+
+def _llm_analysis_lines(result):
+    """Yield the lines of :func:`format_llm_analysis`' report."""
+    yield "LLM Analysis Result"
+    yield "=" * 50
+    yield ""
 
     if hasattr(result, 'summary') and result.summary:
-        lines.extend([
-            "Summary:",
-            result.summary,
-            "",
-        ])
+        yield "Summary:"
+        yield result.summary
+        yield ""
 
     if hasattr(result, 'steps') and result.steps:
-        lines.append(f"Detected {len(result.steps)} step(s):")
-        lines.append("")
+        yield f"Detected {len(result.steps)} step(s):"
+        yield ""
 
         for i, step in enumerate(result.steps, 1):
-            lines.append(f"{i}. {step.operation.value if hasattr(step.operation, 'value') else step.operation}")
+            yield f"{i}. {step.operation.value if hasattr(step.operation, 'value') else step.operation}"
             if hasattr(step, 'description') and step.description:
-                lines.append(f"   Description: {step.description}")
+                yield f"   Description: {step.description}"
             if hasattr(step, 'inputs') and step.inputs:
-                lines.append(f"   Inputs: {', '.join(step.inputs)}")
+                yield f"   Inputs: {', '.join(step.inputs)}"
             if hasattr(step, 'outputs') and step.outputs:
-                lines.append(f"   Outputs: {', '.join(step.outputs)}")
+                yield f"   Outputs: {', '.join(step.outputs)}"
             if hasattr(step, 'recipe_type') and step.recipe_type:
-                lines.append(f"   Recipe Type: {step.recipe_type}")
-            lines.append("")
-
-    return "\n".join(lines)
+                yield f"   Recipe Type: {step.recipe_type}"
+            yield ""
 
 
 def cmd_export(args: argparse.Namespace) -> int:
@@ -562,6 +754,8 @@ def cmd_export(args: argparse.Namespace) -> int:
             provider=args.provider,
             api_key=args.api_key,
             optimize=not args.no_optimize,
+            use_cache=args.cache,
+            quiet=args.quiet,
         )
 
         log("Exporting to DSS project format...", args.quiet)
@@ -597,12 +791,23 @@ def cmd_export(args: argparse.Namespace) -> int:
         return 1
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_parser() -> argparse.ArgumentParser:
+    """Parser reused by :func:`main` across calls.
+
+    ``parse_args`` does not modify the parser, so one instance serves every
+    invocation in a process. :func:`create_parser` still returns a fresh
+    parser for callers that want to customise it.
+    """
+    return create_parser()
+
+
 def main(argv=None) -> int:
     """Main entry point for the CLI."""
     import os
     import sys as _sys
 
-    parser = create_parser()
+    parser = _shared_parser()
 
     # Convenience: ``py2dataiku script.py [flags]`` with no subcommand
     # is a shorthand for ``py2dataiku convert script.py [flags]``.
@@ -1,8 +1,10 @@
 """Configuration file support for py2dataiku."""
 
 import os
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any, Optional
 
 try:
@@ -13,14 +15,13 @@ except ModuleNotFoundError:
     except ModuleNotFoundError:
         tomllib = None  # type: ignore[assignment]
 
-import yaml
-
 CONFIG_FILE_NAMES = [
     "py2dataiku.toml",
     ".py2dataikurc",
     ".py2dataiku.yaml",
     ".py2dataiku.yml",
 ]
+_CONFIG_FILE_NAME_SET = frozenset(CONFIG_FILE_NAMES)
 
 
 @dataclass
@@ -55,6 +56,9 @@ class Py2DataikuConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
+        # A fresh literal is the cheapest way to build this in CPython: a
+        # cached template would need copying every call so callers can't
+        # mutate it, and even a shallow per-section copy is slower.
         return {
             "provider": {
                 "default": self.default_provider,
@@ -118,8 +122,27 @@ def _load_toml(path: Path) -> dict[str, Any]:
 
 def _load_yaml(path: Path) -> dict[str, Any]:
     """Load a YAML config file."""
+    from py2dataiku.utils.serialization import load_yaml
+
     with open(path, encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        return load_yaml(f) or {}
+
+
+def cache_dir(name: str) -> Path:
+    """
+    Return the per-user cache directory for ``name`` (e.g. ``"analysis"``).
+
+    The root is ``$PY2DATAIKU_CACHE_DIR`` when set, otherwise
+    ``$XDG_CACHE_HOME/py2dataiku`` (``~/.cache/py2dataiku`` by default).
+    The directory is not created here.
+    """
+    root = os.environ.get("PY2DATAIKU_CACHE_DIR")
+    if not root:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        root = os.path.join(base, "py2dataiku")
+    return Path(root) / name
 
 
 def find_config_file(
@@ -141,13 +164,54 @@ def find_config_file(
     search_dirs.append(Path.home())
 
     for directory in search_dirs:
-        for name in CONFIG_FILE_NAMES:
-            path = directory / name
-            if path.is_file():
-                return path
+        path = _config_file_in(directory)
+        if path is not None:
+            return path
     return None
 
 
+def _config_file_in(directory: Path) -> Optional[Path]:
+    """
+    Return the highest-priority config file in ``directory``, or None.
+
+    The directory is listed once with ``os.scandir`` rather than probing
+    each candidate name. The result is remembered against the directory's
+    mtime, which changes whenever an entry is added or removed, so repeated
+    lookups in one process cost a single ``stat``.
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _DIR_CACHE.get(directory)
+    if cached is not None and cached[0] == mtime:
+        name = cached[1]
+    else:
+        try:
+            with os.scandir(directory) as entries:
+                found = {
+                    entry.name
+                    for entry in entries
+                    if entry.name in _CONFIG_FILE_NAME_SET and entry.is_file()
+                }
+        except OSError:
+            found = set()
+        name = next((n for n in CONFIG_FILE_NAMES if n in found), None)
+        # Timestamps are coarse, so a directory changed within the last
+        # second could change again without its mtime moving; don't trust
+        # the listing until it has settled.
+        if time.time_ns() - mtime > _SETTLE_NS:
+            _DIR_CACHE[directory] = (mtime, name)
+
+    return directory / name if name is not None else None
+
+
+# Config file discovered per directory: directory -> (mtime_ns, name or None).
+_SETTLE_NS = 1_000_000_000
+_DIR_CACHE: dict[Path, tuple[int, Optional[str]]] = {}
+
+
 def load_config(
     config_path: Optional[str] = None,
     auto_discover: bool = True,
@@ -161,6 +225,9 @@ def load_config(
 
     Returns:
         Py2DataikuConfig with loaded settings, or defaults if no file found.
+
+    Raises:
+        FileNotFoundError: If ``config_path`` is given but is not a file.
     """
     if config_path:
         path = Path(config_path)
@@ -172,26 +239,71 @@ def load_config(
     if path is None:
         return Py2DataikuConfig()
 
-    if not path.exists():
+    # One stat serves both the existence check and the parse cache below;
+    # find_config_file has already checked that a discovered path is a file.
+    try:
+        st = path.stat()
+    except OSError:
+        st = None
+    if st is None or not S_ISREG(st.st_mode):
+        if config_path:
+            raise FileNotFoundError(f"Config file not found: {config_path}")
         return Py2DataikuConfig()
 
-    suffix = path.suffix.lower()
-    name = path.name.lower()
-
-    if suffix == ".toml" or name == ".py2dataikurc":
-        data = _load_toml(path)
-    elif suffix in (".yaml", ".yml"):
-        data = _load_yaml(path)
+    # Parsed file contents are reused until the file's mtime or size
+    # changes; the config object itself is rebuilt on every call so callers
+    # can mutate it and environment overrides are always current.
+    cache_key = path.absolute()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        data = cached[1]
     else:
-        return Py2DataikuConfig()
+        suffix = path.suffix.lower()
+        name = path.name.lower()
+
+        if suffix == ".toml" or name == ".py2dataikurc":
+            data = _load_toml(path)
+        elif suffix in (".yaml", ".yml"):
+            data = _load_yaml(path)
+        else:
+            return Py2DataikuConfig()
+        _CONFIG_CACHE[cache_key] = (stamp, data)
 
     # Allow environment variable overrides
     config = Py2DataikuConfig.from_dict(data)
-    env_provider = os.environ.get("PY2DATAIKU_PROVIDER")
-    if env_provider:
-        config.default_provider = env_provider
-    env_key = os.environ.get("PY2DATAIKU_PROJECT_KEY")
-    if env_key:
-        config.project_key = env_key
+    for field_name, value in _env_overrides().items():
+        setattr(config, field_name, value)
 
     return config
+
+
+# Environment variables that override config fields: variable -> field.
+_ENV_FIELDS = {
+    "PY2DATAIKU_PROVIDER": "default_provider",
+    "PY2DATAIKU_PROJECT_KEY": "project_key",
+}
+
+
+def _env_overrides() -> dict[str, str]:
+    """
+    Return ``{field: value}`` for every override variable that is set.
+
+    Read on each call rather than snapshotted, so changes to ``os.environ``
+    made after import (by tests or embedding applications) take effect.
+    """
+    environ = os.environ
+    return {
+        field_name: environ[var]
+        for var, field_name in _ENV_FIELDS.items()
+        if environ.get(var)
+    }
+
+
+# Parsed config files keyed by absolute path: ((mtime_ns, size), data).
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+def clear_config_cache() -> None:
+    """Forget parsed config files so the next ``load_config`` re-reads them."""
+    _CONFIG_CACHE.clear()
@@ -1 +1,36 @@
-"""Example scripts for py2dataiku."""
+"""Example scripts for py2dataiku.
+
+Each collection lives in its own submodule and is only imported when it is
+first accessed, so ``from py2dataiku.examples import BASIC_EXAMPLES`` does
+not load the other (much larger) example modules.
+"""
+
+import importlib
+
+# Collection name -> submodule defining it.
+_COLLECTIONS = {
+    "BASIC_EXAMPLES": "basic_pipelines",
+    "INTERMEDIATE_EXAMPLES": "intermediate_pipelines",
+    "ADVANCED_EXAMPLES": "advanced_pipelines",
+    "COMPLEX_EXAMPLES": "complex_pipelines",
+    "COMBINATION_EXAMPLES": "combination_examples",
+    "PROCESSOR_EXAMPLES": "processor_examples",
+    "RECIPE_EXAMPLES": "recipe_examples",
+    "SETTINGS_EXAMPLES": "settings_examples",
+}
+
+__all__ = list(_COLLECTIONS)
+
+
+def __getattr__(name: str):
+    """Import the submodule holding ``name`` on first access (PEP 562)."""
+    module_name = _COLLECTIONS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
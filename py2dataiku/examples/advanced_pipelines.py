@@ -10,74 +10,68 @@ ECOMMERCE_ANALYTICS = """
 import pandas as pd
 import numpy as np
 
-# Load all data sources
-customers = pd.read_csv('customers.csv')
-orders = pd.read_csv('orders.csv')
-order_items = pd.read_csv('order_items.csv')
-products = pd.read_csv('products.csv')
-categories = pd.read_csv('categories.csv')
-
-# Clean customer data
-customers['email'] = customers['email'].str.lower().str.strip()
+# Load all data sources, reading only the columns the pipeline uses
+# (Parquet stores timestamps typed, so dates need no to_datetime re-parse)
+customers = pd.read_parquet(
+    'customers.parquet',
+    columns=['customer_id', 'name', 'email', 'signup_date', 'region']
+)
+orders = pd.read_parquet('orders.parquet')
+order_items = pd.read_parquet(
+    'order_items.parquet',
+    columns=['order_id', 'product_id', 'quantity', 'unit_price']
+)
+products = pd.read_parquet(
+    'products.parquet',
+    columns=['product_id', 'product_name', 'category_id', 'unit_cost']
+)
+categories = pd.read_parquet(
+    'categories.parquet',
+    columns=['category_id', 'category_name']
+)
+
+# Low-cardinality labels as categoricals: integer codes instead of Python strings
+customers['region'] = customers['region'].astype('category')
+categories['category_name'] = categories['category_name'].astype('category')
+
+# Clean customer data; emails as Arrow-backed strings so the string ops
+# and the dedup below run over Arrow buffers, not Python str objects
+customers['email'] = customers['email'].astype('string[pyarrow]').str.lower().str.strip()
 customers['name'] = customers['name'].str.strip().str.title()
 customers = customers.drop_duplicates(subset=['email'])
 
 # Join order items with products
-items_with_products = pd.merge(
-    order_items,
-    products[['product_id', 'product_name', 'category_id', 'unit_cost']],
-    on='product_id',
-    how='left'
-)
+items_with_products = pd.merge(order_items, products, on='product_id', how='left')
 
 # Add category info
-items_enriched = pd.merge(
-    items_with_products,
-    categories[['category_id', 'category_name']],
-    on='category_id',
-    how='left'
-)
+items_enriched = pd.merge(items_with_products, categories, on='category_id', how='left')
 
 # Calculate item metrics
 items_enriched['line_total'] = items_enriched['quantity'] * items_enriched['unit_price']
 items_enriched['profit'] = items_enriched['line_total'] - (items_enriched['quantity'] * items_enriched['unit_cost'])
 
-# Aggregate to order level
-order_summary = items_enriched.groupby('order_id').agg({
-    'line_total': 'sum',
-    'profit': 'sum',
-    'quantity': 'sum',
-    'product_id': 'nunique'
-}).reset_index()
-
-order_summary.columns = ['order_id', 'order_total', 'order_profit', 'total_items', 'unique_products']
+# Aggregate to order level (named aggregation: one pass, no column rename)
+order_summary = items_enriched.groupby('order_id', as_index=False, sort=False).agg(
+    order_total=('line_total', 'sum'),
+    order_profit=('profit', 'sum'),
+    total_items=('quantity', 'sum'),
+    unique_products=('product_id', 'nunique'),
+)
 
 # Join with orders
 orders_complete = pd.merge(orders, order_summary, on='order_id', how='left')
 
-# Parse dates
-orders_complete['order_date'] = pd.to_datetime(orders_complete['order_date'])
-
 # Join with customers
-customer_orders = pd.merge(
-    orders_complete,
-    customers[['customer_id', 'name', 'email', 'signup_date', 'region']],
-    on='customer_id',
-    how='left'
-)
+customer_orders = pd.merge(orders_complete, customers, on='customer_id', how='left')
 
 # Calculate customer lifetime metrics
-customer_lifetime = customer_orders.groupby('customer_id').agg({
-    'order_id': 'count',
-    'order_total': 'sum',
-    'order_profit': 'sum',
-    'order_date': ['min', 'max']
-}).reset_index()
-
-customer_lifetime.columns = [
-    'customer_id', 'total_orders', 'lifetime_value',
-    'lifetime_profit', 'first_order', 'last_order'
-]
+customer_lifetime = customer_orders.groupby('customer_id', as_index=False, sort=False).agg(
+    total_orders=('order_id', 'count'),
+    lifetime_value=('order_total', 'sum'),
+    lifetime_profit=('order_profit', 'sum'),
+    first_order=('order_date', 'min'),
+    last_order=('order_date', 'max'),
+)
 
 # Calculate days since last order
 customer_lifetime['days_since_last_order'] = (
@@ -92,8 +86,15 @@ customer_lifetime['value_segment'] = pd.cut(
 )
 
 # Save all outputs
-customer_orders.to_csv('customer_orders_enriched.csv', index=False)
-customer_lifetime.to_csv('customer_lifetime_metrics.csv', index=False)
+# Row-level output: write in 64k-row groups so the encoder works one
+# bounded batch at a time and readers can skip groups by statistics
+customer_orders.to_parquet(
+    'customer_orders_enriched.parquet',
+    compression='zstd',
+    index=False,
+    row_group_size=64_000
+)
+customer_lifetime.to_parquet('customer_lifetime_metrics.parquet', compression='zstd', index=False)
 """
 
 # Example 2: Financial Transaction Processing
@@ -102,70 +103,73 @@ import pandas as pd
 import numpy as np
 
 # Load data
-transactions = pd.read_csv('transactions.csv')
-accounts = pd.read_csv('accounts.csv')
-merchants = pd.read_csv('merchants.csv')
-fraud_labels = pd.read_csv('fraud_labels.csv')
+transactions = pd.read_parquet('transactions.parquet')
+accounts = pd.read_parquet(
+    'accounts.parquet',
+    columns=['account_id', 'account_type', 'credit_limit', 'customer_id', 'open_date']
+)
+merchants = pd.read_parquet(
+    'merchants.parquet',
+    columns=['merchant_id', 'merchant_category', 'merchant_country', 'risk_score']
+)
+fraud_labels = pd.read_parquet(
+    'fraud_labels.parquet',
+    columns=['transaction_id', 'is_fraud']
+)
 
-# Parse transaction timestamps
-transactions['transaction_time'] = pd.to_datetime(transactions['transaction_time'])
+accounts['account_type'] = accounts['account_type'].astype('category')
+merchants = merchants.astype({'merchant_category': 'category', 'merchant_country': 'category'})
 
 # Clean and validate
 transactions = transactions.dropna(subset=['account_id', 'amount'])
 transactions['amount'] = transactions['amount'].abs()  # Ensure positive amounts
+# amount feeds per-row statistics (mean, std, z-score), never running totals,
+# so float32's ~7 significant digits suffice and the two joins and the window
+# columns below move half the bytes
+transactions['amount'] = transactions['amount'].astype('float32')
 
-# Add time features
+# Add time features (boolean flags are one byte per row, like int8)
 transactions['hour'] = transactions['transaction_time'].dt.hour
 transactions['day_of_week'] = transactions['transaction_time'].dt.dayofweek
-transactions['is_weekend'] = transactions['day_of_week'].isin([5, 6]).astype(int)
-transactions['is_night'] = transactions['hour'].between(22, 6).astype(int)
-
-# Join with account info
-transactions_enriched = pd.merge(
-    transactions,
-    accounts[['account_id', 'account_type', 'credit_limit', 'customer_id', 'open_date']],
-    on='account_id',
-    how='left'
-)
-
-# Join with merchant info
-transactions_enriched = pd.merge(
-    transactions_enriched,
-    merchants[['merchant_id', 'merchant_category', 'merchant_country', 'risk_score']],
-    on='merchant_id',
-    how='left'
+transactions.eval(
+    'is_weekend = day_of_week >= 5\\n'
+    'is_night = (hour >= 22) | (hour < 6)',
+    inplace=True
 )
 
-# Calculate account-level aggregates
-account_stats = transactions_enriched.groupby('account_id').agg({
-    'amount': ['mean', 'std', 'max', 'count'],
-    'merchant_id': 'nunique'
-}).reset_index()
-account_stats.columns = ['account_id', 'avg_amount', 'std_amount', 'max_amount',
-                         'transaction_count', 'unique_merchants']
-
-# Join stats back
-transactions_enriched = pd.merge(
-    transactions_enriched,
-    account_stats,
-    on='account_id',
-    how='left'
+# Index the lookup tables by their keys: join() then probes the existing
+# index instead of building a hash table for both sides of every merge
+accounts = accounts.set_index('account_id')
+merchants = merchants.set_index('merchant_id')
+
+# Join with account and merchant info
+transactions_enriched = transactions.join(accounts, on='account_id')
+transactions_enriched = transactions_enriched.join(merchants, on='merchant_id')
+
+# Per-account baseline as window columns: transform() broadcasts each
+# account's statistics onto its own rows, so no aggregate frame has to be
+# built and joined back onto every transaction
+transactions_enriched['avg_amount'] = transactions_enriched.groupby('account_id')['amount'].transform('mean')
+transactions_enriched['std_amount'] = transactions_enriched.groupby('account_id')['amount'].transform('std')
+transactions_enriched['max_amount'] = transactions_enriched.groupby('account_id')['amount'].transform('max')
+transactions_enriched['transaction_count'] = transactions_enriched.groupby('account_id')['amount'].transform('count')
+transactions_enriched['unique_merchants'] = transactions_enriched.groupby('account_id')['merchant_id'].transform('nunique')
+transactions_enriched['zscore_scale'] = transactions_enriched['std_amount'].replace(0, 1)
+
+# Calculate deviation from normal and flag suspicious transactions in one
+# fused pass (numexpr, when installed) instead of a temporary per operator
+transactions_enriched.eval(
+    'amount_zscore = (amount - avg_amount) / zscore_scale\\n'
+    'high_amount_flag = amount_zscore > 3',
+    inplace=True
 )
-
-# Calculate deviation from normal
-transactions_enriched['amount_zscore'] = (
-    (transactions_enriched['amount'] - transactions_enriched['avg_amount']) /
-    transactions_enriched['std_amount'].replace(0, 1)
-)
-
-# Flag suspicious transactions
-transactions_enriched['high_amount_flag'] = (transactions_enriched['amount_zscore'] > 3).astype(int)
+transactions_enriched = transactions_enriched.drop(columns='zscore_scale')
 transactions_enriched['new_merchant_flag'] = 0  # Would need historical data
 
 # Join with fraud labels for training
 labeled_transactions = pd.merge(
     transactions_enriched,
-    fraud_labels[['transaction_id', 'is_fraud']],
+    fraud_labels,
     on='transaction_id',
     how='left'
 )
@@ -173,9 +177,23 @@ labeled_transactions = pd.merge(
 # Fill unlabeled as not fraud
 labeled_transactions['is_fraud'] = labeled_transactions['is_fraud'].fillna(0)
 
+# Account-level summary for reporting, keeping account_id as the index
+account_stats = transactions_enriched.groupby('account_id').agg(
+    avg_amount=('amount', 'mean'),
+    std_amount=('amount', 'std'),
+    max_amount=('amount', 'max'),
+    transaction_count=('amount', 'count'),
+    unique_merchants=('merchant_id', 'nunique'),
+)
+
 # Save outputs
-labeled_transactions.to_csv('transactions_processed.csv', index=False)
-account_stats.to_csv('account_statistics.csv', index=False)
+labeled_transactions.to_parquet(
+    'transactions_processed.parquet',
+    compression='zstd',
+    index=False,
+    row_group_size=64_000
+)
+account_stats.to_parquet('account_statistics.parquet', compression='zstd')
 """
 
 # Example 3: Supply Chain Inventory Pipeline
@@ -184,24 +202,37 @@ import pandas as pd
 import numpy as np
 
 # Load data sources
-inventory = pd.read_csv('inventory.csv')
-sales_history = pd.read_csv('sales_history.csv')
-suppliers = pd.read_csv('suppliers.csv')
-warehouses = pd.read_csv('warehouses.csv')
-purchase_orders = pd.read_csv('purchase_orders.csv')
+inventory = pd.read_parquet('inventory.parquet')
+
+# Sales velocity only needs the last 30 days: hand the cutoff and the
+# columns to the Parquet reader so it skips row groups whose sale_date
+# statistics fall outside the window and never decodes other columns
+cutoff = pd.Timestamp.now() - pd.Timedelta(days=30)
+sales_history = pd.read_parquet(
+    'sales_history.parquet',
+    columns=['sku', 'warehouse_id', 'sale_date', 'quantity_sold'],
+    filters=[('sale_date', '>=', cutoff)]
+)
+suppliers = pd.read_parquet(
+    'suppliers.parquet',
+    columns=['supplier_id', 'supplier_name', 'lead_time_days', 'reliability_score']
+)
+warehouses = pd.read_parquet(
+    'warehouses.parquet',
+    columns=['warehouse_id', 'warehouse_name', 'region', 'capacity']
+)
+purchase_orders = pd.read_parquet('purchase_orders.parquet')
+warehouses['region'] = warehouses['region'].astype('category')
 
 # Clean data
 inventory = inventory.dropna(subset=['sku', 'warehouse_id'])
-sales_history['sale_date'] = pd.to_datetime(sales_history['sale_date'])
 
 # Calculate sales velocity (daily average over last 30 days)
-recent_sales = sales_history[
-    sales_history['sale_date'] >= (pd.Timestamp.now() - pd.Timedelta(days=30))
-]
-
-sales_velocity = recent_sales.groupby(['sku', 'warehouse_id']).agg({
+sales_velocity = sales_history.groupby(
+    ['sku', 'warehouse_id'], as_index=False, sort=False
+).agg({
     'quantity_sold': 'sum'
-}).reset_index()
+})
 sales_velocity['daily_velocity'] = sales_velocity['quantity_sold'] / 30
 
 # Join inventory with velocity
@@ -223,7 +254,7 @@ inventory_enriched['days_of_supply'] = np.where(
 # Join with warehouse info
 inventory_enriched = pd.merge(
     inventory_enriched,
-    warehouses[['warehouse_id', 'warehouse_name', 'region', 'capacity']],
+    warehouses,
     on='warehouse_id',
     how='left'
 )
@@ -231,7 +262,7 @@ inventory_enriched = pd.merge(
 # Join with supplier info
 inventory_enriched = pd.merge(
     inventory_enriched,
-    suppliers[['supplier_id', 'supplier_name', 'lead_time_days', 'reliability_score']],
+    suppliers,
     left_on='primary_supplier_id',
     right_on='supplier_id',
     how='left'
@@ -240,11 +271,11 @@ inventory_enriched = pd.merge(
 # Calculate reorder flags
 inventory_enriched['needs_reorder'] = (
     inventory_enriched['days_of_supply'] < inventory_enriched['lead_time_days'] * 1.5
-).astype(int)
+).astype('int8')
 
 inventory_enriched['critical_low'] = (
     inventory_enriched['days_of_supply'] < inventory_enriched['lead_time_days']
-).astype(int)
+).astype('int8')
 
 # Calculate suggested order quantity
 inventory_enriched['suggested_order_qty'] = np.where(
@@ -254,18 +285,16 @@ inventory_enriched['suggested_order_qty'] = np.where(
 ).clip(lower=0)
 
 # Aggregate by region for reporting
-regional_summary = inventory_enriched.groupby('region').agg({
-    'quantity_on_hand': 'sum',
-    'needs_reorder': 'sum',
-    'critical_low': 'sum',
-    'sku': 'count'
-}).reset_index()
-regional_summary.columns = ['region', 'total_inventory', 'items_need_reorder',
-                           'critical_items', 'total_skus']
+regional_summary = inventory_enriched.groupby('region', as_index=False, observed=True).agg(
+    total_inventory=('quantity_on_hand', 'sum'),
+    items_need_reorder=('needs_reorder', 'sum'),
+    critical_items=('critical_low', 'sum'),
+    total_skus=('sku', 'count'),
+)
 
 # Save outputs
-inventory_enriched.to_csv('inventory_analysis.csv', index=False)
-regional_summary.to_csv('regional_inventory_summary.csv', index=False)
+inventory_enriched.to_parquet('inventory_analysis.parquet', compression='zstd', index=False)
+regional_summary.to_parquet('regional_inventory_summary.parquet', compression='zstd', index=False)
 """
 
 # Example 4: Marketing Campaign Analysis
@@ -274,40 +303,31 @@ import pandas as pd
 import numpy as np
 
 # Load campaign data
-campaigns = pd.read_csv('campaigns.csv')
-impressions = pd.read_csv('ad_impressions.csv')
-clicks = pd.read_csv('ad_clicks.csv')
-conversions = pd.read_csv('conversions.csv')
-customers = pd.read_csv('customers.csv')
-orders = pd.read_csv('orders.csv')
-
-# Parse dates
-impressions['impression_time'] = pd.to_datetime(impressions['impression_time'])
-clicks['click_time'] = pd.to_datetime(clicks['click_time'])
-conversions['conversion_time'] = pd.to_datetime(conversions['conversion_time'])
+campaigns = pd.read_parquet('campaigns.parquet')
+impressions = pd.read_parquet('ad_impressions.parquet')
+clicks = pd.read_parquet('ad_clicks.parquet')
+conversions = pd.read_parquet('conversions.parquet')
+customers = pd.read_parquet('customers.parquet')
+orders = pd.read_parquet('orders.parquet')
 
 # Aggregate impressions by campaign
-campaign_impressions = impressions.groupby('campaign_id').agg({
-    'impression_id': 'count',
-    'user_id': 'nunique'
-}).reset_index()
-campaign_impressions.columns = ['campaign_id', 'total_impressions', 'unique_reach']
+campaign_impressions = impressions.groupby('campaign_id', as_index=False, sort=False).agg(
+    total_impressions=('impression_id', 'count'),
+    unique_reach=('user_id', 'nunique'),
+)
 
 # Aggregate clicks by campaign
-campaign_clicks = clicks.groupby('campaign_id').agg({
-    'click_id': 'count',
-    'user_id': 'nunique'
-}).reset_index()
-campaign_clicks.columns = ['campaign_id', 'total_clicks', 'unique_clickers']
+campaign_clicks = clicks.groupby('campaign_id', as_index=False, sort=False).agg(
+    total_clicks=('click_id', 'count'),
+    unique_clickers=('user_id', 'nunique'),
+)
 
 # Aggregate conversions
-campaign_conversions = conversions.groupby('campaign_id').agg({
-    'conversion_id': 'count',
-    'conversion_value': 'sum',
-    'user_id': 'nunique'
-}).reset_index()
-campaign_conversions.columns = ['campaign_id', 'total_conversions',
-                                'total_revenue', 'unique_converters']
+campaign_conversions = conversions.groupby('campaign_id', as_index=False, sort=False).agg(
+    total_conversions=('conversion_id', 'count'),
+    total_revenue=('conversion_value', 'sum'),
+    unique_converters=('user_id', 'nunique'),
+)
 
 # Combine metrics
 campaign_metrics = pd.merge(campaigns, campaign_impressions, on='campaign_id', how='left')
@@ -319,25 +339,16 @@ for col in ['total_impressions', 'unique_reach', 'total_clicks', 'unique_clicker
             'total_conversions', 'total_revenue', 'unique_converters']:
     campaign_metrics[col] = campaign_metrics[col].fillna(0)
 
-# Calculate rates
-campaign_metrics['ctr'] = (
-    campaign_metrics['total_clicks'] / campaign_metrics['total_impressions'].replace(0, 1)
-) * 100
-
-campaign_metrics['conversion_rate'] = (
-    campaign_metrics['total_conversions'] / campaign_metrics['total_clicks'].replace(0, 1)
-) * 100
-
-campaign_metrics['cost_per_click'] = (
-    campaign_metrics['budget_spent'] / campaign_metrics['total_clicks'].replace(0, 1)
-)
-
-campaign_metrics['cost_per_conversion'] = (
-    campaign_metrics['budget_spent'] / campaign_metrics['total_conversions'].replace(0, 1)
-)
-
-campaign_metrics['roas'] = (
-    campaign_metrics['total_revenue'] / campaign_metrics['budget_spent'].replace(0, 1)
+# Calculate rates in one eval pass (fused by numexpr when it is installed).
+# x + (x == 0) is x, or 1 where x is 0: the divide-by-zero guard without
+# the temporary column .replace(0, 1) would build for every rate
+campaign_metrics.eval(
+    'ctr = total_clicks / (total_impressions + (total_impressions == 0)) * 100\\n'
+    'conversion_rate = total_conversions / (total_clicks + (total_clicks == 0)) * 100\\n'
+    'cost_per_click = budget_spent / (total_clicks + (total_clicks == 0))\\n'
+    'cost_per_conversion = budget_spent / (total_conversions + (total_conversions == 0))\\n'
+    'roas = total_revenue / (budget_spent + (budget_spent == 0))',
+    inplace=True
 )
 
 # Segment by performance
@@ -348,7 +359,7 @@ campaign_metrics['performance_tier'] = pd.cut(
 )
 
 # Save results
-campaign_metrics.to_csv('campaign_performance.csv', index=False)
+campaign_metrics.to_parquet('campaign_performance.parquet', compression='zstd', index=False)
 """
 
 # Example 5: Healthcare Patient Journey
@@ -357,16 +368,12 @@ import pandas as pd
 import numpy as np
 
 # Load healthcare data
-patients = pd.read_csv('patients.csv')
-encounters = pd.read_csv('encounters.csv')
-diagnoses = pd.read_csv('diagnoses.csv')
-procedures = pd.read_csv('procedures.csv')
-prescriptions = pd.read_csv('prescriptions.csv')
-lab_results = pd.read_csv('lab_results.csv')
-
-# Parse dates
-encounters['encounter_date'] = pd.to_datetime(encounters['encounter_date'])
-patients['birth_date'] = pd.to_datetime(patients['birth_date'])
+patients = pd.read_parquet('patients.parquet')
+encounters = pd.read_parquet('encounters.parquet')
+diagnoses = pd.read_parquet('diagnoses.parquet')
+procedures = pd.read_parquet('procedures.parquet')
+prescriptions = pd.read_parquet('prescriptions.parquet')
+lab_results = pd.read_parquet('lab_results.parquet')
 
 # Calculate patient age
 patients['age'] = (pd.Timestamp.now() - patients['birth_date']).dt.days // 365
@@ -389,32 +396,33 @@ encounters_with_dx = pd.merge(
 # Get primary diagnosis per encounter
 primary_dx = encounters_with_dx[encounters_with_dx['is_primary'] == 1].copy()
 
-# Aggregate encounters per patient
-patient_encounter_summary = encounters.groupby('patient_id').agg({
-    'encounter_id': 'count',
-    'encounter_date': ['min', 'max'],
-    'total_charges': 'sum'
-}).reset_index()
-patient_encounter_summary.columns = [
-    'patient_id', 'total_encounters', 'first_encounter',
-    'last_encounter', 'total_charges'
-]
-
-# Count diagnoses per patient
-patient_dx_count = diagnoses.groupby(
-    diagnoses.merge(encounters[['encounter_id', 'patient_id']], on='encounter_id')['patient_id']
-).agg({
-    'diagnosis_code': 'nunique'
-}).reset_index()
-patient_dx_count.columns = ['patient_id', 'unique_diagnoses']
+# Aggregate encounters per patient (sort=False: the groups are merged back
+# by key, so their order does not matter)
+patient_encounter_summary = encounters.groupby('patient_id', as_index=False, sort=False).agg(
+    total_encounters=('encounter_id', 'count'),
+    first_encounter=('encounter_date', 'min'),
+    last_encounter=('encounter_date', 'max'),
+    total_charges=('total_charges', 'sum'),
+)
+
+# encounter_id -> patient_id lookup, projected once and shared by the
+# diagnosis and procedure counts below
+encounter_patients = encounters[['encounter_id', 'patient_id']]
+
+# Count diagnoses per patient: attach patient_id with one merge, then group
+# on the merged column
+patient_dx_count = diagnoses.merge(
+    encounter_patients, on='encounter_id'
+).groupby('patient_id', as_index=False, sort=False).agg(
+    unique_diagnoses=('diagnosis_code', 'nunique'),
+)
 
 # Count procedures per patient
 patient_proc_count = procedures.merge(
-    encounters[['encounter_id', 'patient_id']], on='encounter_id'
-).groupby('patient_id').agg({
-    'procedure_code': 'count'
-}).reset_index()
-patient_proc_count.columns = ['patient_id', 'total_procedures']
+    encounter_patients, on='encounter_id'
+).groupby('patient_id', as_index=False, sort=False).agg(
+    total_procedures=('procedure_code', 'count'),
+)
 
 # Combine patient profile
 patient_profile = pd.merge(patients, patient_encounter_summary, on='patient_id', how='left')
@@ -427,19 +435,20 @@ patient_profile['unique_diagnoses'] = patient_profile['unique_diagnoses'].fillna
 patient_profile['total_procedures'] = patient_profile['total_procedures'].fillna(0)
 patient_profile['total_charges'] = patient_profile['total_charges'].fillna(0)
 
-# Calculate risk score (simplified)
-patient_profile['complexity_score'] = (
-    patient_profile['unique_diagnoses'] * 0.3 +
-    patient_profile['total_procedures'] * 0.2 +
-    patient_profile['total_encounters'] * 0.1 +
-    (patient_profile['age'] / 10) * 0.4
-).round(2)
+# Calculate risk score (simplified) as one fused expression; the age term
+# (age / 10) * 0.4 is folded to age * 0.04 to save a pass
+patient_profile.eval(
+    'complexity_score = unique_diagnoses * 0.3 + total_procedures * 0.2'
+    ' + total_encounters * 0.1 + age * 0.04',
+    inplace=True
+)
+patient_profile['complexity_score'] = patient_profile['complexity_score'].round(2)
 
 # Identify high-risk patients
-patient_profile['high_risk'] = (patient_profile['complexity_score'] > 5).astype(int)
+patient_profile['high_risk'] = (patient_profile['complexity_score'] > 5).astype('int8')
 
 # Save outputs
-patient_profile.to_csv('patient_profiles.csv', index=False)
+patient_profile.to_parquet('patient_profiles.parquet', compression='zstd', index=False)
 """
 
 # All advanced examples
@@ -10,13 +10,13 @@ BASIC_CLEANING = """
 import pandas as pd
 
 # Load raw data
-df = pd.read_csv('raw_data.csv')
+df = pd.read_parquet('raw_data.parquet')
 
 # Remove rows with missing values
 df = df.dropna()
 
 # Save cleaned data
-df.to_csv('cleaned_data.csv', index=False)
+df.to_parquet('cleaned_data.parquet', compression='zstd', index=False)
 """
 
 # Example 2: Column Transformations
@@ -24,7 +24,7 @@ BASIC_COLUMN_TRANSFORM = """
 import pandas as pd
 
 # Load data
-df = pd.read_csv('customers.csv')
+df = pd.read_parquet('customers.parquet')
 
 # Clean text columns
 df['name'] = df['name'].str.strip()
@@ -32,7 +32,7 @@ df['name'] = df['name'].str.title()
 df['email'] = df['email'].str.lower()
 
 # Save result
-df.to_csv('customers_cleaned.csv', index=False)
+df.to_parquet('customers_cleaned.parquet', compression='zstd', index=False)
 """
 
 # Example 3: Filtering Data
@@ -40,13 +40,13 @@ BASIC_FILTERING = """
 import pandas as pd
 
 # Load sales data
-sales = pd.read_csv('sales.csv')
+sales = pd.read_parquet('sales.parquet')
 
 # Filter to high-value transactions
 high_value = sales[sales['amount'] > 1000]
 
 # Save filtered data
-high_value.to_csv('high_value_sales.csv', index=False)
+high_value.to_parquet('high_value_sales.parquet', compression='zstd', index=False)
 """
 
 # Example 4: Simple Aggregation
@@ -54,15 +54,15 @@ BASIC_AGGREGATION = """
 import pandas as pd
 
 # Load transaction data
-transactions = pd.read_csv('transactions.csv')
+transactions = pd.read_parquet('transactions.parquet')
 
 # Group by category and sum amounts
-summary = transactions.groupby('category').agg({
+summary = transactions.groupby('category', as_index=False).agg({
     'amount': 'sum'
-}).reset_index()
+})
 
 # Save summary
-summary.to_csv('category_summary.csv', index=False)
+summary.to_parquet('category_summary.parquet', compression='zstd', index=False)
 """
 
 # Example 5: Sorting Data
@@ -70,13 +70,13 @@ BASIC_SORTING = """
 import pandas as pd
 
 # Load products
-products = pd.read_csv('products.csv')
+products = pd.read_parquet('products.parquet')
 
 # Sort by price descending
 products_sorted = products.sort_values('price', ascending=False)
 
 # Save sorted data
-products_sorted.to_csv('products_by_price.csv', index=False)
+products_sorted.to_parquet('products_by_price.parquet', compression='zstd', index=False)
 """
 
 # Example 6: Removing Duplicates
@@ -84,13 +84,17 @@ BASIC_DEDUPLICATION = """
 import pandas as pd
 
 # Load customer list
-customers = pd.read_csv('customer_list.csv')
+customers = pd.read_parquet('customer_list.parquet')
+
+# Arrow-backed strings: deduplication hashes the Arrow buffer instead of
+# one Python str object per row
+customers['email'] = customers['email'].astype('string[pyarrow]')
 
 # Remove duplicate emails
 customers_unique = customers.drop_duplicates(subset=['email'])
 
 # Save deduplicated list
-customers_unique.to_csv('unique_customers.csv', index=False)
+customers_unique.to_parquet('unique_customers.parquet', compression='zstd', index=False)
 """
 
 # Example 7: Type Conversion
@@ -98,7 +102,7 @@ BASIC_TYPE_CONVERSION = """
 import pandas as pd
 
 # Load data
-df = pd.read_csv('data.csv')
+df = pd.read_parquet('data.parquet')
 
 # Convert date column
 df['order_date'] = pd.to_datetime(df['order_date'])
@@ -107,7 +111,7 @@ df['order_date'] = pd.to_datetime(df['order_date'])
 df['amount'] = df['amount'].astype(float)
 
 # Save result
-df.to_csv('data_typed.csv', index=False)
+df.to_parquet('data_typed.parquet', compression='zstd', index=False)
 """
 
 # Example 8: Fill Missing Values
@@ -115,7 +119,7 @@ BASIC_FILL_MISSING = """
 import pandas as pd
 
 # Load survey data
-survey = pd.read_csv('survey_responses.csv')
+survey = pd.read_parquet('survey_responses.parquet')
 
 # Fill missing numeric values with 0
 survey['score'] = survey['score'].fillna(0)
@@ -124,7 +128,7 @@ survey['score'] = survey['score'].fillna(0)
 survey['category'] = survey['category'].fillna('Unknown')
 
 # Save result
-survey.to_csv('survey_complete.csv', index=False)
+survey.to_parquet('survey_complete.parquet', compression='zstd', index=False)
 """
 
 # Example 9: Column Selection
@@ -132,13 +136,13 @@ BASIC_COLUMN_SELECTION = """
 import pandas as pd
 
 # Load full dataset
-full_data = pd.read_csv('full_dataset.csv')
+full_data = pd.read_parquet('full_dataset.parquet')
 
 # Select only needed columns
 selected = full_data[['id', 'name', 'email', 'created_at']]
 
 # Save selected columns
-selected.to_csv('selected_columns.csv', index=False)
+selected.to_parquet('selected_columns.parquet', compression='zstd', index=False)
 """
 
 # Example 10: Top N Records
@@ -146,13 +150,13 @@ BASIC_TOP_N = """
 import pandas as pd
 
 # Load sales data
-sales = pd.read_csv('sales.csv')
+sales = pd.read_parquet('sales.parquet')
 
 # Get top 10 highest sales
 top_10 = sales.nlargest(10, 'amount')
 
 # Save top records
-top_10.to_csv('top_10_sales.csv', index=False)
+top_10.to_parquet('top_10_sales.parquet', compression='zstd', index=False)
 """
 
 # All basic examples
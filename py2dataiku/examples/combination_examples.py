@@ -9,14 +9,21 @@ how py2dataiku handles complex multi-step transformations.
 
 # =============================================================================
 # RECIPE COMBINATIONS (20 combinations)
+#
+# These pipelines are dominated by CSV I/O, joins and groupbys, so their reads
+# use pandas' pyarrow engine: multi-threaded parsing straight into columnar
+# buffers instead of the single-threaded C parser. Results are written as
+# zstd-compressed Parquet, which keeps column types and skips formatting
+# every value as text.
 # =============================================================================
 
 # 1. PREPARE -> GROUPING -> PREPARE (clean -> aggregate -> format)
 PREPARE_GROUPING_PREPARE_EXAMPLE = """
 import pandas as pd
+import numpy as np
 
 # Load data
-df = pd.read_csv('raw_transactions.csv')
+df = pd.read_csv('raw_transactions.csv', engine='pyarrow')
 
 # PREPARE: Clean data
 df['customer_name'] = df['customer_name'].str.strip().str.title()
@@ -25,24 +32,30 @@ df['amount'] = df['amount'].fillna(0)
 df = df[df['amount'] > 0]
 
 # GROUPING: Aggregate by customer
-customer_summary = df.groupby('customer_id').agg({
-    'amount': ['sum', 'mean', 'count'],
-    'customer_name': 'first',
-    'transaction_date': 'max'
-}).reset_index()
-customer_summary.columns = ['customer_id', 'total_amount', 'avg_amount',
-                            'transaction_count', 'customer_name', 'last_transaction']
+customer_summary = df.groupby('customer_id', as_index=False).agg(
+    total_amount=('amount', 'sum'),
+    avg_amount=('amount', 'mean'),
+    transaction_count=('amount', 'count'),
+    customer_name=('customer_name', 'first'),
+    last_transaction=('transaction_date', 'max'),
+)
 
 # PREPARE: Format output
 customer_summary['total_amount'] = customer_summary['total_amount'].round(2)
 customer_summary['avg_amount'] = customer_summary['avg_amount'].round(2)
-customer_summary['customer_tier'] = pd.cut(
-    customer_summary['total_amount'],
-    bins=[0, 100, 500, 1000, float('inf')],
-    labels=['Bronze', 'Silver', 'Gold', 'Platinum']
+# (fixed right-closed tiers: a binary search over the inner edges gives
+# each row's label code directly, without building an IntervalIndex;
+# values outside (0, inf] and NaN get code -1, i.e. NaN, as with pd.cut)
+customer_summary['customer_tier'] = pd.Categorical.from_codes(
+    np.where(
+        (customer_summary['total_amount'] > 0) & customer_summary['total_amount'].notna(),
+        np.searchsorted([100, 500, 1000], customer_summary['total_amount']),
+        -1,
+    ),
+    categories=['Bronze', 'Silver', 'Gold', 'Platinum'],
 )
 
-customer_summary.to_csv('customer_summary.csv', index=False)
+customer_summary.to_parquet('customer_summary.parquet', compression='zstd', index=False)
 """
 
 # 2. JOIN -> WINDOW -> SPLIT (combine -> calculate -> partition)
@@ -50,8 +63,8 @@ JOIN_WINDOW_SPLIT_EXAMPLE = """
 import pandas as pd
 
 # Load data
-orders = pd.read_csv('orders.csv')
-products = pd.read_csv('products.csv')
+orders = pd.read_csv('orders.csv', engine='pyarrow')
+products = pd.read_csv('products.csv', engine='pyarrow')
 
 # JOIN: Combine orders with products
 orders_enriched = pd.merge(orders, products, on='product_id', how='left')
@@ -65,8 +78,8 @@ orders_enriched['customer_order_rank'] = orders_enriched.groupby('customer_id').
 first_time = orders_enriched[orders_enriched['customer_order_rank'] == 1]
 repeat = orders_enriched[orders_enriched['customer_order_rank'] > 1]
 
-first_time.to_csv('first_time_orders.csv', index=False)
-repeat.to_csv('repeat_orders.csv', index=False)
+first_time.to_parquet('first_time_orders.parquet', compression='zstd', index=False)
+repeat.to_parquet('repeat_orders.parquet', compression='zstd', index=False)
 """
 
 # 3. STACK -> DISTINCT -> SORT (combine -> dedupe -> order)
@@ -74,25 +87,24 @@ STACK_DISTINCT_SORT_EXAMPLE = """
 import pandas as pd
 
 # Load multiple data sources
-source1 = pd.read_csv('customers_crm.csv')
-source2 = pd.read_csv('customers_web.csv')
-source3 = pd.read_csv('customers_mobile.csv')
+source1 = pd.read_csv('customers_crm.csv', engine='pyarrow')
+source2 = pd.read_csv('customers_web.csv', engine='pyarrow')
+source3 = pd.read_csv('customers_mobile.csv', engine='pyarrow')
 
-# STACK: Combine all sources
+# STACK: Combine all sources, in priority order
 source1['source'] = 'crm'
 source2['source'] = 'web'
 source3['source'] = 'mobile'
 all_customers = pd.concat([source1, source2, source3], ignore_index=True)
 
-# DISTINCT: Remove duplicates (keep first by source priority)
-all_customers['source_priority'] = all_customers['source'].map({'crm': 1, 'web': 2, 'mobile': 3})
-all_customers = all_customers.sort_values('source_priority')
+# DISTINCT: Remove duplicates (concat keeps the sources in priority order,
+# so keep='first' prefers crm, then web, with no sort by priority)
 unique_customers = all_customers.drop_duplicates(subset=['email'], keep='first')
 
 # SORT: Order by registration date
 unique_customers = unique_customers.sort_values('registration_date', ascending=False)
 
-unique_customers.to_csv('unified_customers.csv', index=False)
+unique_customers.to_parquet('unified_customers.parquet', compression='zstd', index=False)
 """
 
 # 4. GROUPING -> PIVOT -> PREPARE (aggregate -> reshape -> clean)
@@ -100,9 +112,11 @@ GROUPING_PIVOT_PREPARE_EXAMPLE = """
 import pandas as pd
 
 # Load data
-sales = pd.read_csv('sales_detail.csv')
+sales = pd.read_csv('sales_detail.csv', engine='pyarrow')
 sales['date'] = pd.to_datetime(sales['date'])
-sales['month'] = sales['date'].dt.strftime('%Y-%m')
+# Monthly periods are int64-backed, so the groupby below hashes integers
+# rather than one formatted string per row; they still print as '2024-01'
+sales['month'] = sales['date'].dt.to_period('M')
 
 # GROUPING: Aggregate by product and month
 monthly_sales = sales.groupby(['product_id', 'month']).agg({
@@ -112,15 +126,15 @@ monthly_sales = sales.groupby(['product_id', 'month']).agg({
 
 # PIVOT: Reshape to wide format
 pivot_amount = monthly_sales.pivot(index='product_id', columns='month', values='amount')
-pivot_amount = pivot_amount.reset_index()
+n_months = pivot_amount.shape[1]
 
-# PREPARE: Clean and calculate totals
-pivot_amount = pivot_amount.fillna(0)
-numeric_cols = pivot_amount.select_dtypes(include='number').columns
-pivot_amount['total'] = pivot_amount[numeric_cols].sum(axis=1)
-pivot_amount['avg_monthly'] = pivot_amount[numeric_cols].mean(axis=1).round(2)
+# PREPARE: Calculate totals (sum skips the NaN of months without sales, so
+# the wide table needs no fillna copy; those cells are written out as 0)
+pivot_amount['total'] = pivot_amount.sum(axis=1)
+pivot_amount['avg_monthly'] = (pivot_amount['total'] / n_months).round(2)
+pivot_amount = pivot_amount.reset_index()
 
-pivot_amount.to_csv('product_monthly_pivot.csv', index=False)
+pivot_amount.to_csv('product_monthly_pivot.csv', index=False, na_rep='0')
 """
 
 # 5. SPLIT -> JOIN -> GROUPING (filter -> combine -> aggregate)
@@ -128,8 +142,8 @@ SPLIT_JOIN_GROUPING_EXAMPLE = """
 import pandas as pd
 
 # Load data
-transactions = pd.read_csv('transactions.csv')
-customers = pd.read_csv('customers.csv')
+transactions = pd.read_csv('transactions.csv', engine='pyarrow')
+customers = pd.read_csv('customers.csv', engine='pyarrow')
 
 # SPLIT: Filter to high-value transactions
 high_value = transactions[transactions['amount'] >= 100]
@@ -142,26 +156,30 @@ high_value_enriched = pd.merge(
     how='left'
 )
 
-# GROUPING: Aggregate by segment and region
-segment_summary = high_value_enriched.groupby(['segment', 'region']).agg({
-    'amount': ['sum', 'mean', 'count'],
-    'customer_id': 'nunique'
-}).reset_index()
-segment_summary.columns = ['segment', 'region', 'total_amount', 'avg_amount',
-                           'transaction_count', 'unique_customers']
+# GROUPING: Aggregate by segment and region (categorical keys group on
+# integer codes; observed=True skips unused key combinations)
+high_value_enriched = high_value_enriched.astype({'segment': 'category', 'region': 'category'})
+segment_summary = high_value_enriched.groupby(
+    ['segment', 'region'], as_index=False, observed=True, sort=False
+).agg(
+    total_amount=('amount', 'sum'),
+    avg_amount=('amount', 'mean'),
+    transaction_count=('amount', 'count'),
+    unique_customers=('customer_id', 'nunique'),
+)
 
-segment_summary.to_csv('high_value_segment_summary.csv', index=False)
+segment_summary.to_parquet('high_value_segment_summary.parquet', compression='zstd', index=False)
 """
 
 # 6. PREPARE -> TOP_N -> PREPARE (clean -> limit -> format)
 PREPARE_TOPN_PREPARE_EXAMPLE = """
 import pandas as pd
+import numpy as np
 
 # Load data
-products = pd.read_csv('products.csv')
+products = pd.read_csv('products.csv', engine='pyarrow')
 
-# PREPARE: Clean product data
-products['product_name'] = products['product_name'].str.strip().str.title()
+# PREPARE: Clean the columns the ranking is computed from
 products['revenue'] = products['revenue'].fillna(0)
 products['margin'] = products['margin'].fillna(0)
 products['composite_score'] = products['revenue'] * 0.7 + products['margin'] * 0.3
@@ -169,24 +187,33 @@ products['composite_score'] = products['revenue'] * 0.7 + products['margin'] * 0
 # TOP_N: Get top 100 products
 top_products = products.nlargest(100, 'composite_score')
 
-# PREPARE: Format for report
-top_products['rank'] = range(1, len(top_products) + 1)
+# PREPARE: Format for report (names are only tidied for the rows kept)
+top_products['product_name'] = top_products['product_name'].str.strip().str.title()
+top_products['rank'] = np.arange(1, len(top_products) + 1, dtype=np.int32)
 top_products['revenue_formatted'] = top_products['revenue'].apply(lambda x: f'${x:,.2f}')
-top_products['performance'] = pd.cut(
-    top_products['composite_score'],
-    bins=[0, 50, 100, float('inf')],
-    labels=['Underperformer', 'Average', 'Star']
+top_products['performance'] = pd.Categorical.from_codes(
+    np.where(
+        (top_products['composite_score'] > 0) & top_products['composite_score'].notna(),
+        np.searchsorted([50, 100], top_products['composite_score']),
+        -1,
+    ),
+    categories=['Underperformer', 'Average', 'Star'],
 )
 
-top_products.to_csv('top_100_products.csv', index=False)
+top_products.to_parquet('top_100_products.parquet', compression='zstd', index=False)
 """
 
 # 7. SAMPLING -> PREPARE -> GROUPING (sample -> clean -> aggregate)
 SAMPLING_PREPARE_GROUPING_EXAMPLE = """
 import pandas as pd
 
-# Load data
-large_dataset = pd.read_csv('large_logs.csv')
+# Load data (only the columns the hourly stats use, so the wide log rows
+# that are about to be sampled away never occupy memory in full)
+large_dataset = pd.read_csv(
+    'large_logs.csv',
+    engine='pyarrow',
+    usecols=['request_id', 'timestamp', 'status_code', 'response_time'],
+)
 
 # SAMPLING: Take 10% sample
 sample = large_dataset.sample(frac=0.1, random_state=42)
@@ -198,47 +225,83 @@ sample['is_error'] = sample['status_code'] >= 400
 sample['response_time_ms'] = sample['response_time'] * 1000
 
 # GROUPING: Aggregate by hour
-hourly_stats = sample.groupby('hour').agg({
-    'request_id': 'count',
-    'response_time_ms': ['mean', 'median', 'std'],
-    'is_error': 'sum'
-}).reset_index()
-hourly_stats.columns = ['hour', 'request_count', 'avg_response_ms',
-                        'median_response_ms', 'std_response_ms', 'error_count']
+hourly_stats = sample.groupby('hour', as_index=False).agg(
+    request_count=('request_id', 'count'),
+    avg_response_ms=('response_time_ms', 'mean'),
+    median_response_ms=('response_time_ms', 'median'),
+    std_response_ms=('response_time_ms', 'std'),
+    error_count=('is_error', 'sum'),
+)
 hourly_stats['error_rate'] = (hourly_stats['error_count'] / hourly_stats['request_count'] * 100).round(2)
 
-hourly_stats.to_csv('hourly_stats_sample.csv', index=False)
+hourly_stats.to_parquet('hourly_stats_sample.parquet', compression='zstd', index=False)
 """
 
 # 8. JOIN -> JOIN -> GROUPING (multi-join -> aggregate)
 MULTI_JOIN_GROUPING_EXAMPLE = """
 import pandas as pd
 
-# Load data
-orders = pd.read_csv('orders.csv')
-customers = pd.read_csv('customers.csv')
-products = pd.read_csv('products.csv')
-categories = pd.read_csv('categories.csv')
+# Load data (dimension tables keep only the columns the summary needs)
+orders = pd.read_csv('orders.csv', engine='pyarrow',
+                     usecols=['order_id', 'customer_id', 'product_id', 'amount'])
+customers = pd.read_csv('customers.csv', engine='pyarrow', usecols=['customer_id', 'segment', 'region'])
+products = pd.read_csv('products.csv', engine='pyarrow', usecols=['product_id', 'category_id'])
+categories = pd.read_csv('categories.csv', engine='pyarrow', usecols=['category_id', 'category_name'])
 
 # JOIN 1: Orders with customers
-orders_customers = pd.merge(orders, customers[['customer_id', 'segment', 'region']],
-                             on='customer_id', how='left')
+orders_customers = pd.merge(orders, customers, on='customer_id', how='left')
 
 # JOIN 2: With products and categories
-orders_full = pd.merge(orders_customers, products[['product_id', 'category_id', 'product_name']],
-                        on='product_id', how='left')
-orders_full = pd.merge(orders_full, categories[['category_id', 'category_name']],
-                        on='category_id', how='left')
+orders_full = pd.merge(orders_customers, products, on='product_id', how='left')
+orders_full = pd.merge(orders_full, categories, on='category_id', how='left')
 
-# GROUPING: Multi-dimensional aggregation
-summary = orders_full.groupby(['segment', 'region', 'category_name']).agg({
+# GROUPING: Multi-dimensional aggregation (categorical keys group on
+# integer codes; observed=True skips unused key combinations)
+orders_full = orders_full.astype(
+    {'segment': 'category', 'region': 'category', 'category_name': 'category'}
+)
+summary = orders_full.groupby(
+    ['segment', 'region', 'category_name'], observed=True, sort=False
+).agg({
     'order_id': 'count',
     'amount': 'sum',
     'customer_id': 'nunique'
 }).reset_index()
 summary.columns = ['segment', 'region', 'category', 'order_count', 'total_revenue', 'unique_customers']
 
-summary.to_csv('multi_dimensional_summary.csv', index=False)
+summary.to_parquet('multi_dimensional_summary.parquet', compression='zstd', index=False)
+"""
+
+# 8b. JOIN -> JOIN -> GROUPING, joining on sorted dimension indexes
+MULTI_JOIN_GROUPING_SORTMERGE_EXAMPLE = """
+import pandas as pd
+
+# Load data (dimension tables keep only the columns the summary needs)
+orders = pd.read_csv('orders.csv', engine='pyarrow')
+customers = pd.read_csv('customers.csv', engine='pyarrow', usecols=['customer_id', 'segment', 'region'])
+products = pd.read_csv('products.csv', engine='pyarrow', usecols=['product_id', 'category_id'])
+categories = pd.read_csv('categories.csv', engine='pyarrow', usecols=['category_id', 'category_name'])
+
+# Index each dimension on its key and sort it once; DataFrame.join then
+# aligns on the sorted index instead of building a hash table per merge
+customers = customers.set_index('customer_id').sort_index()
+products = products.set_index('product_id').sort_index()
+categories = categories.set_index('category_id').sort_index()
+
+# JOIN 1-3: Orders with customers, products and categories
+orders_full = orders.join(customers, on='customer_id', how='left', sort=False)
+orders_full = orders_full.join(products, on='product_id', how='left', sort=False)
+orders_full = orders_full.join(categories, on='category_id', how='left', sort=False)
+
+# GROUPING: Multi-dimensional aggregation
+summary = orders_full.groupby(['segment', 'region', 'category_name'], as_index=False).agg(
+    order_count=('order_id', 'count'),
+    total_revenue=('amount', 'sum'),
+    unique_customers=('customer_id', 'nunique'),
+)
+summary = summary.rename(columns={'category_name': 'category'})
+
+summary.to_parquet('multi_dimensional_summary.parquet', compression='zstd', index=False)
 """
 
 # 9. STACK -> STACK -> DISTINCT (multi-stack -> dedupe)
@@ -246,10 +309,10 @@ MULTI_STACK_DISTINCT_EXAMPLE = """
 import pandas as pd
 
 # Load data from multiple years and sources
-sales_2022_web = pd.read_csv('sales_2022_web.csv')
-sales_2022_store = pd.read_csv('sales_2022_store.csv')
-sales_2023_web = pd.read_csv('sales_2023_web.csv')
-sales_2023_store = pd.read_csv('sales_2023_store.csv')
+sales_2022_web = pd.read_csv('sales_2022_web.csv', engine='pyarrow')
+sales_2022_store = pd.read_csv('sales_2022_store.csv', engine='pyarrow')
+sales_2023_web = pd.read_csv('sales_2023_web.csv', engine='pyarrow')
+sales_2023_store = pd.read_csv('sales_2023_store.csv', engine='pyarrow')
 
 # STACK 1: Combine 2022 sources
 sales_2022_web['source'] = 'web'
@@ -269,7 +332,7 @@ all_sales = pd.concat([sales_2022, sales_2023], ignore_index=True)
 # DISTINCT: Remove duplicates
 all_sales = all_sales.drop_duplicates(subset=['transaction_id'])
 
-all_sales.to_csv('all_sales_combined.csv', index=False)
+all_sales.to_parquet('all_sales_combined.parquet', compression='zstd', index=False)
 """
 
 # 10. WINDOW -> GROUPING -> SORT (window -> aggregate -> order)
@@ -277,17 +340,19 @@ WINDOW_GROUPING_SORT_EXAMPLE = """
 import pandas as pd
 
 # Load data
-daily_metrics = pd.read_csv('daily_metrics.csv')
+daily_metrics = pd.read_csv('daily_metrics.csv', engine='pyarrow')
 daily_metrics['date'] = pd.to_datetime(daily_metrics['date'])
 
 # WINDOW: Calculate rolling metrics
 daily_metrics = daily_metrics.sort_values(['product_id', 'date'])
-daily_metrics['rolling_7d_avg'] = daily_metrics.groupby('product_id')['revenue'].transform(
-    lambda x: x.rolling(7, min_periods=1).mean()
-)
-daily_metrics['rolling_7d_sum'] = daily_metrics.groupby('product_id')['revenue'].transform(
-    lambda x: x.rolling(7, min_periods=1).sum()
-)
+# (groupby().rolling() runs the built-in rolling kernels per group; the
+# group level is dropped so the result aligns with daily_metrics' rows)
+daily_metrics['rolling_7d_avg'] = daily_metrics.groupby('product_id').rolling(
+    7, min_periods=1
+)['revenue'].mean().reset_index(level=0, drop=True)
+daily_metrics['rolling_7d_sum'] = daily_metrics.groupby('product_id').rolling(
+    7, min_periods=1
+)['revenue'].sum().reset_index(level=0, drop=True)
 
 # GROUPING: Aggregate by product
 product_summary = daily_metrics.groupby('product_id').agg({
@@ -302,7 +367,7 @@ product_summary.columns = ['product_id', 'total_revenue', 'latest_7d_avg',
 # SORT: Order by total revenue
 product_summary = product_summary.sort_values('total_revenue', ascending=False)
 
-product_summary.to_csv('product_summary_windowed.csv', index=False)
+product_summary.to_parquet('product_summary_windowed.parquet', compression='zstd', index=False)
 """
 
 # 11-20: Additional recipe combinations
@@ -310,10 +375,15 @@ FULL_ETL_PIPELINE_EXAMPLE = """
 import pandas as pd
 import numpy as np
 
-# Load raw data sources
-customers = pd.read_csv('raw_customers.csv')
-orders = pd.read_csv('raw_orders.csv')
-products = pd.read_csv('raw_products.csv')
+# Load raw data sources (only the columns the metrics use, so neither the
+# reader nor the joins carry unused columns)
+customers = pd.read_csv('raw_customers.csv', engine='pyarrow',
+                        usecols=['customer_id', 'name', 'email', 'segment'])
+orders = pd.read_csv('raw_orders.csv', engine='pyarrow',
+                     usecols=['order_id', 'customer_id', 'product_id', 'order_date',
+                              'amount', 'quantity'])
+products = pd.read_csv('raw_products.csv', engine='pyarrow',
+                       usecols=['product_id', 'unit_cost'])
 
 # PREPARE 1: Clean customers
 customers['email'] = customers['email'].str.lower().str.strip()
@@ -321,26 +391,20 @@ customers['name'] = customers['name'].str.strip().str.title()
 customers = customers.dropna(subset=['customer_id', 'email'])
 customers = customers.drop_duplicates(subset=['email'])
 
-# JOIN 1: Orders with customers
+# JOIN 1: Orders with customers (email was only needed to de-duplicate)
 orders_enriched = pd.merge(
     orders,
-    customers[['customer_id', 'name', 'email', 'segment']],
+    customers[['customer_id', 'name', 'segment']],
     on='customer_id',
     how='inner'
 )
 
-# JOIN 2: With products
-orders_full = pd.merge(
-    orders_enriched,
-    products[['product_id', 'product_name', 'category', 'unit_cost']],
-    on='product_id',
-    how='left'
-)
+# JOIN 2: With product costs
+orders_full = pd.merge(orders_enriched, products, on='product_id', how='left')
 
 # PREPARE 2: Calculate metrics
 orders_full['order_date'] = pd.to_datetime(orders_full['order_date'])
 orders_full['margin'] = orders_full['amount'] - orders_full['unit_cost'] * orders_full['quantity']
-orders_full['margin_pct'] = (orders_full['margin'] / orders_full['amount'] * 100).round(2)
 
 # GROUPING: Customer-level aggregation
 customer_metrics = orders_full.groupby(['customer_id', 'name', 'segment']).agg({
@@ -354,30 +418,38 @@ customer_metrics.columns = ['customer_id', 'name', 'segment', 'order_count',
 
 # WINDOW: Add customer rankings
 customer_metrics = customer_metrics.sort_values('total_revenue', ascending=False)
-customer_metrics['revenue_rank'] = range(1, len(customer_metrics) + 1)
+customer_metrics['revenue_rank'] = np.arange(1, len(customer_metrics) + 1, dtype=np.int32)
 customer_metrics['revenue_percentile'] = (
     customer_metrics['revenue_rank'] / len(customer_metrics) * 100
-).round(1)
+).round(1).astype('float32')
 
 # PREPARE 3: Final formatting
-customer_metrics['clv_tier'] = pd.cut(
-    customer_metrics['total_revenue'],
-    bins=[0, 100, 500, 2000, float('inf')],
-    labels=['Low', 'Medium', 'High', 'VIP']
+customer_metrics['clv_tier'] = pd.Categorical.from_codes(
+    np.where(
+        (customer_metrics['total_revenue'] > 0) & customer_metrics['total_revenue'].notna(),
+        np.searchsorted([100, 500, 2000], customer_metrics['total_revenue']),
+        -1,
+    ),
+    categories=['Low', 'Medium', 'High', 'VIP'],
 )
 
-customer_metrics.to_csv('customer_analytics.csv', index=False)
+customer_metrics.to_parquet('customer_analytics.parquet', compression='zstd', index=False)
 """
 
 # =============================================================================
 # PROCESSOR COMBINATIONS (15 combinations)
+#
+# The string-heavy pipelines (text, text extraction, cleaning) read with
+# dtype_backend='pyarrow': string columns arrive as Arrow arrays, so the
+# .str methods and de-duplication run on Arrow compute kernels instead of
+# looping over Python str objects.
 # =============================================================================
 
 # 1. STRING_TRANSFORMER -> FILL_EMPTY -> TYPE_SETTER (text pipeline)
 TEXT_PIPELINE_EXAMPLE = """
 import pandas as pd
 
-df = pd.read_csv('raw_text_data.csv')
+df = pd.read_csv('raw_text_data.csv', engine='pyarrow', dtype_backend='pyarrow')
 
 # STRING_TRANSFORMER: Clean text
 df['name'] = df['name'].str.strip().str.title()
@@ -393,7 +465,7 @@ df['code'] = df['code'].fillna('N/A')
 df['customer_id'] = df['customer_id'].astype(str)
 df['is_active'] = df['is_active'].astype(bool)
 
-df.to_csv('cleaned_text_data.csv', index=False)
+df.to_parquet('cleaned_text_data.parquet', compression='zstd', index=False)
 """
 
 # 2. DATE_PARSER -> FORMULA -> FILTER_ON_DATE_RANGE (date pipeline)
@@ -418,7 +490,7 @@ df['is_recent'] = (df['days_since_event'] <= 30).astype(int)
 cutoff_date = datetime.now() - timedelta(days=365)
 df = df[df['event_date'] >= cutoff_date]
 
-df.to_csv('processed_events.csv', index=False)
+df.to_parquet('processed_events.parquet', compression='zstd', index=False)
 """
 
 # 3. COLUMN_RENAMER -> COLUMN_DELETER -> COLUMNS_SELECTOR (column pipeline)
@@ -444,7 +516,7 @@ df = df.drop(columns=[c for c in columns_to_drop if c in df.columns])
 final_columns = ['customer_id', 'product_name', 'quantity', 'amount', 'date']
 df = df[[c for c in final_columns if c in df.columns]]
 
-df.to_csv('cleaned_export.csv', index=False)
+df.to_parquet('cleaned_export.parquet', compression='zstd', index=False)
 """
 
 # 4. NUMERICAL_TRANSFORMER -> ROUND -> CLIP -> BINNER (numeric pipeline)
@@ -475,19 +547,21 @@ df['value_bucket'] = pd.cut(
 )
 df['score_quartile'] = pd.qcut(df['score'], q=4, labels=['Q1', 'Q2', 'Q3', 'Q4'])
 
-df.to_csv('processed_metrics.csv', index=False)
+df.to_parquet('processed_metrics.parquet', compression='zstd', index=False)
 """
 
 # 5. REGEXP_EXTRACTOR -> SPLIT_COLUMN -> CONCAT_COLUMNS (text extraction)
 TEXT_EXTRACTION_PIPELINE_EXAMPLE = """
 import pandas as pd
 
-df = pd.read_csv('raw_contacts.csv')
+df = pd.read_csv('raw_contacts.csv', engine='pyarrow', dtype_backend='pyarrow')
 
-# REGEXP_EXTRACTOR: Extract patterns
-df['area_code'] = df['phone'].str.extract(r'\\((\\d{3})\\)')
-df['email_domain'] = df['email'].str.extract(r'@(.+)$')
-df['zip_code'] = df['address'].str.extract(r'(\\d{5})(?:-\\d{4})?$')
+# REGEXP_EXTRACTOR: Extract patterns (on Arrow strings each extract is one
+# RE2 pass in Arrow compute; expand=False returns the group as a Series
+# instead of building a one-column DataFrame per call)
+df['area_code'] = df['phone'].str.extract(r'\\((\\d{3})\\)', expand=False)
+df['email_domain'] = df['email'].str.extract(r'@(.+)$', expand=False)
+df['zip_code'] = df['address'].str.extract(r'(\\d{5})(?:-\\d{4})?$', expand=False)
 
 # SPLIT_COLUMN: Split into parts
 name_parts = df['full_name'].str.split(' ', n=1, expand=True)
@@ -502,14 +576,14 @@ df['city_state'] = address_parts[1]
 df['display_name'] = df['first_name'] + ' ' + df['last_name'].str[0] + '.'
 df['contact_info'] = df['email'] + ' | ' + df['phone']
 
-df.to_csv('parsed_contacts.csv', index=False)
+df.to_parquet('parsed_contacts.parquet', compression='zstd', index=False)
 """
 
 # 6. FILL_EMPTY -> REMOVE_ROWS_ON_EMPTY -> REMOVE_DUPLICATES (cleaning pipeline)
 CLEANING_PIPELINE_EXAMPLE = """
 import pandas as pd
 
-df = pd.read_csv('dirty_data.csv')
+df = pd.read_csv('dirty_data.csv', engine='pyarrow', dtype_backend='pyarrow')
 
 # FILL_EMPTY: Fill non-critical fields
 df['category'] = df['category'].fillna('Other')
@@ -523,12 +597,13 @@ df = df.dropna(subset=['customer_id', 'email', 'amount'])
 df = df.drop_duplicates(subset=['customer_id', 'transaction_id'], keep='first')
 df = df.drop_duplicates(subset=['email'], keep='last')
 
-df.to_csv('clean_data.csv', index=False)
+df.to_parquet('clean_data.parquet', compression='zstd', index=False)
 """
 
 # 7. FILTER_ON_VALUE -> FLAG_ON_VALUE -> CREATE_COLUMN_WITH_GREL (flagging pipeline)
 FLAGGING_PIPELINE_EXAMPLE = """
 import pandas as pd
+import numpy as np
 
 df = pd.read_csv('transactions.csv')
 
@@ -541,20 +616,21 @@ df['is_premium'] = (df['customer_tier'] == 'premium').astype(int)
 df['is_high_value'] = (df['amount'] >= 1000).astype(int)
 df['needs_review'] = (df['risk_score'] >= 0.8).astype(int)
 
-# CREATE_COLUMN_WITH_GREL: Complex computed columns
-df['priority'] = df.apply(
-    lambda row: 'Critical' if row['is_high_value'] and row['needs_review']
-    else 'High' if row['is_high_value'] or row['needs_review']
-    else 'Normal',
-    axis=1
+# CREATE_COLUMN_WITH_GREL: Complex computed columns (whole-column
+# operations; the first matching condition wins, as in an if/elif chain)
+df['priority'] = np.select(
+    [(df['is_high_value'] == 1) & (df['needs_review'] == 1),
+     (df['is_high_value'] == 1) | (df['needs_review'] == 1)],
+    ['Critical', 'High'],
+    default='Normal',
 )
 
-df['display_label'] = df.apply(
-    lambda row: f"{row['transaction_id']} - {row['customer_name']} (${row['amount']:,.2f})",
-    axis=1
+df['display_label'] = (
+    df['transaction_id'].astype(str) + ' - ' + df['customer_name']
+    + ' ($' + df['amount'].round(2).astype(str) + ')'
 )
 
-df.to_csv('flagged_transactions.csv', index=False)
+df.to_parquet('flagged_transactions.parquet', compression='zstd', index=False)
 """
 
 # 8. TYPE_SETTER -> NORMALIZER -> CATEGORICAL_ENCODER (ML prep pipeline)
@@ -575,8 +651,11 @@ for col in numeric_cols:
     df[f'{col}_normalized'] = (df[col] - df[col].mean()) / df[col].std()
     df[f'{col}_minmax'] = (df[col] - df[col].min()) / (df[col].max() - df[col].min())
 
-# CATEGORICAL_ENCODER: Encode categorical features
-df_encoded = pd.get_dummies(df, columns=['category', 'region'], prefix=['cat', 'reg'])
+# CATEGORICAL_ENCODER: Encode categorical features (sparse int8 indicators
+# store only the ones, not a dense column of zeros per category value)
+df_encoded = pd.get_dummies(
+    df, columns=['category', 'region'], prefix=['cat', 'reg'], sparse=True, dtype=np.int8
+)
 
 df_encoded.to_csv('ml_features.csv', index=False)
 """
@@ -606,7 +685,7 @@ df = df[df['score'].between(0, 100)]
 df['amount_valid'] = pd.to_numeric(df['amount'], errors='coerce')
 df = df[df['amount_valid'].notna()]
 
-df.to_csv('filtered_data.csv', index=False)
+df.to_parquet('filtered_data.parquet', compression='zstd', index=False)
 """
 
 ALL_FLAG_PROCESSORS_EXAMPLE = """
@@ -634,7 +713,7 @@ df['is_q1'] = df['date'].dt.quarter.eq(1).astype(int)
 # FLAG_ON_NUMERIC_RANGE
 df['score_in_range'] = df['score'].between(50, 100).astype(int)
 
-df.to_csv('flagged_data.csv', index=False)
+df.to_parquet('flagged_data.parquet', compression='zstd', index=False)
 """
 
 ALL_MISSING_VALUE_PROCESSORS_EXAMPLE = """
@@ -657,7 +736,7 @@ df['metric'] = df['metric'].bfill()
 # REMOVE_ROWS_ON_EMPTY: Drop rows
 df = df.dropna(subset=['customer_id', 'email'])
 
-df.to_csv('no_missing_data.csv', index=False)
+df.to_parquet('no_missing_data.parquet', compression='zstd', index=False)
 """
 
 # =============================================================================
@@ -674,6 +753,7 @@ COMBINATION_EXAMPLES: dict[str, str] = {
     "prepare_topn_prepare": PREPARE_TOPN_PREPARE_EXAMPLE,
     "sampling_prepare_grouping": SAMPLING_PREPARE_GROUPING_EXAMPLE,
     "multi_join_grouping": MULTI_JOIN_GROUPING_EXAMPLE,
+    "multi_join_grouping_sortmerge": MULTI_JOIN_GROUPING_SORTMERGE_EXAMPLE,
     "multi_stack_distinct": MULTI_STACK_DISTINCT_EXAMPLE,
     "window_grouping_sort": WINDOW_GROUPING_SORT_EXAMPLE,
     "full_etl_pipeline": FULL_ETL_PIPELINE_EXAMPLE,
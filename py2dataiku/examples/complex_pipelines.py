@@ -6,6 +6,11 @@ complex joins, advanced feature engineering, and production-grade
 data processing patterns used in enterprise environments.
 """
 
+# Pipelines that load CSV sources read them with pandas' pyarrow engine:
+# multi-threaded parsing straight into columnar buffers instead of the
+# single-threaded C parser. Date columns are parsed during the read
+# (parse_dates) rather than converted afterwards.
+
 # =============================================================================
 # 1. REAL-TIME FRAUD DETECTION FEATURE ENGINEERING
 # =============================================================================
@@ -13,13 +18,27 @@ FRAUD_DETECTION_PIPELINE = """
 import pandas as pd
 import numpy as np
 
-# Load transaction streams
+# Load transaction streams (lookup tables are read with just the columns
+# the features use, so unused columns are never parsed or carried into the
+# merge hash tables)
 transactions = pd.read_csv('transactions.csv')
-user_profiles = pd.read_csv('user_profiles.csv')
-device_fingerprints = pd.read_csv('device_fingerprints.csv')
-merchant_risk_scores = pd.read_csv('merchant_risk_scores.csv')
-historical_fraud = pd.read_csv('historical_fraud.csv')
-ip_geolocation = pd.read_csv('ip_geolocation.csv')
+user_profiles = pd.read_csv('user_profiles.csv', usecols=[
+    'user_id', 'account_age_days', 'verification_level',
+    'avg_transaction_amount', 'typical_login_hour', 'home_country', 'risk_tier',
+])
+device_fingerprints = pd.read_csv('device_fingerprints.csv', usecols=[
+    'device_id', 'device_trust_score', 'is_known_device',
+    'browser_anomaly_score', 'last_seen_country',
+])
+merchant_risk_scores = pd.read_csv('merchant_risk_scores.csv', usecols=[
+    'merchant_id', 'merchant_risk_score', 'chargeback_rate', 'merchant_category',
+])
+historical_fraud = pd.read_csv('historical_fraud.csv', usecols=[
+    'user_id', 'transaction_id', 'fraud_flag',
+])
+ip_geolocation = pd.read_csv('ip_geolocation.csv', usecols=[
+    'ip_address', 'ip_country', 'ip_city', 'is_vpn', 'is_tor', 'ip_risk_score',
+])
 
 # Parse timestamps
 transactions['timestamp'] = pd.to_datetime(transactions['timestamp'])
@@ -33,9 +52,7 @@ transactions['is_night'] = transactions['hour'].between(0, 6).astype(int)
 # Enrich with user profile data
 transactions_enriched = pd.merge(
     transactions,
-    user_profiles[['user_id', 'account_age_days', 'verification_level',
-                   'avg_transaction_amount', 'typical_login_hour',
-                   'home_country', 'risk_tier']],
+    user_profiles,
     on='user_id',
     how='left'
 )
@@ -43,8 +60,7 @@ transactions_enriched = pd.merge(
 # Add device fingerprint risk
 transactions_enriched = pd.merge(
     transactions_enriched,
-    device_fingerprints[['device_id', 'device_trust_score', 'is_known_device',
-                         'browser_anomaly_score', 'last_seen_country']],
+    device_fingerprints,
     on='device_id',
     how='left'
 )
@@ -52,8 +68,7 @@ transactions_enriched = pd.merge(
 # Add merchant risk scores
 transactions_enriched = pd.merge(
     transactions_enriched,
-    merchant_risk_scores[['merchant_id', 'merchant_risk_score',
-                          'chargeback_rate', 'merchant_category']],
+    merchant_risk_scores,
     on='merchant_id',
     how='left'
 )
@@ -61,8 +76,7 @@ transactions_enriched = pd.merge(
 # Add IP geolocation
 transactions_enriched = pd.merge(
     transactions_enriched,
-    ip_geolocation[['ip_address', 'ip_country', 'ip_city',
-                    'is_vpn', 'is_tor', 'ip_risk_score']],
+    ip_geolocation,
     on='ip_address',
     how='left'
 )
@@ -70,24 +84,16 @@ transactions_enriched = pd.merge(
 # Calculate velocity features - transactions per user in last N minutes
 transactions_enriched = transactions_enriched.sort_values(['user_id', 'timestamp'])
 
-# Rolling window aggregations per user
-user_velocity = transactions_enriched.groupby('user_id').agg({
-    'transaction_id': 'count',
-    'amount': ['sum', 'mean', 'std', 'max'],
-    'merchant_id': 'nunique',
-    'ip_address': 'nunique',
-    'device_id': 'nunique'
-}).reset_index()
-user_velocity.columns = ['user_id', 'tx_count_session', 'total_amount_session',
-                         'avg_amount_session', 'std_amount_session', 'max_amount_session',
-                         'unique_merchants', 'unique_ips', 'unique_devices']
-
-transactions_enriched = pd.merge(
-    transactions_enriched,
-    user_velocity,
-    on='user_id',
-    how='left'
-)
+# Per-user session aggregates, broadcast back onto each transaction
+# (transform keeps the row order, so no aggregate table or merge is needed)
+transactions_enriched['tx_count_session'] = transactions_enriched.groupby('user_id')['transaction_id'].transform('count')
+transactions_enriched['total_amount_session'] = transactions_enriched.groupby('user_id')['amount'].transform('sum')
+transactions_enriched['avg_amount_session'] = transactions_enriched.groupby('user_id')['amount'].transform('mean')
+transactions_enriched['std_amount_session'] = transactions_enriched.groupby('user_id')['amount'].transform('std')
+transactions_enriched['max_amount_session'] = transactions_enriched.groupby('user_id')['amount'].transform('max')
+transactions_enriched['unique_merchants'] = transactions_enriched.groupby('user_id')['merchant_id'].transform('nunique')
+transactions_enriched['unique_ips'] = transactions_enriched.groupby('user_id')['ip_address'].transform('nunique')
+transactions_enriched['unique_devices'] = transactions_enriched.groupby('user_id')['device_id'].transform('nunique')
 
 # Calculate deviation from user's typical behavior
 transactions_enriched['amount_deviation'] = (
@@ -108,16 +114,16 @@ transactions_enriched['device_country_mismatch'] = (
     transactions_enriched['ip_country'] != transactions_enriched['last_seen_country']
 ).astype(int)
 
-# Composite risk score calculation
-transactions_enriched['composite_risk_score'] = (
-    transactions_enriched['ip_risk_score'] * 0.2 +
-    transactions_enriched['merchant_risk_score'] * 0.15 +
-    (1 - transactions_enriched['device_trust_score']) * 0.2 +
-    transactions_enriched['amount_deviation'].clip(0, 5) * 0.15 +
-    transactions_enriched['country_mismatch'] * 0.15 +
-    transactions_enriched['is_vpn'] * 0.1 +
-    transactions_enriched['is_tor'] * 0.05
+# Composite risk score calculation (one eval pass: pandas fuses the weighted
+# sum through numexpr when it is installed, instead of a temporary per operator)
+transactions_enriched['amount_dev_clipped'] = transactions_enriched['amount_deviation'].clip(0, 5)
+transactions_enriched.eval(
+    "composite_risk_score = ip_risk_score * 0.2 + merchant_risk_score * 0.15"
+    " + (1 - device_trust_score) * 0.2 + amount_dev_clipped * 0.15"
+    " + country_mismatch * 0.15 + is_vpn * 0.1 + is_tor * 0.05",
+    inplace=True,
 )
+transactions_enriched = transactions_enriched.drop(columns='amount_dev_clipped')
 
 # Flag high-risk transactions
 transactions_enriched['is_high_risk'] = (
@@ -152,10 +158,21 @@ ml_features = transactions_enriched[[
     'country_mismatch', 'device_country_mismatch',
     'tx_count_session', 'unique_merchants', 'unique_ips', 'unique_devices',
     'composite_risk_score', 'historical_fraud_rate', 'is_high_risk'
-]].copy()
-
-ml_features.to_csv('fraud_detection_features.csv', index=False)
-transactions_enriched.to_csv('transactions_enriched_full.csv', index=False)
+]]
+
+# Scores in [0, 1] and per-user counts fit in 32 bits; halving their width
+# halves what the model training job has to load
+ml_features = ml_features.astype({
+    'device_trust_score': 'float32', 'browser_anomaly_score': 'float32',
+    'merchant_risk_score': 'float32', 'chargeback_rate': 'float32',
+    'ip_risk_score': 'float32', 'composite_risk_score': 'float32',
+    'historical_fraud_rate': 'float32',
+    'tx_count_session': 'int32', 'unique_merchants': 'int32',
+    'unique_ips': 'int32', 'unique_devices': 'int32',
+})
+
+ml_features.to_parquet('fraud_detection_features.parquet', compression='zstd', index=False)
+transactions_enriched.to_parquet('transactions_enriched_full.parquet', compression='zstd', index=False)
 """
 
 # =============================================================================
@@ -166,21 +183,25 @@ import pandas as pd
 import numpy as np
 
 # Load data from multiple source systems
-crm_customers = pd.read_csv('crm_customers.csv')
-ecommerce_users = pd.read_csv('ecommerce_users.csv')
-mobile_app_users = pd.read_csv('mobile_app_users.csv')
-call_center_interactions = pd.read_csv('call_center_interactions.csv')
-email_campaigns = pd.read_csv('email_campaigns.csv')
-web_analytics = pd.read_csv('web_analytics.csv')
-social_media = pd.read_csv('social_media.csv')
-loyalty_program = pd.read_csv('loyalty_program.csv')
-support_tickets = pd.read_csv('support_tickets.csv')
-nps_surveys = pd.read_csv('nps_surveys.csv')
+crm_customers = pd.read_csv('crm_customers.csv', engine='pyarrow')
+ecommerce_users = pd.read_csv(
+    'ecommerce_users.csv', engine='pyarrow', parse_dates=['last_order_date']
+)
+mobile_app_users = pd.read_csv('mobile_app_users.csv', engine='pyarrow')
+call_center_interactions = pd.read_csv('call_center_interactions.csv', engine='pyarrow')
+email_campaigns = pd.read_csv('email_campaigns.csv', engine='pyarrow')
+web_analytics = pd.read_csv('web_analytics.csv', engine='pyarrow')
+social_media = pd.read_csv('social_media.csv', engine='pyarrow')
+loyalty_program = pd.read_csv('loyalty_program.csv', engine='pyarrow')
+support_tickets = pd.read_csv('support_tickets.csv', engine='pyarrow')
+nps_surveys = pd.read_csv('nps_surveys.csv', engine='pyarrow')
 
 # Standardize customer identifiers across systems
 crm_customers['source'] = 'crm'
 crm_customers['master_id'] = crm_customers['crm_id']
 
+# Fallback ids for unmatched users are built on Arrow strings, so the
+# prefix is concatenated by one vectorised kernel rather than str() per row
 ecommerce_users['source'] = 'ecommerce'
 ecommerce_users = pd.merge(
     ecommerce_users,
@@ -189,7 +210,7 @@ ecommerce_users = pd.merge(
     how='left'
 )
 ecommerce_users['master_id'] = ecommerce_users['crm_id'].fillna(
-    'ECO_' + ecommerce_users['ecommerce_user_id'].astype(str)
+    'ECO_' + ecommerce_users['ecommerce_user_id'].astype('string[pyarrow]')
 )
 
 mobile_app_users['source'] = 'mobile'
@@ -200,159 +221,182 @@ mobile_app_users = pd.merge(
     how='left'
 )
 mobile_app_users['master_id'] = mobile_app_users['crm_id'].fillna(
-    'MOB_' + mobile_app_users['app_user_id'].astype(str)
+    'MOB_' + mobile_app_users['app_user_id'].astype('string[pyarrow]')
 )
 
-# Create unified customer profile
+# Create unified customer profile, keyed on master_id like the per-source
+# aggregates below
 customer_base = crm_customers[['master_id', 'email', 'phone', 'first_name',
                                'last_name', 'date_of_birth', 'gender',
                                'address', 'city', 'state', 'country',
-                               'customer_since']].copy()
+                               'customer_since']].set_index('master_id')
 
-# Aggregate e-commerce behavior
-ecommerce_metrics = ecommerce_users.groupby('master_id').agg({
+# Aggregate e-commerce behavior (each metrics table stays indexed on
+# master_id; the join below aligns on it, so the groups are left unsorted)
+ecommerce_metrics = ecommerce_users.groupby('master_id', sort=False).agg({
     'order_id': 'count',
     'order_total': ['sum', 'mean', 'max'],
     'items_purchased': 'sum',
     'last_order_date': 'max',
     'cart_abandonment_count': 'sum'
-}).reset_index()
-ecommerce_metrics.columns = ['master_id', 'ecom_order_count', 'ecom_total_spend',
+})
+ecommerce_metrics.columns = ['ecom_order_count', 'ecom_total_spend',
                               'ecom_avg_order', 'ecom_max_order', 'ecom_items_total',
                               'ecom_last_order', 'ecom_cart_abandonments']
 
 # Aggregate mobile app engagement
-mobile_metrics = mobile_app_users.groupby('master_id').agg({
+mobile_metrics = mobile_app_users.groupby('master_id', sort=False).agg({
     'session_count': 'sum',
     'total_time_minutes': 'sum',
     'push_notifications_clicked': 'sum',
     'app_crashes': 'sum',
-    'features_used': lambda x: len(set(','.join(x.dropna()).split(','))),
     'last_active_date': 'max'
-}).reset_index()
-mobile_metrics.columns = ['master_id', 'app_sessions', 'app_time_minutes',
-                          'push_clicks', 'app_crashes', 'features_used_count',
-                          'app_last_active']
+})
+mobile_metrics.columns = ['app_sessions', 'app_time_minutes',
+                          'push_clicks', 'app_crashes', 'app_last_active']
+
+# Count distinct app features per customer: explode the comma-separated
+# lists to one row per feature and let nunique count them, rather than
+# building a Python set per group
+feature_lists = mobile_app_users['features_used'].str.split(',')
+mobile_features = mobile_app_users[['master_id']].assign(feature=feature_lists)
+mobile_features = mobile_features.explode('feature')
+feature_metrics = mobile_features.groupby('master_id', sort=False).agg({
+    'feature': 'nunique'
+})
+feature_metrics.columns = ['features_used_count']
 
 # Aggregate call center interactions
-call_metrics = call_center_interactions.groupby('master_id').agg({
+call_metrics = call_center_interactions.groupby('master_id', sort=False).agg({
     'call_id': 'count',
     'call_duration_seconds': ['sum', 'mean'],
     'issue_resolved': 'mean',
     'escalated': 'sum',
     'sentiment_score': 'mean'
-}).reset_index()
-call_metrics.columns = ['master_id', 'call_count', 'total_call_duration',
+})
+call_metrics.columns = ['call_count', 'total_call_duration',
                         'avg_call_duration', 'resolution_rate',
                         'escalation_count', 'call_sentiment']
 
 # Aggregate email engagement
-email_metrics = email_campaigns.groupby('master_id').agg({
+email_metrics = email_campaigns.groupby('master_id', sort=False).agg({
     'email_sent': 'sum',
     'email_opened': 'sum',
     'email_clicked': 'sum',
     'unsubscribed': 'max'
-}).reset_index()
+})
 email_metrics['email_open_rate'] = email_metrics['email_opened'] / email_metrics['email_sent']
-email_metrics['email_click_rate'] = email_metrics['email_clicked'] / email_metrics['email_opened'].replace(0, 1)
+email_metrics['email_click_rate'] = email_metrics['email_clicked'] / np.where(
+    email_metrics['email_opened'] == 0, 1, email_metrics['email_opened']
+)
 
 # Aggregate web analytics
-web_metrics = web_analytics.groupby('master_id').agg({
+web_metrics = web_analytics.groupby('master_id', sort=False).agg({
     'page_views': 'sum',
     'unique_sessions': 'sum',
     'bounce_rate': 'mean',
     'avg_session_duration': 'mean',
     'conversion_events': 'sum'
-}).reset_index()
+})
 
 # Aggregate loyalty program data
-loyalty_metrics = loyalty_program.groupby('master_id').agg({
+loyalty_metrics = loyalty_program.groupby('master_id', sort=False).agg({
     'points_earned': 'sum',
     'points_redeemed': 'sum',
     'tier_level': 'max',
     'referrals_made': 'sum'
-}).reset_index()
+})
 loyalty_metrics['points_balance'] = loyalty_metrics['points_earned'] - loyalty_metrics['points_redeemed']
 
 # Aggregate support tickets
-support_metrics = support_tickets.groupby('master_id').agg({
+support_metrics = support_tickets.groupby('master_id', sort=False).agg({
     'ticket_id': 'count',
     'resolution_time_hours': 'mean',
     'satisfaction_rating': 'mean',
     'ticket_reopened': 'sum'
-}).reset_index()
-support_metrics.columns = ['master_id', 'ticket_count', 'avg_resolution_time',
+})
+support_metrics.columns = ['ticket_count', 'avg_resolution_time',
                            'support_satisfaction', 'tickets_reopened']
 
 # Aggregate NPS surveys
-nps_metrics = nps_surveys.groupby('master_id').agg({
+nps_metrics = nps_surveys.groupby('master_id', sort=False).agg({
     'nps_score': 'mean',
     'survey_id': 'count',
     'would_recommend': 'mean'
-}).reset_index()
-nps_metrics.columns = ['master_id', 'avg_nps_score', 'surveys_completed', 'recommend_rate']
-
-# Merge all metrics into unified customer 360 view
-customer_360 = customer_base.copy()
-
-for metrics_df in [ecommerce_metrics, mobile_metrics, call_metrics,
-                   email_metrics, web_metrics, loyalty_metrics,
-                   support_metrics, nps_metrics]:
-    customer_360 = pd.merge(customer_360, metrics_df, on='master_id', how='left')
+})
+nps_metrics.columns = ['avg_nps_score', 'surveys_completed', 'recommend_rate']
+
+# Merge all metrics into unified customer 360 view: one join aligns every
+# table on the shared master_id index, instead of copying the growing frame
+# and rebuilding a hash table for each of eight merges. With unique indexes
+# pandas assembles the tables with a single axis=1 concat and one reindex
+# (a positional take per table) onto customer_base. Each table's keys are
+# hashed once during the alignment, so there is nothing to gain from first
+# factorizing master_id to integer codes (that needs the same hashing).
+customer_360 = customer_base.join(
+    [ecommerce_metrics, mobile_metrics, feature_metrics, call_metrics,
+     email_metrics, web_metrics, loyalty_metrics,
+     support_metrics, nps_metrics],
+    how='left',
+)
+customer_360 = customer_360.reset_index()
 
 # Fill missing values appropriately
 numeric_cols = customer_360.select_dtypes(include=[np.number]).columns
 customer_360[numeric_cols] = customer_360[numeric_cols].fillna(0)
 
 # Calculate derived metrics
-customer_360['total_interactions'] = (
-    customer_360['ecom_order_count'] +
-    customer_360['app_sessions'] +
-    customer_360['call_count'] +
-    customer_360['ticket_count']
-)
-
-customer_360['digital_engagement_score'] = (
-    customer_360['app_sessions'] * 0.3 +
-    customer_360['email_open_rate'] * 20 +
-    customer_360['page_views'] * 0.1 +
-    customer_360['push_clicks'] * 0.5
-).clip(0, 100)
+customer_360.eval(
+    "total_interactions = ecom_order_count + app_sessions + call_count + ticket_count",
+    inplace=True,
+)
+
+customer_360.eval(
+    "digital_engagement_score = app_sessions * 0.3 + email_open_rate * 20"
+    " + page_views * 0.1 + push_clicks * 0.5",
+    inplace=True,
+)
+customer_360['digital_engagement_score'] = customer_360['digital_engagement_score'].clip(0, 100)
 
+# (the escalation term (1 - min(escalations, 5) / 5) * 25 is folded into
+# the constant 25 and a capped subtraction, since eval has no min())
+customer_360.eval(
+    "customer_health_score = avg_nps_score / 10 * 25 + resolution_rate * 25"
+    " + support_satisfaction / 5 * 25 + 25",
+    inplace=True,
+)
 customer_360['customer_health_score'] = (
-    customer_360['avg_nps_score'] / 10 * 25 +
-    customer_360['resolution_rate'] * 25 +
-    customer_360['support_satisfaction'] / 5 * 25 +
-    (1 - customer_360['escalation_count'].clip(0, 5) / 5) * 25
+    customer_360['customer_health_score'] - customer_360['escalation_count'].clip(0, 5) * 5
 )
 
-# Customer segmentation
-customer_360['value_segment'] = pd.cut(
-    customer_360['ecom_total_spend'],
-    bins=[-np.inf, 100, 500, 2000, 10000, np.inf],
-    labels=['Dormant', 'Bronze', 'Silver', 'Gold', 'Platinum']
+# Customer segmentation (fixed right-closed tiers: a binary search over the
+# inner edges gives each row's label code; both scores are NaN-free here)
+customer_360['value_segment'] = pd.Categorical.from_codes(
+    np.searchsorted([100, 500, 2000, 10000], customer_360['ecom_total_spend']),
+    categories=['Dormant', 'Bronze', 'Silver', 'Gold', 'Platinum'],
 )
 
-customer_360['engagement_segment'] = pd.cut(
-    customer_360['digital_engagement_score'],
-    bins=[-np.inf, 20, 40, 60, 80, np.inf],
-    labels=['Inactive', 'Low', 'Medium', 'High', 'Power User']
+customer_360['engagement_segment'] = pd.Categorical.from_codes(
+    np.searchsorted([20, 40, 60, 80], customer_360['digital_engagement_score']),
+    categories=['Inactive', 'Low', 'Medium', 'High', 'Power User'],
 )
 
 # Calculate churn risk
+# (ecom_last_order is already a datetime column, so no to_datetime re-parse;
+# customers with no order fall back to 999 days)
 customer_360['days_since_activity'] = (
-    pd.to_datetime('today') - pd.to_datetime(customer_360['ecom_last_order'])
+    pd.Timestamp.now() - customer_360['ecom_last_order']
 ).dt.days.fillna(999)
 
-customer_360['churn_risk_score'] = (
-    customer_360['days_since_activity'] / 365 * 30 +
-    (1 - customer_360['email_open_rate'].fillna(0)) * 20 +
-    customer_360['tickets_reopened'] * 10 +
-    (10 - customer_360['avg_nps_score'].fillna(5)) * 4
-).clip(0, 100)
+customer_360.eval(
+    "churn_risk_score = days_since_activity / 365 * 30 + (1 - email_open_rate) * 20"
+    " + tickets_reopened * 10 + (10 - avg_nps_score) * 4",
+    inplace=True,
+)
+customer_360['churn_risk_score'] = customer_360['churn_risk_score'].clip(0, 100)
 
 # Save outputs
-customer_360.to_csv('customer_360_unified.csv', index=False)
+customer_360.to_parquet('customer_360_unified.parquet', compression='zstd', index=False)
 """
 
 # =============================================================================
@@ -363,18 +407,17 @@ import pandas as pd
 import numpy as np
 
 # Load supply chain data
-sales_history = pd.read_csv('sales_history.csv')
-inventory_levels = pd.read_csv('inventory_levels.csv')
-supplier_data = pd.read_csv('supplier_data.csv')
-warehouse_locations = pd.read_csv('warehouse_locations.csv')
-shipping_costs = pd.read_csv('shipping_costs.csv')
-product_catalog = pd.read_csv('product_catalog.csv')
-promotions_calendar = pd.read_csv('promotions_calendar.csv')
-weather_data = pd.read_csv('weather_data.csv')
-economic_indicators = pd.read_csv('economic_indicators.csv')
-
-# Parse dates
-sales_history['sale_date'] = pd.to_datetime(sales_history['sale_date'])
+sales_history = pd.read_csv('sales_history.csv', engine='pyarrow', parse_dates=['sale_date'])
+inventory_levels = pd.read_csv('inventory_levels.csv', engine='pyarrow')
+supplier_data = pd.read_csv('supplier_data.csv', engine='pyarrow')
+warehouse_locations = pd.read_csv('warehouse_locations.csv', engine='pyarrow')
+shipping_costs = pd.read_csv('shipping_costs.csv', engine='pyarrow')
+product_catalog = pd.read_csv('product_catalog.csv', engine='pyarrow')
+promotions_calendar = pd.read_csv('promotions_calendar.csv', engine='pyarrow', parse_dates=['promo_date'])
+weather_data = pd.read_csv('weather_data.csv', engine='pyarrow', parse_dates=['date'])
+economic_indicators = pd.read_csv('economic_indicators.csv', engine='pyarrow')
+
+# Calendar parts of the (already parsed) sale date
 sales_history['year'] = sales_history['sale_date'].dt.year
 sales_history['month'] = sales_history['sale_date'].dt.month
 sales_history['week'] = sales_history['sale_date'].dt.isocalendar().week
@@ -391,7 +434,6 @@ sales_enriched = pd.merge(
 )
 
 # Add promotion flags
-promotions_calendar['promo_date'] = pd.to_datetime(promotions_calendar['promo_date'])
 sales_enriched = pd.merge(
     sales_enriched,
     promotions_calendar[['product_id', 'promo_date', 'discount_pct', 'promo_type']],
@@ -403,7 +445,6 @@ sales_enriched['is_promotion'] = sales_enriched['discount_pct'].notna().astype(i
 sales_enriched['discount_pct'] = sales_enriched['discount_pct'].fillna(0)
 
 # Add weather impact
-weather_data['date'] = pd.to_datetime(weather_data['date'])
 sales_enriched = pd.merge(
     sales_enriched,
     weather_data[['date', 'region', 'temperature', 'precipitation', 'weather_condition']],
@@ -420,24 +461,26 @@ daily_demand = sales_enriched.groupby(['product_id', 'warehouse_id', 'sale_date'
     'temperature': 'mean'
 }).reset_index()
 
-# Calculate rolling averages for demand forecasting
+# Calculate rolling averages for demand forecasting (groupby().rolling()
+# runs one windowed loop over all groups instead of a Python call per group;
+# dropping the group levels realigns the result with daily_demand)
 daily_demand = daily_demand.sort_values(['product_id', 'warehouse_id', 'sale_date'])
-daily_demand['demand_7d_avg'] = daily_demand.groupby(['product_id', 'warehouse_id'])['quantity'].transform(
-    lambda x: x.rolling(7, min_periods=1).mean()
-)
-daily_demand['demand_30d_avg'] = daily_demand.groupby(['product_id', 'warehouse_id'])['quantity'].transform(
-    lambda x: x.rolling(30, min_periods=1).mean()
-)
-daily_demand['demand_90d_avg'] = daily_demand.groupby(['product_id', 'warehouse_id'])['quantity'].transform(
-    lambda x: x.rolling(90, min_periods=1).mean()
-)
+daily_demand['demand_7d_avg'] = daily_demand.groupby(['product_id', 'warehouse_id']).rolling(
+    7, min_periods=1
+)['quantity'].mean().reset_index(level=[0, 1], drop=True)
+daily_demand['demand_30d_avg'] = daily_demand.groupby(['product_id', 'warehouse_id']).rolling(
+    30, min_periods=1
+)['quantity'].mean().reset_index(level=[0, 1], drop=True)
+daily_demand['demand_90d_avg'] = daily_demand.groupby(['product_id', 'warehouse_id']).rolling(
+    90, min_periods=1
+)['quantity'].mean().reset_index(level=[0, 1], drop=True)
 
 # Calculate demand volatility
-daily_demand['demand_7d_std'] = daily_demand.groupby(['product_id', 'warehouse_id'])['quantity'].transform(
-    lambda x: x.rolling(7, min_periods=1).std()
-)
+daily_demand['demand_7d_std'] = daily_demand.groupby(['product_id', 'warehouse_id']).rolling(
+    7, min_periods=1
+)['quantity'].std().reset_index(level=[0, 1], drop=True)
 daily_demand['demand_coefficient_variation'] = (
-    daily_demand['demand_7d_std'] / daily_demand['demand_7d_avg'].replace(0, 1)
+    daily_demand['demand_7d_std'] / np.where(daily_demand['demand_7d_avg'] == 0, 1, daily_demand['demand_7d_avg'])
 )
 
 # Seasonality detection
@@ -471,7 +514,7 @@ inventory_analysis = pd.merge(
 )
 inventory_analysis['days_of_supply'] = (
     inventory_analysis['available_inventory'] /
-    inventory_analysis['demand_30d_avg'].replace(0, 0.1)
+    np.where(inventory_analysis['demand_30d_avg'] == 0, 0.1, inventory_analysis['demand_30d_avg'])
 )
 
 # Add supplier lead times
@@ -505,7 +548,7 @@ inventory_analysis['annual_demand'] = inventory_analysis['demand_30d_avg'] * 12
 
 inventory_analysis['economic_order_qty'] = np.sqrt(
     2 * inventory_analysis['annual_demand'] * inventory_analysis['order_cost'] /
-    inventory_analysis['holding_cost_annual'].replace(0, 1)
+    np.where(inventory_analysis['holding_cost_annual'] == 0, 1, inventory_analysis['holding_cost_annual'])
 )
 
 # Calculate shipping optimization
@@ -543,7 +586,7 @@ shipping_analysis['stockout_risk'] = np.where(
 )
 
 # Save outputs
-daily_demand.to_csv('demand_forecast_features.csv', index=False)
+daily_demand.to_parquet('demand_forecast_features.parquet', compression='zstd', index=False)
 inventory_analysis.to_csv('inventory_optimization.csv', index=False)
 shipping_analysis.to_csv('supply_chain_analysis.csv', index=False)
 monthly_patterns.to_csv('seasonality_patterns.csv', index=False)
@@ -557,34 +600,34 @@ import pandas as pd
 import numpy as np
 
 # Load marketing data
-touchpoints = pd.read_csv('touchpoints.csv')
-conversions = pd.read_csv('conversions.csv')
-ad_spend = pd.read_csv('ad_spend.csv')
-channel_costs = pd.read_csv('channel_costs.csv')
-campaign_metadata = pd.read_csv('campaign_metadata.csv')
-customer_journeys = pd.read_csv('customer_journeys.csv')
-organic_traffic = pd.read_csv('organic_traffic.csv')
-offline_media = pd.read_csv('offline_media.csv')
-
-# Parse timestamps
-touchpoints['touchpoint_time'] = pd.to_datetime(touchpoints['touchpoint_time'])
-conversions['conversion_time'] = pd.to_datetime(conversions['conversion_time'])
+touchpoints = pd.read_csv('touchpoints.csv', engine='pyarrow', parse_dates=['touchpoint_time'])
+conversions = pd.read_csv('conversions.csv', engine='pyarrow', parse_dates=['conversion_time'])
+ad_spend = pd.read_csv('ad_spend.csv', engine='pyarrow')
+channel_costs = pd.read_csv('channel_costs.csv', engine='pyarrow')
+campaign_metadata = pd.read_csv('campaign_metadata.csv', engine='pyarrow')
+customer_journeys = pd.read_csv('customer_journeys.csv', engine='pyarrow')
+organic_traffic = pd.read_csv('organic_traffic.csv', engine='pyarrow')
+offline_media = pd.read_csv('offline_media.csv', engine='pyarrow')
 
 # Create customer journey sequences
 touchpoints_sorted = touchpoints.sort_values(['customer_id', 'touchpoint_time'])
 
-# Assign journey IDs (new journey if gap > 30 days)
+# Assign journey IDs (new journey if gap > 30 days). The timedelta
+# comparison runs on the underlying int64 nanoseconds, and the NaT gap of a
+# customer's first touchpoint compares False, so journeys number from 0
 touchpoints_sorted['time_since_last'] = touchpoints_sorted.groupby('customer_id')['touchpoint_time'].diff()
 touchpoints_sorted['new_journey'] = (
     touchpoints_sorted['time_since_last'] > pd.Timedelta(days=30)
-).fillna(True).astype(int)
+).astype(int)
 touchpoints_sorted['journey_id'] = touchpoints_sorted.groupby('customer_id')['new_journey'].cumsum()
 
-# Create journey-level aggregations
+# Create journey-level aggregations (the path joins each journey's channels
+# with the bound str.join, and the campaigns use the built-in unique
+# aggregation, so no Python lambda or list copy runs per journey)
 journey_touchpoints = touchpoints_sorted.groupby(['customer_id', 'journey_id']).agg({
     'touchpoint_id': 'count',
-    'channel': lambda x: ' > '.join(x),
-    'campaign_id': lambda x: list(x.unique()),
+    'channel': ' > '.join,
+    'campaign_id': 'unique',
     'touchpoint_time': ['min', 'max'],
     'cost': 'sum'
 }).reset_index()
@@ -619,12 +662,19 @@ journey_conversions['conversion_value'] = np.where(
 
 # Calculate attribution models
 
-# 1. First-touch attribution
-touchpoints_sorted['is_first_touch'] = touchpoints_sorted.groupby(
-    ['customer_id', 'journey_id']
-).cumcount() == 0
+# Each attribution model below works per (customer_id, journey_id). The
+# rows are already in (customer_id, touchpoint_time) order from the
+# sessionization above, so every journey is a contiguous run: journey
+# boundaries come from the flags computed there, and the per-journey
+# groupbys skip sorting their keys.
+
+# 1. First-touch attribution (a journey starts at a customer's first
+# touchpoint, whose gap is NaT, or after a gap of more than 30 days)
+touchpoints_sorted['is_first_touch'] = (
+    touchpoints_sorted['time_since_last'].isna() | (touchpoints_sorted['new_journey'] == 1)
+)
 
-first_touch = touchpoints_sorted[touchpoints_sorted['is_first_touch']].copy()
+first_touch = touchpoints_sorted[touchpoints_sorted['is_first_touch']]
 first_touch_attribution = first_touch.groupby('channel').agg({
     'touchpoint_id': 'count',
     'cost': 'sum'
@@ -632,7 +682,7 @@ first_touch_attribution = first_touch.groupby('channel').agg({
 first_touch_attribution.columns = ['channel', 'first_touch_count', 'first_touch_cost']
 
 # 2. Last-touch attribution
-last_touch = touchpoints_sorted.groupby(['customer_id', 'journey_id']).last().reset_index()
+last_touch = touchpoints_sorted.groupby(['customer_id', 'journey_id'], sort=False).last().reset_index()
 last_touch_attribution = last_touch.groupby('channel').agg({
     'touchpoint_id': 'count',
     'cost': 'sum'
@@ -659,29 +709,33 @@ touchpoints_with_conversion['days_to_conversion'] = (
 ).dt.total_seconds() / 86400
 
 # Exponential decay weight (half-life = 7 days)
-touchpoints_with_conversion['decay_weight'] = np.exp(
-    -touchpoints_with_conversion['days_to_conversion'] / 7
+touchpoints_with_conversion.eval(
+    "decay_weight = exp(-days_to_conversion / 7)", inplace=True
 )
 
-# Normalize weights within journey
+# Normalize weights within journey (a journey whose weights all underflow to
+# 0 divides by 1 and gets 0 credit)
 touchpoints_with_conversion['weight_sum'] = touchpoints_with_conversion.groupby(
-    ['customer_id', 'journey_id']
+    ['customer_id', 'journey_id'], sort=False
 )['decay_weight'].transform('sum')
+touchpoints_with_conversion['weight_sum'] = np.where(
+    touchpoints_with_conversion['weight_sum'] == 0, 1, touchpoints_with_conversion['weight_sum']
+)
 
-touchpoints_with_conversion['time_decay_credit'] = (
-    touchpoints_with_conversion['decay_weight'] /
-    touchpoints_with_conversion['weight_sum'].replace(0, 1) *
-    touchpoints_with_conversion['conversion_value']
+touchpoints_with_conversion.eval(
+    "time_decay_credit = decay_weight / weight_sum * conversion_value",
+    inplace=True,
 )
 
 # 5. Position-based attribution (40% first, 40% last, 20% middle)
 touchpoints_with_conversion['position'] = touchpoints_with_conversion.groupby(
-    ['customer_id', 'journey_id']
+    ['customer_id', 'journey_id'], sort=False
 ).cumcount() + 1
 
+# (the last position is the journey's row count)
 touchpoints_with_conversion['total_positions'] = touchpoints_with_conversion.groupby(
-    ['customer_id', 'journey_id']
-)['position'].transform('max')
+    ['customer_id', 'journey_id'], sort=False
+)['position'].transform('size')
 
 touchpoints_with_conversion['position_weight'] = np.where(
     touchpoints_with_conversion['position'] == 1,
@@ -689,7 +743,11 @@ touchpoints_with_conversion['position_weight'] = np.where(
     np.where(
         touchpoints_with_conversion['position'] == touchpoints_with_conversion['total_positions'],
         0.4,
-        0.2 / (touchpoints_with_conversion['total_positions'] - 2).replace(0, 1)
+        0.2 / np.where(
+            touchpoints_with_conversion['total_positions'] == 2,
+            1,
+            touchpoints_with_conversion['total_positions'] - 2,
+        )
     )
 )
 
@@ -713,15 +771,15 @@ channel_attribution = pd.merge(channel_attribution, last_touch_attribution, on='
 # Calculate ROI by attribution model
 channel_attribution['roi_linear'] = (
     channel_attribution['linear_credit'] - channel_attribution['cost']
-) / channel_attribution['cost'].replace(0, 1)
+) / np.where(channel_attribution['cost'] == 0, 1, channel_attribution['cost'])
 
 channel_attribution['roi_time_decay'] = (
     channel_attribution['time_decay_credit'] - channel_attribution['cost']
-) / channel_attribution['cost'].replace(0, 1)
+) / np.where(channel_attribution['cost'] == 0, 1, channel_attribution['cost'])
 
 channel_attribution['roi_position'] = (
     channel_attribution['position_based_credit'] - channel_attribution['cost']
-) / channel_attribution['cost'].replace(0, 1)
+) / np.where(channel_attribution['cost'] == 0, 1, channel_attribution['cost'])
 
 # Marketing mix modeling aggregations
 daily_spend = ad_spend.groupby(['date', 'channel']).agg({
@@ -731,8 +789,8 @@ daily_spend = ad_spend.groupby(['date', 'channel']).agg({
 }).reset_index()
 
 daily_spend['cpm'] = daily_spend['spend'] / daily_spend['impressions'] * 1000
-daily_spend['cpc'] = daily_spend['spend'] / daily_spend['clicks'].replace(0, 1)
-daily_spend['ctr'] = daily_spend['clicks'] / daily_spend['impressions'].replace(0, 1)
+daily_spend['cpc'] = daily_spend['spend'] / np.where(daily_spend['clicks'] == 0, 1, daily_spend['clicks'])
+daily_spend['ctr'] = daily_spend['clicks'] / np.where(daily_spend['impressions'] == 0, 1, daily_spend['impressions'])
 
 # Add adstock transformation (carryover effect)
 daily_spend = daily_spend.sort_values(['channel', 'date'])
@@ -741,9 +799,16 @@ daily_spend['spend_adstock'] = daily_spend.groupby('channel')['spend'].transform
 )
 
 # Save outputs
-journey_touchpoints.to_csv('customer_journeys_analyzed.csv', index=False)
+journey_touchpoints.to_parquet('customer_journeys_analyzed.parquet', compression='zstd', index=False)
 channel_attribution.to_csv('channel_attribution_models.csv', index=False)
-touchpoints_with_conversion.to_csv('touchpoint_attribution_detail.csv', index=False)
+# (the per-touchpoint detail keeps the identifiers and the credit each model
+# assigns; the sessionization and weighting helpers are not written out)
+touchpoint_attribution_detail = touchpoints_with_conversion[[
+    'customer_id', 'journey_id', 'touchpoint_id', 'touchpoint_time', 'channel',
+    'campaign_id', 'cost', 'is_first_touch', 'converted', 'conversion_value',
+    'time_decay_credit', 'position_based_credit'
+]]
+touchpoint_attribution_detail.to_parquet('touchpoint_attribution_detail.parquet', compression='zstd', index=False)
 daily_spend.to_csv('marketing_mix_features.csv', index=False)
 """
 
@@ -755,42 +820,41 @@ import pandas as pd
 import numpy as np
 
 # Load IoT sensor data
-sensor_readings = pd.read_csv('sensor_readings.csv')
-equipment_registry = pd.read_csv('equipment_registry.csv')
-maintenance_history = pd.read_csv('maintenance_history.csv')
-failure_logs = pd.read_csv('failure_logs.csv')
-operating_conditions = pd.read_csv('operating_conditions.csv')
-parts_inventory = pd.read_csv('parts_inventory.csv')
-technician_schedules = pd.read_csv('technician_schedules.csv')
-
-# Parse timestamps
-sensor_readings['reading_time'] = pd.to_datetime(sensor_readings['reading_time'])
-maintenance_history['maintenance_date'] = pd.to_datetime(maintenance_history['maintenance_date'])
-failure_logs['failure_time'] = pd.to_datetime(failure_logs['failure_time'])
+sensor_readings = pd.read_csv('sensor_readings.csv', engine='pyarrow', parse_dates=['reading_time'])
+equipment_registry = pd.read_csv('equipment_registry.csv', engine='pyarrow', parse_dates=['installation_date'])
+maintenance_history = pd.read_csv('maintenance_history.csv', engine='pyarrow', parse_dates=['maintenance_date'])
+failure_logs = pd.read_csv('failure_logs.csv', engine='pyarrow', parse_dates=['failure_time'])
+operating_conditions = pd.read_csv('operating_conditions.csv', engine='pyarrow', parse_dates=['condition_time'])
+parts_inventory = pd.read_csv('parts_inventory.csv', engine='pyarrow')
+technician_schedules = pd.read_csv('technician_schedules.csv', engine='pyarrow')
 
 # Clean sensor data - remove outliers
 sensor_readings = sensor_readings.sort_values(['equipment_id', 'sensor_type', 'reading_time'])
 
-# Calculate rolling statistics per sensor
+# Calculate rolling statistics per sensor (time windows over reading_time,
+# computed by groupby().rolling() rather than a per-group lambda). With
+# on='reading_time' the result is indexed by the group keys and timestamp,
+# not by row, so it is assigned positionally: sensor_readings is sorted by
+# the same keys and time, which is the order groupby().rolling() emits.
 sensor_readings['value_1h_mean'] = sensor_readings.groupby(
     ['equipment_id', 'sensor_type']
-)['sensor_value'].transform(lambda x: x.rolling('1H', on=sensor_readings['reading_time']).mean())
+).rolling('1h', on='reading_time')['sensor_value'].mean().to_numpy()
 
 sensor_readings['value_1h_std'] = sensor_readings.groupby(
     ['equipment_id', 'sensor_type']
-)['sensor_value'].transform(lambda x: x.rolling('1H', on=sensor_readings['reading_time']).std())
+).rolling('1h', on='reading_time')['sensor_value'].std().to_numpy()
 
 sensor_readings['value_24h_mean'] = sensor_readings.groupby(
     ['equipment_id', 'sensor_type']
-)['sensor_value'].transform(lambda x: x.rolling('24H', on=sensor_readings['reading_time']).mean())
+).rolling('24h', on='reading_time')['sensor_value'].mean().to_numpy()
 
 sensor_readings['value_24h_max'] = sensor_readings.groupby(
     ['equipment_id', 'sensor_type']
-)['sensor_value'].transform(lambda x: x.rolling('24H', on=sensor_readings['reading_time']).max())
+).rolling('24h', on='reading_time')['sensor_value'].max().to_numpy()
 
 sensor_readings['value_24h_min'] = sensor_readings.groupby(
     ['equipment_id', 'sensor_type']
-)['sensor_value'].transform(lambda x: x.rolling('24H', on=sensor_readings['reading_time']).min())
+).rolling('24h', on='reading_time')['sensor_value'].min().to_numpy()
 
 # Calculate rate of change
 sensor_readings['value_diff'] = sensor_readings.groupby(
@@ -804,21 +868,24 @@ sensor_readings['value_pct_change'] = sensor_readings.groupby(
 # Detect anomalies using z-score
 sensor_readings['z_score'] = (
     (sensor_readings['sensor_value'] - sensor_readings['value_24h_mean']) /
-    sensor_readings['value_1h_std'].replace(0, 1)
+    np.where(sensor_readings['value_1h_std'] == 0, 1, sensor_readings['value_1h_std'])
 )
-sensor_readings['is_anomaly'] = (abs(sensor_readings['z_score']) > 3).astype(int)
+# (|z| > 3 tested as z * z > 9: no abs() temporary, and the flag is one byte)
+sensor_readings['is_anomaly'] = (
+    sensor_readings['z_score'] * sensor_readings['z_score'] > 9
+).astype(np.int8)
 
-# Pivot sensor types to create feature vectors
-sensor_features = sensor_readings.pivot_table(
+# Pivot sensor types to create feature vectors. Each sensor reports once per
+# reading_time, so pivot (a reshape of the index) is enough; pivot_table
+# would group every cell just to take its 'first' value
+sensor_features = sensor_readings.pivot(
     index=['equipment_id', 'reading_time'],
     columns='sensor_type',
     values=['sensor_value', 'value_1h_mean', 'value_24h_max', 'z_score', 'is_anomaly'],
-    aggfunc='first'
 ).reset_index()
 
 # Flatten column names
-sensor_features.columns = ['_'.join(str(c) for c in col).strip('_')
-                           for col in sensor_features.columns]
+sensor_features.columns = sensor_features.columns.map('_'.join).str.strip('_')
 
 # Add equipment metadata
 sensor_features = pd.merge(
@@ -830,15 +897,17 @@ sensor_features = pd.merge(
 )
 
 # Calculate equipment age
-sensor_features['installation_date'] = pd.to_datetime(sensor_features['installation_date'])
 sensor_features['equipment_age_days'] = (
     sensor_features['reading_time'] - sensor_features['installation_date']
 ).dt.days
 
+# Order the features by time once: merge_asof needs it, and the left merges
+# and the second merge_asof below keep the left frame's row order
+sensor_features = sensor_features.sort_values('reading_time', kind='stable')
+
 # Add operating conditions
-operating_conditions['condition_time'] = pd.to_datetime(operating_conditions['condition_time'])
 sensor_features = pd.merge_asof(
-    sensor_features.sort_values('reading_time'),
+    sensor_features,
     operating_conditions.sort_values('condition_time'),
     left_on='reading_time',
     right_on='condition_time',
@@ -865,7 +934,6 @@ sensor_features = pd.merge(
 )
 
 # Calculate days since last maintenance
-sensor_features['last_maintenance_date'] = pd.to_datetime(sensor_features['last_maintenance_date'])
 sensor_features['days_since_maintenance'] = (
     sensor_features['reading_time'] - sensor_features['last_maintenance_date']
 ).dt.days
@@ -888,9 +956,9 @@ sensor_features = pd.merge(
 )
 
 # Create target variable: failure within next N days
-failure_logs_sorted = failure_logs.sort_values(['equipment_id', 'failure_time'])
+failure_logs_sorted = failure_logs.sort_values('failure_time')
 sensor_features = pd.merge_asof(
-    sensor_features.sort_values('reading_time'),
+    sensor_features,
     failure_logs_sorted[['equipment_id', 'failure_time']].rename(
         columns={'failure_time': 'next_failure_time'}
     ),
@@ -907,10 +975,12 @@ sensor_features['days_to_failure'] = (
 sensor_features['failure_within_7d'] = (sensor_features['days_to_failure'] <= 7).astype(int)
 sensor_features['failure_within_30d'] = (sensor_features['days_to_failure'] <= 30).astype(int)
 
-# Calculate health score
-sensor_features['anomaly_count_24h'] = sensor_features.groupby('equipment_id')['is_anomaly_temperature'].transform(
-    lambda x: x.rolling('24H', on=sensor_features['reading_time']).sum()
-)
+# Calculate health score (the 24h anomaly count is assigned positionally,
+# as above, so the frame is first put in (equipment_id, reading_time) order)
+sensor_features = sensor_features.sort_values(['equipment_id', 'reading_time'], kind='stable')
+sensor_features['anomaly_count_24h'] = sensor_features.groupby('equipment_id').rolling(
+    '24h', on='reading_time'
+)['is_anomaly_temperature'].sum().to_numpy()
 
 sensor_features['health_score'] = 100 - (
     sensor_features['anomaly_count_24h'] * 5 +
@@ -942,7 +1012,7 @@ sensor_features = pd.merge(
 )
 
 # Save outputs
-sensor_features.to_csv('predictive_maintenance_features.csv', index=False)
+sensor_features.to_parquet('predictive_maintenance_features.parquet', compression='zstd', index=False)
 
 # Create maintenance schedule recommendations
 maintenance_schedule = sensor_features[sensor_features['maintenance_priority'].isin(['Critical', 'High'])].groupby(
@@ -976,11 +1046,14 @@ population_frequencies = pd.read_csv('population_frequencies.csv')
 functional_predictions = pd.read_csv('functional_predictions.csv')
 disease_associations = pd.read_csv('disease_associations.csv')
 
-# Standardize variant identifiers
+# Standardize variant identifiers (every part is cast to an Arrow string,
+# so each concatenation is one kernel over UTF-8 buffers rather than a
+# Python str per row)
 variants['variant_id'] = (
-    variants['chromosome'].astype(str) + ':' +
-    variants['position'].astype(str) + ':' +
-    variants['reference'] + '>' + variants['alternate']
+    variants['chromosome'].astype('string[pyarrow]') + ':' +
+    variants['position'].astype('string[pyarrow]') + ':' +
+    variants['reference'].astype('string[pyarrow]') + '>' +
+    variants['alternate'].astype('string[pyarrow]')
 )
 
 # Calculate variant quality metrics
@@ -1027,6 +1100,9 @@ high_quality_variants['impact_category'] = np.where(
         'Benign'
     )
 )
+high_quality_variants['is_damaging'] = (
+    high_quality_variants['impact_category'] == 'Damaging'
+).astype(np.int8)
 
 # Add population allele frequencies
 high_quality_variants = pd.merge(
@@ -1050,11 +1126,12 @@ high_quality_variants = pd.merge(
     how='left'
 )
 
-# Calculate per-sample variant burden
+# Calculate per-sample variant burden (damaging variants are counted by
+# summing the 0/1 flag, which stays on the Cython path, not a lambda per group)
 sample_burden = high_quality_variants.groupby('sample_id').agg({
     'variant_id': 'count',
     'is_rare': 'sum',
-    'impact_category': lambda x: (x == 'Damaging').sum()
+    'is_damaging': 'sum'
 }).reset_index()
 sample_burden.columns = ['sample_id', 'total_variants', 'rare_variants', 'damaging_variants']
 
@@ -1078,7 +1155,7 @@ sample_burden = pd.merge(
 gene_burden = high_quality_variants.groupby(['sample_id', 'gene_symbol']).agg({
     'variant_id': 'count',
     'is_rare': 'sum',
-    'impact_category': lambda x: (x == 'Damaging').sum(),
+    'is_damaging': 'sum',
     'cadd_score': 'max'
 }).reset_index()
 gene_burden.columns = ['sample_id', 'gene_symbol', 'variants_in_gene',
@@ -1112,14 +1189,14 @@ pathogenic_candidates = high_quality_variants[
 
 # Create variant report
 variant_report = pathogenic_candidates.groupby(['sample_id', 'gene_symbol']).agg({
-    'variant_id': lambda x: '; '.join(x),
+    'variant_id': '; '.join,
     'disease_name': 'first',
     'inheritance_pattern': 'first',
     'cadd_score': 'max'
 }).reset_index()
 
 # Save outputs
-high_quality_variants.to_csv('annotated_variants.csv', index=False)
+high_quality_variants.to_parquet('annotated_variants.parquet', compression='zstd', index=False)
 sample_burden.to_csv('sample_variant_burden.csv', index=False)
 gene_burden.to_csv('gene_level_burden.csv', index=False)
 pathway_burden.to_csv('pathway_analysis.csv', index=False)
@@ -1147,6 +1224,9 @@ geo_locations = pd.read_csv('geo_locations.csv')
 page_views['timestamp'] = pd.to_datetime(page_views['timestamp'])
 click_events['timestamp'] = pd.to_datetime(click_events['timestamp'])
 
+# Flag cart additions once, for the cart behavior aggregation below
+cart_events['is_add_to_cart'] = (cart_events['cart_action'] == 'add_to_cart').astype(np.int8)
+
 # Combine all events
 page_views['event_type'] = 'page_view'
 click_events['event_type'] = 'click'
@@ -1164,36 +1244,33 @@ all_events = pd.concat([
 
 all_events = all_events.sort_values(['session_id', 'timestamp'])
 
+# One 0/1 flag per counted event type: the session aggregation sums them in
+# Cython instead of building a value_counts() dict for every session
+all_events['is_page_view'] = (all_events['event_type'] == 'page_view').astype(np.int8)
+all_events['is_click'] = (all_events['event_type'] == 'click').astype(np.int8)
+all_events['is_search'] = (all_events['event_type'] == 'search').astype(np.int8)
+all_events['is_cart_add'] = (all_events['event_type'] == 'add_to_cart').astype(np.int8)
+
 # Session-level aggregations
 session_metrics = all_events.groupby('session_id').agg({
     'user_id': 'first',
     'timestamp': ['min', 'max', 'count'],
     'page_url': 'nunique',
-    'event_type': lambda x: x.value_counts().to_dict()
+    'is_page_view': 'sum',
+    'is_click': 'sum',
+    'is_search': 'sum',
+    'is_cart_add': 'sum'
 }).reset_index()
 
 session_metrics.columns = ['session_id', 'user_id', 'session_start',
-                            'session_end', 'total_events', 'unique_pages', 'event_breakdown']
+                            'session_end', 'total_events', 'unique_pages',
+                            'page_views', 'clicks', 'searches', 'cart_adds']
 
 # Calculate session duration
 session_metrics['session_duration_seconds'] = (
     session_metrics['session_end'] - session_metrics['session_start']
 ).dt.total_seconds()
 
-# Extract event counts
-session_metrics['page_views'] = session_metrics['event_breakdown'].apply(
-    lambda x: x.get('page_view', 0) if isinstance(x, dict) else 0
-)
-session_metrics['clicks'] = session_metrics['event_breakdown'].apply(
-    lambda x: x.get('click', 0) if isinstance(x, dict) else 0
-)
-session_metrics['searches'] = session_metrics['event_breakdown'].apply(
-    lambda x: x.get('search', 0) if isinstance(x, dict) else 0
-)
-session_metrics['cart_adds'] = session_metrics['event_breakdown'].apply(
-    lambda x: x.get('add_to_cart', 0) if isinstance(x, dict) else 0
-)
-
 # Calculate engagement metrics
 session_metrics['pages_per_minute'] = (
     session_metrics['unique_pages'] /
@@ -1218,17 +1295,19 @@ page_sequences['next_page'] = page_sequences.groupby('session_id')['page_url'].s
 page_transitions = page_sequences.groupby(['page_url', 'next_page']).size().reset_index(name='transition_count')
 page_transitions = page_transitions[page_transitions['next_page'].notna()]
 
-# Calculate exit rates per page
+# Calculate exit rates per page (a view is an exit when it has no next
+# page, so exits are the views minus the non-null next pages)
 page_stats = page_sequences.groupby('page_url').agg({
     'session_id': 'count',
-    'next_page': lambda x: x.isna().sum()
+    'next_page': 'count'
 }).reset_index()
-page_stats.columns = ['page_url', 'total_views', 'exits']
+page_stats.columns = ['page_url', 'total_views', 'continued_views']
+page_stats['exits'] = page_stats['total_views'] - page_stats['continued_views']
 page_stats['exit_rate'] = page_stats['exits'] / page_stats['total_views']
 
 # Analyze search behavior
 search_analysis = search_queries.groupby('session_id').agg({
-    'query': ['count', lambda x: ' | '.join(x)],
+    'query': ['count', ' | '.join],
     'results_count': ['mean', 'min'],
     'clicked_result': 'sum'
 }).reset_index()
@@ -1242,7 +1321,7 @@ search_analysis['search_success_rate'] = (
 cart_analysis = cart_events.groupby('session_id').agg({
     'product_id': 'nunique',
     'quantity': 'sum',
-    'cart_action': lambda x: (x == 'add_to_cart').sum()
+    'is_add_to_cart': 'sum'
 }).reset_index()
 cart_analysis.columns = ['session_id', 'unique_cart_products',
                           'total_cart_quantity', 'add_to_cart_events']
@@ -1306,7 +1385,7 @@ user_metrics['engagement_segment'] = pd.cut(
 )
 
 # Save outputs
-session_complete.to_csv('session_analytics.csv', index=False)
+session_complete.to_parquet('session_analytics.parquet', compression='zstd', index=False)
 user_metrics.to_csv('user_engagement_metrics.csv', index=False)
 page_stats.to_csv('page_performance.csv', index=False)
 page_transitions.to_csv('page_flow_analysis.csv', index=False)
@@ -1516,7 +1595,7 @@ portfolio_risk = pd.merge(portfolio_risk, historical_var, on='portfolio_id', how
 portfolio_risk = pd.merge(portfolio_risk, portfolio_sharpe, on='portfolio_id', how='left')
 
 # Save outputs
-positions_enriched.to_csv('positions_with_risk.csv', index=False)
+positions_enriched.to_parquet('positions_with_risk.parquet', compression='zstd', index=False)
 portfolio_risk.to_csv('portfolio_risk_summary.csv', index=False)
 sector_concentration.to_csv('sector_concentration.csv', index=False)
 country_concentration.to_csv('country_concentration.csv', index=False)
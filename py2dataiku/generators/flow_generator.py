@@ -348,6 +348,7 @@ class FlowGenerator(BaseFlowGenerator):
         elif ttype == TransformationType.TYPE_CAST:
             column = trans.columns[0] if trans.columns else "unknown"
             dtype = trans.parameters.get("dtype", "string")
+            dtype = PandasMapper.ASTYPE_MAPPINGS.get(str(dtype), dtype)
             return PrepareStep.set_type(column, dtype, trans.source_line)
 
         elif ttype == TransformationType.DATE_PARSE:
@@ -430,6 +431,13 @@ class FlowGenerator(BaseFlowGenerator):
                     },
                     source_line=trans.source_line,
                 )
+            if proc_name == "DateFormatter":
+                return PrepareStep.format_date(
+                    trans.parameters.get("column", ""),
+                    trans.parameters.get("format", ""),
+                    output_column=output_col,
+                    source_line=trans.source_line,
+                )
             if proc_name == "CategoricalEncoder":
                 return PrepareStep(
                     processor_type=ProcessorType.CATEGORICAL_ENCODER,
@@ -730,7 +738,12 @@ class FlowGenerator(BaseFlowGenerator):
         # Honor the variable name the user assigned to (target_dataframe).
         # When N WINDOW operations chain on the same variable they would
         # collide on a single auto-named output; disambiguate with the counter.
-        if trans.target_dataframe and trans.target_dataframe != input_dataset:
+        # In-place updates (df['x'] = df.groupby(...)...) also get the
+        # counter name, or the second one would write back to the source.
+        if trans.target_dataframe and trans.target_dataframe not in (
+            input_dataset,
+            trans.source_dataframe,
+        ):
             output_name = trans.target_dataframe
         else:
             output_name = f"{input_dataset}_windowed_{self.recipe_counter}"
@@ -740,8 +753,11 @@ class FlowGenerator(BaseFlowGenerator):
         method = trans.parameters.get("method", "")
         column = trans.columns[0] if trans.columns else ""
 
-        # Map pandas method to Dataiku window function type
-        window_func = PandasMapper.WINDOW_MAPPINGS.get(method, method.upper())
+        # Map pandas method to Dataiku window function type, unless the
+        # analyzer already resolved one (rolling / groupby-transform).
+        window_func = trans.parameters.get("window_function") or (
+            PandasMapper.WINDOW_MAPPINGS.get(method, method.upper())
+        )
 
         window_aggs = []
         if column:
@@ -1,11 +1,15 @@
 """LLM-based code analysis for py2dataiku."""
 
 from py2dataiku.llm.analyzer import LLMCodeAnalyzer
+from py2dataiku.llm.cache import FileCacheBackend, LLMCache, MemoryCacheBackend
 from py2dataiku.llm.providers import AnthropicProvider, LLMProvider, OpenAIProvider
 from py2dataiku.llm.schemas import AnalysisResult, DataStep
 
 __all__ = [
     "LLMCodeAnalyzer",
+    "LLMCache",
+    "MemoryCacheBackend",
+    "FileCacheBackend",
     "LLMProvider",
     "AnthropicProvider",
     "OpenAIProvider",
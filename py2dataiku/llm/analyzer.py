@@ -1,11 +1,23 @@
 """LLM-based Python code analyzer for py2dataiku."""
 
 import json
-from typing import Optional
+from typing import Callable, Optional
 
 from py2dataiku.exceptions import LLMResponseParseError
-from py2dataiku.llm.providers import LLMProvider, get_provider
-from py2dataiku.llm.schemas import AnalysisResult, DataStep, OperationType
+from py2dataiku.llm.providers import (
+    AnthropicProvider,
+    LLMProvider,
+    OpenAIProvider,
+    _extract_json,
+    get_provider,
+)
+from py2dataiku.llm.schemas import (
+    AnalysisResult,
+    DataStep,
+    OperationType,
+    _coerce_operation,
+)
+from py2dataiku.llm.step_stream import StepStreamParser
 from py2dataiku.mappings.processor_catalog import ProcessorCatalog
 
 
@@ -352,6 +364,27 @@ Be precise and thorough. Extract ALL operations, even implicit ones. When in dou
 # ProcessorCatalog so the prompt cannot drift away from the actual code.
 ANALYSIS_SYSTEM_PROMPT = _build_analysis_system_prompt()
 
+# Mirror the JSON-instruction wrapping that complete_json does so the raw
+# complete() path used for Anthropic/OpenAI matches existing behaviour.
+_JSON_SYSTEM_PROMPT = (
+    ANALYSIS_SYSTEM_PROMPT
+    + "\n\nYou must respond with valid JSON only. No other text."
+)
+
+
+# Shared by the single-snippet and batched user prompts so the two cannot
+# drift apart on which fields the model must emit.
+_ANALYSIS_FIELDS = """Required top-level JSON fields:
+- ``code_summary`` (string): one-line description of the whole pipeline.
+- ``total_operations`` (int): count of steps you emit.
+- ``complexity_score`` (int 1-10): your subjective complexity rating.
+- ``datasets`` (array): each dataset (input, intermediate, output) with ``name``, ``source``, ``is_input``, ``is_output``, optional ``inferred_columns``.
+- ``steps`` (array): one entry per data operation. See the system prompt for the per-step schema and worked examples.
+- ``recommendations`` (array of strings): optimization hints (may be empty).
+- ``warnings`` (array of strings): caveats or skipped lines (may be empty).
+
+Per-step required fields: ``step_number``, ``operation``, ``description``. Add the operation-specific fields (``filter_conditions``, ``aggregations``, ``group_by_columns``, ``join_conditions``, ``join_type``, ``column_transforms``, ``rename_mapping``, ``sort_columns``, ``columns``, ``fill_value``) only when they apply. Always include ``suggested_recipe`` and (when the recipe is ``prepare``) ``suggested_processors`` with canonical names from the catalog."""
+
 
 def get_analysis_prompt(code: str) -> str:
     """Generate the analysis prompt for given code.
@@ -364,16 +397,7 @@ def get_analysis_prompt(code: str) -> str:
     """
     return f"""Analyze the following Python code and extract every data manipulation step.
 
-Required top-level JSON fields:
-- ``code_summary`` (string): one-line description of the whole pipeline.
-- ``total_operations`` (int): count of steps you emit.
-- ``complexity_score`` (int 1-10): your subjective complexity rating.
-- ``datasets`` (array): each dataset (input, intermediate, output) with ``name``, ``source``, ``is_input``, ``is_output``, optional ``inferred_columns``.
-- ``steps`` (array): one entry per data operation. See the system prompt for the per-step schema and worked examples.
-- ``recommendations`` (array of strings): optimization hints (may be empty).
-- ``warnings`` (array of strings): caveats or skipped lines (may be empty).
-
-Per-step required fields: ``step_number``, ``operation``, ``description``. Add the operation-specific fields (``filter_conditions``, ``aggregations``, ``group_by_columns``, ``join_conditions``, ``join_type``, ``column_transforms``, ``rename_mapping``, ``sort_columns``, ``columns``, ``fill_value``) only when they apply. Always include ``suggested_recipe`` and (when the recipe is ``prepare``) ``suggested_processors`` with canonical names from the catalog.
+{_ANALYSIS_FIELDS}
 
 Python Code to Analyze:
 ```python
@@ -383,6 +407,59 @@ Python Code to Analyze:
 Respond with ONLY the JSON object — no markdown fences, no commentary."""
 
 
+def get_batch_analysis_prompt(codes: list[str]) -> str:
+    """Generate one analysis prompt covering several independent snippets.
+
+    Each snippet is wrapped in ``<<<SNIPPET i>>>`` delimiters and the model is
+    asked for a ``{"results": [...]}`` object holding one analysis per
+    snippet, in order. An object (rather than a bare array) keeps the
+    response compatible with OpenAI's JSON mode.
+    """
+    blocks = "\n\n".join(
+        f"<<<SNIPPET {i}>>>\n```python\n{code}\n```\n<<<END SNIPPET {i}>>>"
+        for i, code in enumerate(codes, 1)
+    )
+    return f"""Analyze each of the {len(codes)} independent Python snippets below and extract every data manipulation step. Treat each snippet on its own: datasets and steps never carry over between snippets.
+
+Respond with a JSON object ``{{"results": [...]}}`` whose ``results`` array has exactly {len(codes)} entries, one per snippet in snippet order. Each entry is a complete analysis object.
+
+{_ANALYSIS_FIELDS}
+
+{blocks}
+
+Respond with ONLY the JSON object — no markdown fences, no commentary."""
+
+
+def _bin_snippets(
+    codes: list[str],
+    max_batch_size: int,
+    max_batch_tokens: int,
+) -> list[list[int]]:
+    """Pack snippet indices into batches with first-fit-decreasing.
+
+    Token cost is estimated as ``len(code) // 4``. Snippets are placed
+    largest-first into the first batch with room left, so each batch stays
+    under ``max_batch_tokens`` and ``max_batch_size``. A snippet that alone
+    exceeds the token budget gets a batch to itself.
+    """
+    order = sorted(range(len(codes)), key=lambda i: len(codes[i]), reverse=True)
+    bins: list[list[int]] = []
+    loads: list[int] = []
+    for i in order:
+        cost = len(codes[i]) // 4
+        for b, members in enumerate(bins):
+            if len(members) < max_batch_size and loads[b] + cost <= max_batch_tokens:
+                members.append(i)
+                loads[b] += cost
+                break
+        else:
+            bins.append([i])
+            loads.append(cost)
+    for members in bins:
+        members.sort()
+    return bins
+
+
 class LLMCodeAnalyzer:
     """
     Analyze Python code using an LLM to extract data manipulation steps.
@@ -429,20 +506,9 @@ class LLMCodeAnalyzer:
             # capture LLMResponse.usage and surface it on the AnalysisResult.
             # The MockProvider returns mock JSON that doesn't go through the
             # real-LLM path, so fall back to complete_json there.
-            from py2dataiku.llm.providers import (
-                AnthropicProvider,
-                OpenAIProvider,
-                _extract_json,
-            )
-            if isinstance(self.provider, (AnthropicProvider, OpenAIProvider)):
-                # Mirror the JSON-instruction wrapping that complete_json does
-                # so behaviour matches existing tests.
-                json_system = (ANALYSIS_SYSTEM_PROMPT or "") + (
-                    "\n\nYou must respond with valid JSON only. No other text."
-                )
-                llm_response = self.provider.complete(prompt, json_system)
-                json_text = _extract_json(llm_response.content)
-                response_data = json.loads(json_text)
+            if self._uses_raw_completion():
+                llm_response = self.provider.complete(prompt, _JSON_SYSTEM_PROMPT)
+                response_data = json.loads(_extract_json(llm_response.content))
                 usage = llm_response.usage
             else:
                 # MockProvider / custom provider — keep the old contract.
@@ -452,18 +518,179 @@ class LLMCodeAnalyzer:
                 )
                 usage = None
 
-            result = AnalysisResult.from_dict(response_data)
-            result.model_used = self.provider.model_name
-            result.usage = usage
-            result.raw_response = json.dumps(response_data)
+            return self._build_result(response_data, usage)
 
-            # Post-process to ensure consistency
-            result = self._post_process(result)
+        except json.JSONDecodeError as e:
+            raise LLMResponseParseError(f"Failed to parse LLM response as JSON: {e}") from e
 
-            return result
+    async def analyze_async(self, code: str) -> AnalysisResult:
+        """
+        Asynchronous counterpart of :meth:`analyze`.
+
+        Awaits the provider's :meth:`~LLMProvider.complete_async` so many
+        analyses can be in flight on one event loop. Prompt, parsing and
+        post-processing are identical to :meth:`analyze`.
+
+        Args:
+            code: Python source code to analyze
+
+        Returns:
+            AnalysisResult containing all extracted steps and metadata
+        """
+        import asyncio
 
+        prompt = get_analysis_prompt(code)
+
+        try:
+            if self._uses_raw_completion():
+                llm_response = await self.provider.complete_async(
+                    prompt, _JSON_SYSTEM_PROMPT
+                )
+                response_data = json.loads(_extract_json(llm_response.content))
+                usage = llm_response.usage
+            else:
+                response_data = await asyncio.to_thread(
+                    self.provider.complete_json,
+                    prompt=prompt,
+                    system_prompt=ANALYSIS_SYSTEM_PROMPT,
+                )
+                usage = None
+
+            return self._build_result(response_data, usage)
+
+        except json.JSONDecodeError as e:
+            raise LLMResponseParseError(f"Failed to parse LLM response as JSON: {e}") from e
+
+    def analyze_streaming(
+        self,
+        code: str,
+        on_step: Optional[Callable[[DataStep], None]] = None,
+    ) -> AnalysisResult:
+        """
+        Analyze code over a streamed LLM response, surfacing steps early.
+
+        The response is read through the provider's
+        :meth:`~LLMProvider.stream_complete`. Each entry of the ``steps``
+        array is decoded as soon as its closing brace arrives and handed to
+        ``on_step``, so interactive callers can show progress long before
+        the full response has been received. Once the stream ends the
+        complete JSON is parsed and post-processed exactly as in
+        :meth:`analyze`.
+
+        Args:
+            code: Python source code to analyze
+            on_step: Optional callback receiving each ``DataStep`` as it
+                arrives. Steps are passed as parsed, before post-processing
+                (numbering and recipe inference happen on the final result).
+
+        Returns:
+            AnalysisResult containing all extracted steps and metadata.
+            ``usage`` is ``None`` because streamed responses do not report
+            token counts through this path.
+        """
+        prompt = get_analysis_prompt(code)
+        parser = StepStreamParser()
+
+        for delta in self.provider.stream_complete(prompt, _JSON_SYSTEM_PROMPT):
+            for step_data in parser.feed(delta):
+                if on_step is not None:
+                    on_step(DataStep.from_dict(step_data))
+
+        try:
+            response_data = json.loads(_extract_json(parser.text))
         except json.JSONDecodeError as e:
             raise LLMResponseParseError(f"Failed to parse LLM response as JSON: {e}") from e
+        return self._build_result(response_data, None)
+
+    def analyze_batch(
+        self,
+        codes: list[str],
+        max_batch_size: int = 8,
+        max_batch_tokens: int = 24_000,
+    ) -> list[AnalysisResult]:
+        """
+        Analyze several independent snippets with as few LLM calls as possible.
+
+        Snippets are packed into batches (see :func:`_bin_snippets`) and each
+        batch is sent as one prompt, amortizing request latency and prompt
+        prefill across its snippets. If a batched response cannot be parsed
+        or does not contain one result per snippet (for example because the
+        output hit ``max_tokens``), that batch is re-run one snippet at a
+        time with :meth:`analyze`.
+
+        Args:
+            codes: Python source snippets to analyze
+            max_batch_size: Maximum number of snippets per LLM call
+            max_batch_tokens: Estimated input-token budget per LLM call
+                (``len(code) // 4`` per snippet)
+
+        Returns:
+            One AnalysisResult per snippet, in input order. A batch's token
+            ``usage`` is attached to its first result only, so summing
+            ``usage`` across the list gives the true total.
+        """
+        results: list[Optional[AnalysisResult]] = [None] * len(codes)
+        for indices in _bin_snippets(codes, max_batch_size, max_batch_tokens):
+            batch = [codes[i] for i in indices]
+            if len(batch) == 1:
+                batch_results = [self.analyze(batch[0])]
+            else:
+                batch_results = self._analyze_one_batch(batch)
+            for i, result in zip(indices, batch_results):
+                results[i] = result
+        return results  # type: ignore[return-value]
+
+    def _analyze_one_batch(self, batch: list[str]) -> list[AnalysisResult]:
+        """Send one batched prompt, falling back to per-snippet calls."""
+        prompt = get_batch_analysis_prompt(batch)
+        try:
+            if self._uses_raw_completion():
+                llm_response = self.provider.complete(prompt, _JSON_SYSTEM_PROMPT)
+                response_data = json.loads(_extract_json(llm_response.content))
+                usage = llm_response.usage
+            else:
+                response_data = self.provider.complete_json(
+                    prompt=prompt,
+                    system_prompt=ANALYSIS_SYSTEM_PROMPT,
+                )
+                usage = None
+        except json.JSONDecodeError:
+            return [self.analyze(code) for code in batch]
+
+        entries = response_data.get("results") if isinstance(response_data, dict) else None
+        if (
+            not isinstance(entries, list)
+            or len(entries) != len(batch)
+            or not all(isinstance(entry, dict) for entry in entries)
+        ):
+            return [self.analyze(code) for code in batch]
+
+        results = [self._build_result(entry, None) for entry in entries]
+        results[0].usage = usage
+        return results
+
+    def _uses_raw_completion(self) -> bool:
+        """Whether the provider goes through ``complete()`` to expose usage."""
+        from py2dataiku.llm.cache import CachingProvider
+
+        provider = self.provider
+        if isinstance(provider, CachingProvider):
+            provider = provider.provider
+        return isinstance(provider, (AnthropicProvider, OpenAIProvider))
+
+    def _build_result(
+        self,
+        response_data: dict,
+        usage: Optional[dict],
+    ) -> AnalysisResult:
+        """Turn a parsed LLM JSON payload into a post-processed AnalysisResult."""
+        result = AnalysisResult.from_dict(response_data)
+        result.model_used = self.provider.model_name
+        result.usage = usage
+        result.raw_response = json.dumps(response_data)
+
+        # Post-process to ensure consistency
+        return self._post_process(result)
 
     def analyze_with_context(
         self,
@@ -515,10 +742,7 @@ class LLMCodeAnalyzer:
         # Validate operation types
         for step in result.steps:
             if isinstance(step.operation, str):
-                try:
-                    step.operation = OperationType(step.operation)
-                except ValueError:
-                    step.operation = OperationType.UNKNOWN
+                step.operation = _coerce_operation(step.operation)
 
         # Add default suggestions if missing
         for step in result.steps:
@@ -0,0 +1,240 @@
+"""Client-side cache of LLM completions.
+
+Converting the same script twice with ``temperature=0`` sends the same
+prompt twice and pays for both. :class:`LLMCache` keys each completion on a
+SHA-256 of the provider, model, sampling settings, system prompt and prompt,
+and :meth:`LLMCache.wrap` returns a provider that answers repeated requests
+from the cache instead of the API::
+
+    cache = LLMCache(FileCacheBackend())
+    provider = cache.wrap(get_provider("anthropic"))
+    analyzer = LLMCodeAnalyzer(provider=provider)
+
+Only deterministic requests (temperature ``0``) are cached; sampling at a
+higher temperature is a request for run-to-run variation. Matching is
+exact; near-duplicate prompts are separate entries.
+"""
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Optional, Protocol
+
+from py2dataiku.llm.providers import LLMProvider, LLMResponse
+
+
+class CacheBackend(Protocol):
+    """Storage used by :class:`LLMCache`."""
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Return the entry stored under ``key``, or ``None``."""
+        ...
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        """Store ``entry`` (a JSON-serializable dict) under ``key``."""
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process backend; entries last for the lifetime of the object."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        return self._entries.get(key)
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        self._entries[key] = entry
+
+
+class FileCacheBackend:
+    """
+    One JSON file per entry under ``directory``.
+
+    Defaults to the ``llm`` subdirectory of the py2dataiku cache root (see
+    :func:`py2dataiku.config.cache_dir`). Unreadable entries are treated as
+    missing and write failures are ignored.
+    """
+
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        if directory is None:
+            from py2dataiku.config import cache_dir
+
+            directory = cache_dir("llm")
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, entry: dict[str, Any]) -> None:
+        import tempfile
+
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            pass
+
+
+class LLMCache:
+    """
+    Cache of LLM completions with hit/miss accounting.
+
+    Attributes:
+        backend: Where entries are stored (in memory by default).
+        hits: Number of requests answered from the cache.
+        misses: Number of cacheable requests sent to the provider.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None) -> None:
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counts as ``{"hits": int, "misses": int}``."""
+        return {"hits": self.hits, "misses": self.misses}
+
+    def wrap(self, provider: LLMProvider) -> "CachingProvider":
+        """Return ``provider`` with its completions served through this cache."""
+        return CachingProvider(provider, self)
+
+    @staticmethod
+    def key(
+        provider: LLMProvider, prompt: str, system_prompt: Optional[str]
+    ) -> Optional[str]:
+        """
+        Return the cache key for a request, or ``None`` if it is not cacheable.
+
+        Requests are cacheable only when the provider samples at
+        temperature ``0``.
+        """
+        import hashlib
+
+        temperature = getattr(provider, "temperature", 0.0)
+        if temperature:
+            return None
+        payload = json.dumps(
+            {
+                "provider": type(provider).__name__,
+                "model": provider.model_name,
+                "temperature": temperature,
+                "max_tokens": getattr(provider, "max_tokens", None),
+                "system": system_prompt,
+                "prompt": prompt,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: Optional[str]) -> Optional[LLMResponse]:
+        """Return the cached response for ``key`` and count the hit or miss."""
+        if key is None:
+            return None
+        entry = self.backend.get(key)
+        if not isinstance(entry, dict) or "content" not in entry:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return LLMResponse(content=entry["content"], model=entry.get("model", ""))
+
+    def store(self, key: Optional[str], response: LLMResponse) -> None:
+        """Save ``response`` under ``key`` (no-op for uncacheable requests)."""
+        if key is not None:
+            self.backend.set(key, {"content": response.content, "model": response.model})
+
+
+class CachingProvider(LLMProvider):
+    """
+    Provider wrapper that answers repeated requests from an :class:`LLMCache`.
+
+    Responses served from the cache carry ``usage=None`` since no tokens
+    were spent on them.
+    """
+
+    def __init__(self, provider: LLMProvider, cache: LLMCache) -> None:
+        self.provider = provider
+        self.cache = cache
+
+    @property
+    def model_name(self) -> str:
+        return self.provider.model_name
+
+    @property
+    def temperature(self) -> float:
+        return getattr(self.provider, "temperature", 0.0)
+
+    def complete(self, prompt: str, system_prompt: Optional[str] = None) -> LLMResponse:
+        key = LLMCache.key(self.provider, prompt, system_prompt)
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            return cached
+        response = self.provider.complete(prompt, system_prompt)
+        self.cache.store(key, response)
+        return response
+
+    async def complete_async(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> LLMResponse:
+        key = LLMCache.key(self.provider, prompt, system_prompt)
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            return cached
+        response = await self.provider.complete_async(prompt, system_prompt)
+        self.cache.store(key, response)
+        return response
+
+    def complete_json(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> dict[str, Any]:
+        # Cache the provider's JSON call under its own key: providers add
+        # their own JSON instructions, so it differs from complete().
+        key = LLMCache.key(self.provider, prompt, f"[json]{system_prompt}")
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            return json.loads(cached.content)
+        data = self.provider.complete_json(prompt, system_prompt)
+        self.cache.store(
+            key, LLMResponse(content=json.dumps(data), model=self.provider.model_name)
+        )
+        return data
+
+    def stream_complete(  # type: ignore[override]
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        *,
+        chunk_size: int = 24,
+    ) -> Iterator[str]:
+        key = LLMCache.key(self.provider, prompt, system_prompt)
+        cached = self.cache.lookup(key)
+        if cached is not None:
+            yield cached.content
+            return
+        deltas = []
+        for delta in self.provider.stream_complete(
+            prompt, system_prompt, chunk_size=chunk_size
+        ):
+            deltas.append(delta)
+            yield delta
+        self.cache.store(
+            key, LLMResponse(content="".join(deltas), model=self.provider.model_name)
+        )
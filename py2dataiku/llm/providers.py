@@ -57,6 +57,20 @@ class LLMProvider(ABC):
         """Get the model name."""
         pass
 
+    async def complete_async(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> LLMResponse:
+        """Send a completion request without blocking the event loop.
+
+        Default implementation: run the synchronous :meth:`complete` on a
+        worker thread, so any provider (including ``MockProvider`` and
+        third-party subclasses) can be awaited. Anthropic and OpenAI
+        override this with their SDK's native async client.
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.complete, prompt, system_prompt)
+
     # ------------------------------------------------------------------
     # Streaming
     # ------------------------------------------------------------------
@@ -164,6 +178,7 @@ class AnthropicProvider(LLMProvider):
         # ephemeral-cache state on the server side.
         self.disable_cache = disable_cache
         self._client = None
+        self._async_client = None
 
     @property
     def client(self):
@@ -181,6 +196,22 @@ class AnthropicProvider(LLMProvider):
                 ) from e
         return self._client
 
+    @property
+    def async_client(self):
+        """Lazy initialization of the async Anthropic client."""
+        if self._async_client is None:
+            try:
+                import anthropic
+                kwargs: dict[str, Any] = {"api_key": self.api_key, "max_retries": self.max_retries}
+                if self.timeout is not None:
+                    kwargs["timeout"] = self.timeout
+                self._async_client = anthropic.AsyncAnthropic(**kwargs)
+            except ImportError as e:
+                raise ImportError(
+                    "anthropic package required. Install with: pip install anthropic"
+                ) from e
+        return self._async_client
+
     def complete(self, prompt: str, system_prompt: Optional[str] = None) -> LLMResponse:
         """Send a completion request to Claude.
 
@@ -192,6 +223,28 @@ class AnthropicProvider(LLMProvider):
         sessions. Set ``disable_cache=True`` on the provider to fall back to
         the legacy string form (e.g. for tests).
         """
+        response = self.client.messages.create(
+            **self._request_kwargs(prompt, system_prompt)
+        )
+        return self._to_llm_response(response)
+
+    async def complete_async(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> LLMResponse:
+        """Send a completion request to Claude via ``anthropic.AsyncAnthropic``.
+
+        Request shape (including the cached system block) is identical to
+        :meth:`complete`; only the transport is asynchronous.
+        """
+        response = await self.async_client.messages.create(
+            **self._request_kwargs(prompt, system_prompt)
+        )
+        return self._to_llm_response(response)
+
+    def _request_kwargs(
+        self, prompt: str, system_prompt: Optional[str]
+    ) -> dict[str, Any]:
+        """Build the ``messages.create`` / ``messages.stream`` keyword args."""
         messages = [{"role": "user", "content": prompt}]
 
         kwargs: dict[str, Any] = {
@@ -211,9 +264,11 @@ class AnthropicProvider(LLMProvider):
                         "cache_control": {"type": "ephemeral"},
                     }
                 ]
+        return kwargs
 
-        response = self.client.messages.create(**kwargs)
-
+    @staticmethod
+    def _to_llm_response(response: Any) -> LLMResponse:
+        """Convert an Anthropic ``Message`` into an :class:`LLMResponse`."""
         return LLMResponse(
             content=response.content[0].text,
             model=response.model,
@@ -258,24 +313,7 @@ class AnthropicProvider(LLMProvider):
         parity with the base class but is ignored — token boundaries are
         whatever the SDK produces.
         """
-        messages = [{"role": "user", "content": prompt}]
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "max_tokens": self.max_tokens,
-            "messages": messages,
-            "temperature": self.temperature,
-        }
-        if system_prompt:
-            if self.disable_cache:
-                kwargs["system"] = system_prompt
-            else:
-                kwargs["system"] = [
-                    {
-                        "type": "text",
-                        "text": system_prompt,
-                        "cache_control": {"type": "ephemeral"},
-                    }
-                ]
+        kwargs = self._request_kwargs(prompt, system_prompt)
 
         # ``messages.stream`` is a context manager that wraps the HTTP
         # request and exposes the granular ``text_stream`` iterator.
@@ -339,6 +377,7 @@ class OpenAIProvider(LLMProvider):
         self.temperature = temperature
         self.seed = seed
         self._client = None
+        self._async_client = None
 
     @property
     def client(self):
@@ -356,8 +395,42 @@ class OpenAIProvider(LLMProvider):
                 ) from e
         return self._client
 
+    @property
+    def async_client(self):
+        """Lazy initialization of the async OpenAI client."""
+        if self._async_client is None:
+            try:
+                import openai
+                kwargs: dict[str, Any] = {"api_key": self.api_key, "max_retries": self.max_retries}
+                if self.timeout is not None:
+                    kwargs["timeout"] = self.timeout
+                self._async_client = openai.AsyncOpenAI(**kwargs)
+            except ImportError as e:
+                raise ImportError(
+                    "openai package required. Install with: pip install openai"
+                ) from e
+        return self._async_client
+
     def complete(self, prompt: str, system_prompt: Optional[str] = None) -> LLMResponse:
         """Send a completion request to GPT."""
+        response = self.client.chat.completions.create(
+            **self._request_kwargs(prompt, system_prompt)
+        )
+        return self._to_llm_response(response)
+
+    async def complete_async(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> LLMResponse:
+        """Send a completion request to GPT via ``openai.AsyncOpenAI``."""
+        response = await self.async_client.chat.completions.create(
+            **self._request_kwargs(prompt, system_prompt)
+        )
+        return self._to_llm_response(response)
+
+    def _request_kwargs(
+        self, prompt: str, system_prompt: Optional[str]
+    ) -> dict[str, Any]:
+        """Build the ``chat.completions.create`` keyword args."""
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
@@ -371,9 +444,11 @@ class OpenAIProvider(LLMProvider):
         }
         if self.seed is not None:
             kwargs["seed"] = self.seed
+        return kwargs
 
-        response = self.client.chat.completions.create(**kwargs)
-
+    @staticmethod
+    def _to_llm_response(response: Any) -> LLMResponse:
+        """Convert a ``ChatCompletion`` into an :class:`LLMResponse`."""
         return LLMResponse(
             content=response.choices[0].message.content,
             model=response.model,
@@ -67,6 +67,24 @@ class OperationType(Enum):
     UNKNOWN = "unknown"
 
 
+# Built once per process: a plain dict lookup is far cheaper than calling the
+# Enum (which raises and catches ValueError for every unrecognised value).
+_OPERATIONS_BY_VALUE: dict[str, OperationType] = {op.value: op for op in OperationType}
+
+
+def _coerce_operation(value: Any) -> OperationType:
+    """Map an LLM-reported operation string to ``OperationType``.
+
+    Members pass through unchanged; unrecognised or non-string values
+    become ``OperationType.UNKNOWN``.
+    """
+    if isinstance(value, OperationType):
+        return value
+    if not isinstance(value, str):
+        return OperationType.UNKNOWN
+    return _OPERATIONS_BY_VALUE.get(value, OperationType.UNKNOWN)
+
+
 def _coerce_confidence(value: Any) -> Optional[float]:
     """Coerce an LLM-reported confidence value into [0.0, 1.0] or None.
 
@@ -222,13 +240,9 @@ class DataStep:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "DataStep":
         """Create from dictionary (LLM response)."""
-        try:
-            operation = OperationType(data.get("operation", "unknown"))
-        except ValueError:
-            operation = OperationType.UNKNOWN
         return cls(
             step_number=data.get("step_number", 0),
-            operation=operation,
+            operation=_coerce_operation(data.get("operation", "unknown")),
             description=data.get("description", ""),
             input_datasets=data.get("input_datasets", []),
             output_dataset=data.get("output_dataset"),
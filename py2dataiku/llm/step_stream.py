@@ -0,0 +1,103 @@
+"""Incremental extraction of analysis steps from a streamed LLM response."""
+
+import json
+from typing import Any
+
+
+class StepStreamParser:
+    """
+    Pull completed ``steps`` entries out of a partially received JSON object.
+
+    Feed text deltas as they arrive; each call returns the step objects
+    (as dicts) whose closing brace was seen in that delta. Only the
+    top-level ``"steps"`` array is tracked, so a ``"steps"`` key nested
+    elsewhere (or appearing inside a string) is ignored. Text before the
+    first ``{`` — such as a markdown code fence — is skipped.
+
+    The full text is kept in :attr:`text` so the caller can parse the
+    complete response once the stream ends.
+
+    Example:
+        >>> parser = StepStreamParser()
+        >>> parser.feed('{"steps": [{"step_number": 1}, {"step')
+        [{'step_number': 1}]
+        >>> parser.feed('_number": 2}]}')
+        [{'step_number': 2}]
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._step_parts: list[str] = []  # text of the step being read
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key_chars: list[str] = []  # current string, tracked at depth 1
+        self._last_key = None  # last string completed at depth 1
+        self._in_steps = False
+        self._in_step = False
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._chunks)
+
+    def feed(self, delta: str) -> list[dict[str, Any]]:
+        """Consume ``delta`` and return any step objects it completed."""
+        self._chunks.append(delta)
+        completed: list[dict[str, Any]] = []
+        step_start = 0
+
+        for i, ch in enumerate(delta):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = "".join(self._key_chars)
+                elif self._depth == 1:
+                    self._key_chars.append(ch)
+                continue
+
+            if ch == '"':
+                if self._depth > 0:
+                    self._in_string = True
+                    self._key_chars = []
+            elif ch == "{" or ch == "[":
+                if ch == "[" and self._depth == 1 and self._last_key == "steps":
+                    self._in_steps = True
+                elif ch == "{" and self._in_steps and self._depth == 2:
+                    self._in_step = True
+                    self._step_parts = []
+                    step_start = i
+                self._depth += 1
+            elif ch == "}" or ch == "]":
+                if self._depth == 0:
+                    continue
+                self._depth -= 1
+                if self._in_step and self._depth == 2:
+                    self._in_step = False
+                    self._step_parts.append(delta[step_start:i + 1])
+                    step = self._parse_step("".join(self._step_parts))
+                    if step is not None:
+                        completed.append(step)
+                elif self._in_steps and self._depth == 1:
+                    self._in_steps = False
+            elif ch == "," and self._depth == 1:
+                # The string before a top-level comma was a value, not a key.
+                self._last_key = None
+
+        if self._in_step:
+            self._step_parts.append(delta[step_start:])
+        return completed
+
+    @staticmethod
+    def _parse_step(text: str):
+        """Decode one step object, or ``None`` if it is not a JSON object."""
+        try:
+            step = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        return step if isinstance(step, dict) else None
@@ -93,6 +93,7 @@ class PandasMapper:
         "var": "VAR",
         "median": "MEDIAN",
         "nunique": "COUNTD",
+        "unique": "COLLECT_SET",
     }
 
     # Join type mappings
@@ -162,21 +163,7 @@ class PandasMapper:
 
     def map_astype(self, column: str, dtype: str) -> PrepareStep:
         """Map astype() to a PrepareStep."""
-        type_map = {
-            "int": "bigint",
-            "int64": "bigint",
-            "int32": "int",
-            "float": "double",
-            "float64": "double",
-            "str": "string",
-            "string": "string",
-            "object": "string",
-            "bool": "boolean",
-            "boolean": "boolean",
-            "datetime64": "date",
-            "datetime64[ns]": "date",
-        }
-        dataiku_type = type_map.get(str(dtype), "string")
+        dataiku_type = self.ASTYPE_MAPPINGS.get(str(dtype), "string")
         return PrepareStep.set_type(column, dataiku_type)
 
     def map_string_method(
@@ -247,6 +234,25 @@ class PandasMapper:
 
         return None
 
+    # pandas astype() dtype to DSS storage type
+    ASTYPE_MAPPINGS: dict[str, str] = {
+        "int": "bigint",
+        "int64": "bigint",
+        "int32": "int",
+        "int16": "smallint",
+        "int8": "tinyint",
+        "float": "double",
+        "float64": "double",
+        "float32": "float",
+        "str": "string",
+        "string": "string",
+        "object": "string",
+        "bool": "boolean",
+        "boolean": "boolean",
+        "datetime64": "date",
+        "datetime64[ns]": "date",
+    }
+
     # Window function mappings (pandas methods that map to Dataiku WINDOW recipe)
     WINDOW_MAPPINGS: dict[str, str] = {
         "cumsum": "RUNNING_SUM",
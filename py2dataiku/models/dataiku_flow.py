@@ -5,8 +5,6 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 
-import yaml
-
 from py2dataiku.models.dataiku_dataset import DataikuDataset, DatasetType
 from py2dataiku.models.dataiku_recipe import DataikuRecipe, RecipeType
 from py2dataiku.models.flow_graph import FlowGraph
@@ -139,7 +137,10 @@ class DataikuFlow:
 
     def _dataset_exists(self, name: str) -> bool:
         """Check if a dataset exists."""
-        return any(ds.name == name for ds in self.datasets)
+        for ds in self.datasets:
+            if ds.name == name:
+                return True
+        return False
 
     @property
     def input_datasets(self) -> list[DataikuDataset]:
@@ -161,13 +162,21 @@ class DataikuFlow:
     def add_recipe(self, recipe: DataikuRecipe) -> None:
         """Add a recipe to the flow."""
         self.recipes.append(recipe)
-        # Ensure all input/output datasets exist
+        # Ensure all input/output datasets exist. Snapshot the names once
+        # rather than scanning self.datasets per input/output. The set is
+        # local to this call because ``datasets`` is a public list that
+        # callers (e.g. the optimizer) edit directly.
+        existing = {ds.name for ds in self.datasets}
         for inp in recipe.inputs:
-            if not self._dataset_exists(inp):
-                self.add_dataset(DataikuDataset(name=inp, dataset_type=DatasetType.INPUT))
+            if inp not in existing:
+                self.datasets.append(DataikuDataset(name=inp, dataset_type=DatasetType.INPUT))
+                existing.add(inp)
         for out in recipe.outputs:
-            if not self._dataset_exists(out):
-                self.add_dataset(DataikuDataset(name=out, dataset_type=DatasetType.INTERMEDIATE))
+            if out not in existing:
+                self.datasets.append(
+                    DataikuDataset(name=out, dataset_type=DatasetType.INTERMEDIATE)
+                )
+                existing.add(out)
 
     def get_recipe(self, name: str) -> Optional[DataikuRecipe]:
         """Get a recipe by name."""
@@ -570,15 +579,21 @@ class DataikuFlow:
         Returns:
             A new ``DataikuFlow`` instance.
         """
-        return cls.from_dict(yaml.safe_load(yaml_str))
+        from py2dataiku.utils.serialization import load_yaml
+
+        return cls.from_dict(load_yaml(yaml_str))
 
     def to_yaml(self) -> str:
         """Convert to YAML string."""
-        return yaml.dump(self.to_dict(), default_flow_style=False, sort_keys=False)
+        from py2dataiku.utils.serialization import dumps_yaml
+
+        return dumps_yaml(self.to_dict(), sort_keys=False)
 
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        from py2dataiku.utils.serialization import dumps_json
+
+        return dumps_json(self.to_dict(), indent=indent)
 
     def to_recipe_configs(self) -> list[dict[str, Any]]:
         """Get Dataiku API-compatible recipe configurations.
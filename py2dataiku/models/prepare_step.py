@@ -487,6 +487,24 @@ class PrepareStep:
             source_line=source_line,
         )
 
+    @classmethod
+    def format_date(
+        cls,
+        column: str,
+        date_format: str,
+        output_column: Optional[str] = None,
+        source_line: Optional[int] = None,
+    ) -> "PrepareStep":
+        """Create a DateFormatter step (``date_format`` is a Java date pattern)."""
+        params = {"column": column, "format": date_format}
+        if output_column:
+            params["outputColumn"] = output_column
+        return cls(
+            processor_type=ProcessorType.DATE_FORMATTER,
+            params=params,
+            source_line=source_line,
+        )
+
     @classmethod
     def filter_on_value(
         cls,
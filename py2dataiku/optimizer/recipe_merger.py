@@ -82,7 +82,9 @@ class RecipeMerger:
         Optimize the order of Prepare steps for efficiency.
 
         Rules:
-        1. Column deletions should come first (reduce data early)
+        1. Column deletions should come first (reduce data early), unless
+           an earlier step creates or reads a deleted column; keep-mode
+           column selections stay in place
         2. Type conversions before operations that depend on them
         3. Filters/row removals early to reduce row count
         4. Column renames last (to avoid breaking references)
@@ -96,8 +98,10 @@ class RecipeMerger:
 
         from py2dataiku.models.prepare_step import ProcessorType
 
-        for step in steps:
-            if step.processor_type == ProcessorType.COLUMN_DELETER:
+        for i, step in enumerate(steps):
+            if step.processor_type == ProcessorType.COLUMN_DELETER and _can_hoist_deletion(
+                step, steps[:i]
+            ):
                 deletions.append(step)
             elif step.processor_type == ProcessorType.TYPE_SETTER:
                 type_setters.append(step)
@@ -145,3 +149,21 @@ class RecipeMerger:
             optimized.append(step)
 
         return optimized
+
+
+def _can_hoist_deletion(step: PrepareStep, earlier: list[PrepareStep]) -> bool:
+    """Check whether a ColumnsSelector step may move ahead of ``earlier``.
+
+    Keep-mode selections stay in place, and a removal cannot move above a
+    step that creates or reads a removed column. Names are matched quoted
+    in the step params, so both ``{"column": "x"}`` and GREL ``val("x")``
+    count.
+    """
+    if step.params.get("keep") or step.params.get("mode") == "keep":
+        return False
+    columns = step.params.get("columns", [])
+    for other in earlier:
+        text = repr(other.params)
+        if any(f"'{col}'" in text or f'"{col}"' in text for col in columns):
+            return False
+    return True
@@ -17,6 +17,22 @@ class CodeAnalyzer:
     like pandas DataFrame operations, merges, groupby, etc.
     """
 
+    # Pandas aggregation names -> DSS window function names, shared by
+    # rolling().<agg>() and groupby()[col].transform('<agg>').
+    _WINDOW_FUNCTION_NAMES = {
+        "sum": "SUM",
+        "mean": "AVG",
+        "count": "COUNT",
+        "size": "COUNT",
+        "min": "MIN",
+        "max": "MAX",
+        "std": "STDDEV",
+        "var": "VAR",
+    }
+
+    # astype() targets that only change pandas' in-memory representation.
+    _LAYOUT_ONLY_DTYPES = frozenset({"category", "string[pyarrow]"})
+
     # Shared dispatch table for DataFrame method handlers.
     # Maps method names to handler method names (resolved to bound methods in __init__).
     _METHOD_HANDLER_NAMES = {
@@ -50,6 +66,7 @@ class CodeAnalyzer:
         "nsmallest": "_handle_nsmallest",
         "query": "_handle_query",
         "assign": "_handle_assign",
+        "eval": "_handle_eval",
         "clip": "_handle_clip",
         "round": "_handle_round",
         "abs": "_handle_abs",
@@ -257,12 +274,27 @@ class CodeAnalyzer:
 
     def _analyze_value(self, value: ast.expr, target_name: str) -> None:
         """Analyze the right-hand side of an assignment."""
-        if isinstance(value, ast.Call):
+        if isinstance(value, ast.Call) and _is_flag_cast(value):
+            # (df['a'] < df['b']).astype('int8') is a 0/1 derived column
+            self._handle_binop(value, target_name)
+        elif (
+            isinstance(value, ast.Call)
+            and _is_fillna_call(value)
+            and _is_date_difference(value.func.value)
+        ):
+            # (end - start).dt.days.fillna(n): days, or n where a date is missing
+            self._handle_binop(value, target_name)
+        elif isinstance(value, ast.Call):
             self._handle_call(value, target_name)
         elif isinstance(value, ast.Attribute):
-            # Could be a method chain result
-            pass
+            # (end - start).dt.days derives a column like any arithmetic;
+            # other attributes could be a method chain result
+            if _is_date_difference(value):
+                self._handle_binop(value, target_name)
         elif isinstance(value, ast.Subscript):
+            # df.shape[1] is a scalar, not a selection from df
+            if isinstance(value.value, ast.Attribute) and value.value.attr == "shape":
+                return
             # df[condition] - filtering
             self._handle_filter(value, target_name)
         elif isinstance(value, ast.BinOp):
@@ -278,6 +310,22 @@ class CodeAnalyzer:
             method_name = func.attr
             obj = func.value
 
+            # df.groupby(keys).rolling(n)[col].<agg>() is one partitioned window
+            rolling = self._match_groupby_rolling(node)
+            if rolling is not None:
+                self._handle_groupby_rolling(*rolling, target)
+                return
+
+            # df[...].copy() / .set_index(...) / .reset_index(): the
+            # selection or filter is the step; index bookkeeping and copies
+            # have no DSS equivalent
+            if (
+                method_name in ("copy", "reset_index", "set_index", "sort_index")
+                and isinstance(obj, ast.Subscript)
+            ):
+                self._analyze_value(obj, target)
+                return
+
             # Check if this is a method chain
             if self._is_method_chain(node):
                 self._handle_method_chain(node, target)
@@ -291,6 +339,8 @@ class CodeAnalyzer:
                 self._handle_read_csv(node, target)
             elif method_name == "read_excel" and obj_name == "pd":
                 self._handle_read_data(node, target, "excel")
+            elif method_name == "read_parquet" and obj_name == "pd":
+                self._handle_read_data(node, target, "parquet")
             elif method_name == "merge" and obj_name == "pd":
                 self._handle_pd_merge(node, target)
             elif method_name == "merge_asof" and obj_name == "pd":
@@ -301,6 +351,13 @@ class CodeAnalyzer:
                 self._handle_concat(node, target)
             elif method_name in ("cut", "qcut") and obj_name == "pd":
                 self._handle_pd_binner(method_name, node, target)
+            elif (
+                method_name == "from_codes"
+                and obj_name == "pd.Categorical"
+                and node.args
+                and _searchsorted_codes(node.args[0]) is not None
+            ):
+                self._handle_searchsorted_binner(node, target)
             elif method_name == "get_dummies" and obj_name == "pd":
                 self._handle_pd_get_dummies(node, target)
             elif method_name == "melt" and obj_name == "pd":
@@ -309,6 +366,10 @@ class CodeAnalyzer:
                     self._get_name(node.args[0]) if node.args else "df"
                 )
                 self._handle_melt(source_df, node, target)
+            # df.groupby(keys)[col].transform('mean') broadcasts a per-group
+            # statistic back onto every row: a partitioned Window recipe.
+            elif method_name == "transform" and self._is_groupby_selection(obj, node):
+                self._handle_groupby_transform(obj, node, target)
             # Handle sklearn method calls (fit, transform, fit_transform, predict)
             elif method_name in ("fit", "transform", "fit_transform", "predict", "predict_proba"):
                 self._handle_sklearn_method(obj_name, method_name, node, target)
@@ -418,6 +479,14 @@ class CodeAnalyzer:
                     agg_call = chain[i + 1][1]
                     agg_method = chain[i + 1][0]
 
+                    # a.merge(b, ...).groupby(...): join first, then group
+                    # the joined rows rather than the chain's base frame.
+                    if i > 0 and all(name == "merge" for name, _ in chain[:i]):
+                        for name, call in chain[:i]:
+                            joined = f"{base_df}_joined"
+                            self._dispatch_method_handler(base_df, name, call, joined)
+                            base_df = joined
+
                     # Extract groupby keys
                     keys = []
                     if groupby_call.args:
@@ -428,6 +497,8 @@ class CodeAnalyzer:
                     if agg_method == "agg":
                         if agg_call.args and isinstance(agg_call.args[0], ast.Dict):
                             aggregations = self._get_dict_value(agg_call.args[0])
+                        elif agg_call.keywords:
+                            aggregations = self._get_named_aggregations(agg_call)
                     else:
                         # Shorthand: groupby().sum() -> aggregation is the method name
                         aggregations = {"*": agg_method}
@@ -470,17 +541,9 @@ class CodeAnalyzer:
                         if kw.arg == "window" and isinstance(kw.value, ast.Constant):
                             window_size = kw.value.value
 
-                    # Map pandas agg method to DSS window function name
-                    window_func_map = {
-                        "sum": "SUM",
-                        "mean": "AVG",
-                        "count": "COUNT",
-                        "min": "MIN",
-                        "max": "MAX",
-                        "std": "STDDEV",
-                        "var": "VAR",
-                    }
-                    window_func = window_func_map.get(agg_method, agg_method.upper())
+                    window_func = self._WINDOW_FUNCTION_NAMES.get(
+                        agg_method, agg_method.upper()
+                    )
 
                     # Walk to the chain's deepest node to detect a Subscript
                     # like df["sales"] and extract the column name.
@@ -531,7 +594,7 @@ class CodeAnalyzer:
     ) -> None:
         """Dispatch a method call to the appropriate handler."""
         # Skip passthrough methods
-        if method_name in ("copy", "reset_index", "to_frame"):
+        if method_name in ("copy", "reset_index", "set_index", "sort_index", "to_frame"):
             return
 
         # Check for plugin handler first
@@ -675,10 +738,63 @@ class CodeAnalyzer:
                 )
             )
 
+    def _handle_eval(self, df: str, node: ast.Call, target: str) -> None:
+        """Handle ``df.eval("col = expr")`` column assignments.
+
+        Each ``name = expr`` line of the expression string becomes a
+        COLUMN_CREATE transformation, like one ``assign()`` keyword. Bare
+        names in ``expr`` are columns of ``df``, so they are rewritten to
+        ``df['name']`` and translated with the same GREL translator used for
+        ``df['c'] = df['a'] + df['b']``. Lines that are not assignments, or
+        that use ``@local`` references, are skipped.
+        """
+        if not node.args or not isinstance(node.args[0], ast.Constant):
+            return
+        source = node.args[0].value
+        if not isinstance(source, str):
+            return
+
+        for line in source.splitlines():
+            try:
+                stmt = ast.parse(line.strip()).body
+            except SyntaxError:
+                continue
+            if (
+                len(stmt) != 1
+                or not isinstance(stmt[0], ast.Assign)
+                or len(stmt[0].targets) != 1
+                or not isinstance(stmt[0].targets[0], ast.Name)
+            ):
+                continue
+            column = stmt[0].targets[0].id
+            expr = _EvalColumnRewriter(df).visit(stmt[0].value)
+            params: dict[str, Any] = {"operation": "eval", "column": column}
+            grel = _translate_to_grel(expr, df)
+            if grel:
+                params["expression"] = grel
+
+            self.transformations.append(
+                Transformation(
+                    transformation_type=TransformationType.COLUMN_CREATE,
+                    source_dataframe=df,
+                    target_dataframe=target,
+                    columns=[column],
+                    parameters=params,
+                    source_line=self.current_line,
+                    suggested_processor="CreateColumnWithGREL",
+                )
+            )
+
     def _handle_clip(self, df: str, node: ast.Call, target: str) -> None:
         """Handle clip() calls."""
         lower = None
         upper = None
+        # clip(lower, upper) positionally, or by keyword
+        bounds = [a.value if isinstance(a, ast.Constant) else None for a in node.args[:2]]
+        if bounds:
+            lower = bounds[0]
+        if len(bounds) > 1:
+            upper = bounds[1]
         for kw in node.keywords:
             if kw.arg == "lower" and isinstance(kw.value, ast.Constant):
                 lower = kw.value.value
@@ -788,6 +904,61 @@ class CodeAnalyzer:
             )
         )
 
+        # read_parquet(filters=[(col, op, value), ...]) pushes a row filter
+        # into the scan; the flow still needs it as a filter on the dataset.
+        for kw in node.keywords:
+            if kw.arg == "filters" and isinstance(kw.value, ast.List):
+                predicate = self._parquet_filter_predicate(target, kw.value)
+                if predicate is not None:
+                    self._handle_filter(
+                        ast.Subscript(value=ast.Name(id=target), slice=predicate),
+                        target,
+                    )
+
+    _PARQUET_FILTER_OPS = {
+        "==": ast.Eq,
+        "=": ast.Eq,
+        "!=": ast.NotEq,
+        "<": ast.Lt,
+        "<=": ast.LtE,
+        ">": ast.Gt,
+        ">=": ast.GtE,
+    }
+
+    def _parquet_filter_predicate(
+        self, df: str, filters: ast.List
+    ) -> Optional[ast.expr]:
+        """
+        Rebuild ``[(col, op, value), ...]`` as ``(df[col] op value) & ...``.
+
+        Returns None for the disjunctive (list of lists) form and for
+        operators without a pandas comparison equivalent.
+        """
+        comparisons: list[ast.expr] = []
+        for item in filters.elts:
+            if not (isinstance(item, ast.Tuple) and len(item.elts) == 3):
+                return None
+            column, op, value = item.elts
+            if not (
+                isinstance(column, ast.Constant)
+                and isinstance(op, ast.Constant)
+                and op.value in self._PARQUET_FILTER_OPS
+            ):
+                return None
+            comparisons.append(
+                ast.Compare(
+                    left=ast.Subscript(value=ast.Name(id=df), slice=column),
+                    ops=[self._PARQUET_FILTER_OPS[op.value]()],
+                    comparators=[value],
+                )
+            )
+        if not comparisons:
+            return None
+        predicate = comparisons[0]
+        for comparison in comparisons[1:]:
+            predicate = ast.BinOp(left=predicate, op=ast.BitAnd(), right=comparison)
+        return predicate
+
     def _extract_column_from_subscript(self, node: ast.expr) -> Optional[str]:
         """Extract column name from a subscript like df['col'] or df['col'].str."""
         current = node
@@ -813,6 +984,12 @@ class CodeAnalyzer:
             self._handle_str_method_call(df_name, column, method, node, target)
             return
 
+        # df['d'].dt.strftime(fmt) / .dt.to_period(freq): a DateFormatter
+        # when the format has a Java date-pattern equivalent
+        if isinstance(obj, ast.Attribute) and obj.attr == "dt":
+            if self._handle_dt_format(obj, method, node, target):
+                return
+
         # H2: Extract column from subscript for column-specific methods
         # AST for df['col'].fillna(0): Call(.fillna) on Subscript(df['col'])
         column_from_subscript = self._extract_column_from_subscript(obj)
@@ -846,8 +1023,8 @@ class CodeAnalyzer:
                 handler(obj_name, node, target, column=column_from_subscript)
             else:
                 handler(obj_name, node, target)
-        elif method in ("copy", "reset_index"):
-            # Passthrough operations
+        elif method in ("copy", "reset_index", "set_index", "sort_index"):
+            # Passthrough operations (DSS datasets have no index)
             pass
         else:
             # Unknown method - might need Python recipe
@@ -1044,21 +1221,47 @@ class CodeAnalyzer:
         )
 
     def _handle_join(self, df: str, node: ast.Call, target: str) -> None:
-        """Handle join() calls."""
-        right = None
+        """Handle join() calls.
+
+        ``left.join(right, on='key')`` matches ``left['key']`` against
+        ``right``'s index; with ``set_index('key')`` on the right side that
+        is an equi-join on ``key``. pandas defaults to a left join.
+
+        ``left.join([a, b, ...])`` aligns every frame on the shared index in
+        one call; it becomes one join step per right-hand frame, each
+        consuming the previous step's output. The intermediate steps write
+        ``<target>_join_<i>`` so that only the last one writes ``target``.
+        """
+        rights: list[Optional[str]] = [None]
         if node.args:
-            right = self._get_name(node.args[0])
+            arg = node.args[0]
+            if isinstance(arg, (ast.List, ast.Tuple)) and arg.elts:
+                rights = [self._get_name(elt) for elt in arg.elts]
+            else:
+                rights = [self._get_name(arg)]
 
-        self.transformations.append(
-            Transformation(
-                transformation_type=TransformationType.JOIN,
-                source_dataframe=df,
-                target_dataframe=target,
-                parameters={"right": right, "type": "index"},
-                source_line=self.current_line,
-                suggested_recipe="join",
+        on = None
+        how = "left"
+        for kw in node.keywords:
+            if kw.arg == "on":
+                on = self._get_list_value(kw.value)
+            elif kw.arg == "how" and isinstance(kw.value, ast.Constant):
+                how = kw.value.value
+
+        source = df
+        for i, right in enumerate(rights, start=1):
+            step_target = target if i == len(rights) else f"{target}_join_{i}"
+            self.transformations.append(
+                Transformation(
+                    transformation_type=TransformationType.JOIN,
+                    source_dataframe=source,
+                    target_dataframe=step_target,
+                    parameters={"right": right, "type": "index", "on": on, "how": how},
+                    source_line=self.current_line,
+                    suggested_recipe="join",
+                )
             )
-        )
+            source = step_target
 
     def _handle_groupby(self, df: str, node: ast.Call, target: str) -> None:
         """Handle groupby() calls - needs to detect .agg() chain."""
@@ -1155,12 +1358,25 @@ class CodeAnalyzer:
         )
 
     def _handle_astype(self, df: str, node: ast.Call, target: str, column: Optional[str] = None) -> None:
-        """Handle astype() calls."""
+        """Handle astype() calls.
+
+        Casts to ``category`` or ``string[pyarrow]`` (``astype('category')``
+        or ``astype({'col': 'category', ...})``) only change pandas'
+        in-memory layout; DSS storage types have no categorical or
+        Arrow-backed string, so they add no step.
+        """
         dtype = None
         if node.args and isinstance(node.args[0], ast.Name):
             dtype = node.args[0].id
         elif node.args and isinstance(node.args[0], ast.Constant):
             dtype = str(node.args[0].value)
+        elif node.args and isinstance(node.args[0], ast.Dict):
+            values = set(self._get_dict_value(node.args[0]).values())
+            if values and values <= self._LAYOUT_ONLY_DTYPES:
+                return
+
+        if dtype in self._LAYOUT_ONLY_DTYPES:
+            return
 
         columns = [column] if column else []
         self.transformations.append(
@@ -1303,6 +1519,174 @@ class CodeAnalyzer:
             )
         )
 
+    def _is_groupby_selection(self, obj: ast.expr, node: ast.Call) -> bool:
+        """Check for ``df.groupby(keys)['col'].transform('<agg>')``."""
+        return (
+            isinstance(obj, ast.Subscript)
+            and isinstance(obj.slice, ast.Constant)
+            and isinstance(obj.value, ast.Call)
+            and isinstance(obj.value.func, ast.Attribute)
+            and obj.value.func.attr == "groupby"
+            and bool(node.args)
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        )
+
+    def _handle_groupby_transform(
+        self, selection: ast.Subscript, node: ast.Call, target: str
+    ) -> None:
+        """
+        Handle ``df['out'] = df.groupby(keys)['col'].transform('<agg>')``.
+
+        The per-group value is computed over a Window recipe partitioned on
+        the groupby keys, so the column lands on the original rows without
+        a Grouping recipe and a join back.
+        """
+        groupby_call = selection.value
+        base_df = self._get_name(groupby_call.func.value)
+        keys = self._get_list_value(groupby_call.args[0]) if groupby_call.args else []
+        for kw in groupby_call.keywords:
+            if kw.arg == "by":
+                keys = self._get_list_value(kw.value)
+        column = str(selection.slice.value)
+        method = node.args[0].value
+        window_func = self._WINDOW_FUNCTION_NAMES.get(method, method.upper())
+
+        target, output_column = self._split_column_target(base_df, target)
+
+        self.transformations.append(
+            Transformation(
+                transformation_type=TransformationType.WINDOW,
+                source_dataframe=base_df,
+                target_dataframe=target,
+                columns=[column],
+                parameters={
+                    "method": method,
+                    "window_function": window_func,
+                    "column": column,
+                    "partition_columns": keys,
+                    "output_column": output_column,
+                },
+                source_line=self.current_line,
+                suggested_recipe="window",
+                notes=[
+                    f"groupby({keys})[{column!r}].transform({method!r}) "
+                    f"-> WINDOW recipe with {window_func} partitioned by {keys}"
+                ],
+            )
+        )
+
+    @staticmethod
+    def _split_column_target(base_df: str, target: str) -> tuple[str, Optional[str]]:
+        """Split ``"df['out']"`` into ``("df", "out")``.
+
+        ``df['out'] = ...`` adds a column to df rather than creating a new
+        frame; any other target is returned unchanged with no column.
+        """
+        if target.startswith(f"{base_df}[") and target.endswith("]"):
+            return base_df, target[len(base_df) + 1:-1].strip("'\"")
+        return target, None
+
+    def _match_groupby_rolling(
+        self, node: ast.Call
+    ) -> Optional[tuple[ast.Call, ast.Call, str, str]]:
+        """
+        Match ``df.groupby(keys).rolling(n)['col'].<agg>()``.
+
+        A trailing ``.reset_index(level=0, drop=True)``, which drops the
+        group level so the result aligns with ``df``, is allowed, as is a
+        trailing ``.to_numpy()`` (used with ``rolling(..., on=col)``, whose
+        result is indexed by ``col`` rather than by the rows of ``df``).
+
+        Returns:
+            ``(groupby_call, rolling_call, column, agg)`` or ``None``.
+        """
+        if (
+            isinstance(node.func, ast.Attribute)
+            and node.func.attr in ("reset_index", "to_numpy")
+            and isinstance(node.func.value, ast.Call)
+        ):
+            node = node.func.value
+        if not (
+            isinstance(node.func, ast.Attribute)
+            and node.func.attr in self._WINDOW_FUNCTION_NAMES
+            and not node.args
+        ):
+            return None
+        selection = node.func.value
+        if not (
+            isinstance(selection, ast.Subscript)
+            and isinstance(selection.slice, ast.Constant)
+            and isinstance(selection.slice.value, str)
+        ):
+            return None
+        rolling_call = selection.value
+        if not (
+            isinstance(rolling_call, ast.Call)
+            and isinstance(rolling_call.func, ast.Attribute)
+            and rolling_call.func.attr == "rolling"
+        ):
+            return None
+        groupby_call = rolling_call.func.value
+        if not (
+            isinstance(groupby_call, ast.Call)
+            and isinstance(groupby_call.func, ast.Attribute)
+            and groupby_call.func.attr == "groupby"
+        ):
+            return None
+        return groupby_call, rolling_call, selection.slice.value, node.func.attr
+
+    def _handle_groupby_rolling(
+        self,
+        groupby_call: ast.Call,
+        rolling_call: ast.Call,
+        column: str,
+        method: str,
+        target: str,
+    ) -> None:
+        """
+        Handle ``df['out'] = df.groupby(keys).rolling(n)['col'].<agg>()``.
+
+        Same Window recipe as a plain ``rolling()``, partitioned on the
+        groupby keys.
+        """
+        base_df = self._get_name(groupby_call.func.value)
+        keys = self._get_list_value(groupby_call.args[0]) if groupby_call.args else []
+        for kw in groupby_call.keywords:
+            if kw.arg == "by":
+                keys = self._get_list_value(kw.value)
+        window = None
+        if rolling_call.args and isinstance(rolling_call.args[0], ast.Constant):
+            window = rolling_call.args[0].value
+        for kw in rolling_call.keywords:
+            if kw.arg == "window" and isinstance(kw.value, ast.Constant):
+                window = kw.value.value
+        window_func = self._WINDOW_FUNCTION_NAMES[method]
+        target, output_column = self._split_column_target(base_df, target)
+
+        self.transformations.append(
+            Transformation(
+                transformation_type=TransformationType.ROLLING,
+                source_dataframe=base_df,
+                target_dataframe=target,
+                columns=[column],
+                parameters={
+                    "method": method,
+                    "window_function": window_func,
+                    "window": window,
+                    "column": column,
+                    "partition_columns": keys,
+                    "output_column": output_column,
+                },
+                source_line=self.current_line,
+                suggested_recipe="window",
+                notes=[
+                    f"groupby({keys}).rolling({window or ''})[{column!r}].{method}() "
+                    f"-> WINDOW recipe with {window_func} partitioned by {keys}"
+                ],
+            )
+        )
+
     def _handle_rolling(self, df: str, node: ast.Call, target: str) -> None:
         """Handle rolling() calls."""
         window = None
@@ -1334,6 +1718,51 @@ class CodeAnalyzer:
             )
         )
 
+    def _handle_dt_format(
+        self, accessor: ast.Attribute, method: str, node: ast.Call, target: str
+    ) -> bool:
+        """
+        Handle ``df['out'] = df['d'].dt.strftime(fmt)`` and ``.dt.to_period(freq)``.
+
+        A period key formats the same as its label (``to_period('M')`` ->
+        ``2024-01``), so both become a DateFormatter step.
+
+        Returns:
+            ``True`` if a transformation was recorded.
+        """
+        if method not in ("strftime", "to_period") or not node.args:
+            return False
+        arg = node.args[0]
+        if not (isinstance(arg, ast.Constant) and isinstance(arg.value, str)):
+            return False
+        if method == "strftime":
+            date_format = _strftime_to_java(arg.value)
+        else:
+            date_format = _PERIOD_FORMATS.get(arg.value)
+        column = self._extract_column_from_subscript(accessor)
+        if date_format is None or column is None:
+            return False
+
+        df_name = self._get_name(accessor.value.value)
+        target, output_column = self._split_column_target(df_name, target)
+        self.transformations.append(
+            Transformation(
+                transformation_type=TransformationType.COLUMN_CREATE,
+                source_dataframe=df_name,
+                target_dataframe=target,
+                columns=[column],
+                parameters={
+                    "column": column,
+                    "output_column": output_column,
+                    "format": date_format,
+                },
+                source_line=self.current_line,
+                suggested_processor="DateFormatter",
+                notes=[f".dt.{method}({arg.value!r}) -> DateFormatter processor"],
+            )
+        )
+        return True
+
     def _handle_str_method_call(
         self, df: str, column: Optional[str], method: str, node: ast.Call, target: str
     ) -> None:
@@ -1838,6 +2267,40 @@ class CodeAnalyzer:
             if kw.arg in ("bins", "q") and isinstance(kw.value, ast.Constant):
                 bins = kw.value.value
 
+        self._append_binner(source_df, source_col, target, bins, method_name)
+
+    def _handle_searchsorted_binner(self, node: ast.Call, target: str) -> None:
+        """
+        Handle ``pd.Categorical.from_codes(np.searchsorted(edges, df['col']), labels)``.
+
+        The vectorized spelling of ``pd.cut`` with fixed, right-closed bins
+        maps to the same Binner processor. ``edges`` are the inner bin
+        boundaries. The codes may be wrapped in ``np.where(mask, codes, -1)``
+        to leave out-of-range rows unbinned, as ``pd.cut`` does.
+        """
+        searchsorted = _searchsorted_codes(node.args[0])
+        if searchsorted is None:
+            return
+        edges: Any = None
+        if searchsorted.args and isinstance(searchsorted.args[0], (ast.List, ast.Tuple)):
+            edges = self._get_list_value(searchsorted.args[0])
+        source_df = "df"
+        source_col = ""
+        if len(searchsorted.args) > 1:
+            values = searchsorted.args[1]
+            if isinstance(values, ast.Subscript):
+                source_df = self._get_name(values.value)
+                if isinstance(values.slice, ast.Constant):
+                    source_col = values.slice.value
+            else:
+                source_df = self._get_name(values)
+
+        self._append_binner(source_df, source_col, target, edges, "cut")
+
+    def _append_binner(
+        self, source_df: str, source_col: str, target: str, bins: Any, method: str
+    ) -> None:
+        """Record a Binner processor deriving ``target`` from ``source_col``."""
         self.transformations.append(
             Transformation(
                 transformation_type=TransformationType.COLUMN_CREATE,
@@ -1848,11 +2311,11 @@ class CodeAnalyzer:
                     "column": source_col,
                     "output_column": target,
                     "bins": bins,
-                    "method": method_name,
+                    "method": method,
                 },
                 source_line=self.current_line,
                 suggested_processor="Binner",
-                notes=[f"pd.{method_name}() -> Binner processor"],
+                notes=[f"pd.{method}() -> Binner processor"],
             )
         )
 
@@ -1890,9 +2353,13 @@ class CodeAnalyzer:
             )
         )
 
-    def _handle_binop(self, node: ast.BinOp, target: str) -> None:
+    def _handle_binop(self, node: ast.expr, target: str) -> None:
         """Handle ``df['new'] = <BinOp over df columns>``.
 
+        Also used for ``(end - start).dt.days`` date differences, which
+        translate to the GREL ``diff()`` function, and for predicates cast
+        to integer flags, which translate to ``if(predicate, 1, 0)``.
+
         Bug #1 fix: previously emitted a stub transformation with no GREL
         expression and no source dataframe, so the generator silently
         dropped the derivation. Downstream GROUPING / sort steps that
@@ -1985,6 +2452,15 @@ class CodeAnalyzer:
                 # assigned to a variable). Route them through the standard
                 # method-handler dispatch so they emit a STATISTICS
                 # transformation -> GENERATE_STATISTICS recipe.
+                # ``df.eval("c = a + b", inplace=True)`` adds columns in place.
+                elif method == "eval" and any(
+                    kw.arg == "inplace"
+                    and isinstance(kw.value, ast.Constant)
+                    and kw.value.value is True
+                    for kw in node.value.keywords
+                ):
+                    df_name = self._get_name(func.value)
+                    self._handle_eval(df_name, node.value, df_name)
                 elif method in ("describe", "info"):
                     df_name = self._get_name(func.value)
                     handler = self._method_handlers.get(method)
@@ -2064,6 +2540,35 @@ class CodeAnalyzer:
             return result
         return {}
 
+    def _get_named_aggregations(self, node: ast.Call) -> dict[str, Any]:
+        """Extract pandas named aggregations from an ``.agg()`` call.
+
+        ``.agg(total=("amount", "sum"), n=("id", "count"))`` becomes
+        ``{"amount": "sum", "id": "count"}``, the same shape
+        :meth:`_get_dict_value` returns for the dict form. Several
+        aggregations of one column collapse into a list. Output names are
+        not kept, matching the dict form.
+        """
+        result: dict[str, Any] = {}
+        for kw in node.keywords:
+            value = kw.value
+            if (
+                kw.arg is None
+                or not isinstance(value, ast.Tuple)
+                or len(value.elts) != 2
+                or not all(isinstance(e, ast.Constant) for e in value.elts)
+            ):
+                continue
+            column, func = (str(e.value) for e in value.elts)
+            existing = result.get(column)
+            if existing is None:
+                result[column] = func
+            elif isinstance(existing, list):
+                existing.append(func)
+            else:
+                result[column] = [existing, func]
+        return result
+
     # ========== scikit-learn handlers ==========
 
     def _handle_train_test_split(self, node: ast.Call, target: str) -> None:
@@ -2380,6 +2885,9 @@ class CodeAnalyzer:
         # Reshaping
         elif func_name in ("reshape", "flatten", "ravel", "transpose"):
             self._handle_numpy_reshape(func_name, node, target)
+        # df['n'] = np.arange(1, len(df) + 1) numbers the rows in their order
+        elif func_name == "arange" and self._row_number_frame(node, target):
+            self._handle_row_number(node, target)
         # Creation/initialization
         elif func_name in ("zeros", "ones", "full", "empty", "arange", "linspace"):
             self._handle_numpy_create(func_name, node, target)
@@ -2396,6 +2904,53 @@ class CodeAnalyzer:
                 )
             )
 
+    def _row_number_frame(self, node: ast.Call, target: str) -> Optional[str]:
+        """
+        Match ``df['col'] = np.arange([start,] len(df)[ + k])``.
+
+        Returns:
+            The name of ``df``, or ``None`` if ``node`` is not a row counter
+            over the frame it is assigned into.
+        """
+        if not node.args or len(node.args) > 2:
+            return None
+        stop = node.args[-1]
+        if isinstance(stop, ast.BinOp) and isinstance(stop.op, ast.Add):
+            stop = stop.left
+        if not (
+            isinstance(stop, ast.Call)
+            and isinstance(stop.func, ast.Name)
+            and stop.func.id == "len"
+            and len(stop.args) == 1
+        ):
+            return None
+        df_name = self._get_name(stop.args[0])
+        if not target.startswith(f"{df_name}["):
+            return None
+        return df_name
+
+    def _handle_row_number(self, node: ast.Call, target: str) -> None:
+        """Handle a row counter as a Window recipe ROW_NUMBER column."""
+        df_name = self._row_number_frame(node, target)
+        target, output_column = self._split_column_target(df_name, target)
+        self.transformations.append(
+            Transformation(
+                transformation_type=TransformationType.WINDOW,
+                source_dataframe=df_name,
+                target_dataframe=target,
+                columns=[output_column] if output_column else [],
+                parameters={
+                    "method": "row_number",
+                    "window_function": "ROW_NUMBER",
+                    "column": output_column,
+                    "output_column": output_column,
+                },
+                source_line=self.current_line,
+                suggested_recipe="window",
+                notes=["np.arange(len(df)) row counter -> WINDOW recipe with ROW_NUMBER"],
+            )
+        )
+
     def _handle_numpy_log(self, func_name: str, node: ast.Call, target: str) -> None:
         """Handle np.log, np.log10, np.log2, np.log1p."""
         input_arr = self._get_arg_name(node, 0)
@@ -2536,6 +3091,11 @@ class CodeAnalyzer:
 
     def _handle_numpy_where(self, node: ast.Call, target: str) -> None:
         """Handle np.where(condition, x, y)."""
+        if isinstance(target, str) and "[" in target:
+            # df['col'] = np.where(...) over df columns is an if() formula,
+            # derived like any other column expression
+            self._handle_binop(node, target)
+            return
         condition = None
         if len(node.args) > 0:
             condition = self._get_name(node.args[0])
@@ -2556,6 +3116,11 @@ class CodeAnalyzer:
 
     def _handle_numpy_select(self, node: ast.Call, target: str) -> None:
         """Handle np.select(conditions, choices, default)."""
+        if isinstance(target, str) and "[" in target:
+            # df['col'] = np.select(...) over df columns is a nested if()
+            # formula, derived like any other column expression
+            self._handle_binop(node, target)
+            return
         default_val = None
         for kw in node.keywords:
             if kw.arg == "default" and isinstance(kw.value, ast.Constant):
@@ -3010,6 +3575,174 @@ def _translate_compare(node: ast.Compare, df_name: str) -> Optional[str]:
     return f"{left} {grel_op} {right}"
 
 
+def _is_date_difference(node: ast.expr) -> bool:
+    """Check for ``(end - start).dt.days``."""
+    return (
+        isinstance(node, ast.Attribute)
+        and node.attr == "days"
+        and isinstance(node.value, ast.Attribute)
+        and node.value.attr == "dt"
+        and isinstance(node.value.value, ast.BinOp)
+        and isinstance(node.value.value.op, ast.Sub)
+    )
+
+
+def _is_fillna_call(node: ast.expr) -> bool:
+    """Check for ``<expr>.fillna(value)`` with a single positional value."""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "fillna"
+        and len(node.args) == 1
+        and not node.keywords
+    )
+
+
+_INT_DTYPES = frozenset(
+    {"int", "int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64"}
+)
+
+
+def _is_flag_cast(node: ast.expr) -> bool:
+    """Check for ``(<predicate>).astype(int)`` with any integer width."""
+    if not (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "astype"
+        and len(node.args) == 1
+    ):
+        return False
+    predicate = node.func.value
+    if not (
+        isinstance(predicate, ast.Compare)
+        or (
+            isinstance(predicate, ast.BinOp)
+            and isinstance(predicate.op, (ast.BitAnd, ast.BitOr))
+        )
+    ):
+        return False
+    dtype = node.args[0]
+    if isinstance(dtype, ast.Constant):
+        return dtype.value in _INT_DTYPES
+    if isinstance(dtype, ast.Name):
+        return dtype.id in _INT_DTYPES
+    # np.int8 and friends
+    return isinstance(dtype, ast.Attribute) and dtype.attr in _INT_DTYPES
+
+
+# strftime directive -> Java date pattern (used by DSS date processors)
+_STRFTIME_TO_JAVA = {
+    "Y": "yyyy", "y": "yy", "m": "MM", "d": "dd", "B": "MMMM", "b": "MMM",
+    "H": "HH", "I": "hh", "M": "mm", "S": "ss", "p": "a", "A": "EEEE",
+    "a": "EEE", "j": "DDD", "%": "%",
+}
+
+# Period frequency -> Java pattern of its string label
+_PERIOD_FORMATS = {
+    "Y": "yyyy", "A": "yyyy", "M": "yyyy-MM", "D": "yyyy-MM-dd",
+    "h": "yyyy-MM-dd HH:00", "H": "yyyy-MM-dd HH:00",
+}
+
+
+def _strftime_to_java(fmt: str) -> Optional[str]:
+    """Translate a strftime format to a Java date pattern, or ``None``."""
+    out = []
+    literal = []
+    i = 0
+    while i < len(fmt):
+        ch = fmt[i]
+        if ch == "%":
+            pattern = _STRFTIME_TO_JAVA.get(fmt[i + 1:i + 2])
+            if pattern is None:
+                return None
+            if literal:
+                out.append("'" + "".join(literal) + "'")
+                literal = []
+            out.append(pattern)
+            i += 2
+            continue
+        if ch.isalpha() or ch == "'":
+            # Letters are pattern characters in Java; quote them
+            literal.append("''" if ch == "'" else ch)
+        else:
+            if literal:
+                out.append("'" + "".join(literal) + "'")
+                literal = []
+            out.append(ch)
+        i += 1
+    if literal:
+        out.append("'" + "".join(literal) + "'")
+    return "".join(out)
+
+
+# Element-wise math functions (NumPy / DataFrame.eval name -> GREL name)
+_GREL_MATH_FUNCTIONS = {"exp": "exp", "log": "ln", "sqrt": "sqrt"}
+
+
+def _is_numpy_call(node: ast.expr, func_name: str) -> bool:
+    """Check for a call to ``np.<func_name>(...)``."""
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == func_name
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id in ("np", "numpy")
+    )
+
+
+def _searchsorted_codes(node: ast.expr) -> Optional[ast.Call]:
+    """Return the ``np.searchsorted`` call giving bin codes, if any.
+
+    Accepts the bare call and ``np.where(mask, np.searchsorted(...), -1)``.
+    """
+    if _is_numpy_call(node, "searchsorted"):
+        return node
+    if (
+        _is_numpy_call(node, "where")
+        and len(node.args) == 3
+        and _is_numpy_call(node.args[1], "searchsorted")
+    ):
+        return node.args[1]
+    return None
+
+
+def _translate_numpy_select(node: ast.Call, df_name: str) -> Optional[str]:
+    """Translate ``np.select`` to nested GREL ``if()`` calls.
+
+    Conditions are tried in order, so the first match wins, exactly as
+    in NumPy. Only literal lists of conditions and choices translate.
+    """
+    args = list(node.args)
+    default: Optional[ast.expr] = args[2] if len(args) > 2 else None
+    for kw in node.keywords:
+        if kw.arg == "condlist" and not args:
+            args.append(kw.value)
+        elif kw.arg == "choicelist" and len(args) == 1:
+            args.append(kw.value)
+        elif kw.arg == "default":
+            default = kw.value
+    if len(args) < 2:
+        return None
+    conditions, choices = args[0], args[1]
+    if not (
+        isinstance(conditions, (ast.List, ast.Tuple))
+        and isinstance(choices, (ast.List, ast.Tuple))
+        and len(conditions.elts) == len(choices.elts)
+        and conditions.elts
+    ):
+        return None
+
+    # np.select's own default is 0
+    grel = _translate_grel_node(default, df_name) if default is not None else "0"
+    for cond, choice in zip(reversed(conditions.elts), reversed(choices.elts)):
+        cond_grel = _translate_grel_node(cond, df_name)
+        choice_grel = _translate_grel_node(choice, df_name)
+        if grel is None or cond_grel is None or choice_grel is None:
+            return None
+        grel = f"if({cond_grel}, {choice_grel}, {grel})"
+    return grel
+
+
 def _translate_grel_node(node: ast.expr, df_name: str) -> Optional[str]:
     """Recursive AST → GREL translator. Returns None on unsupported nodes."""
     # Column reference: df['col'] or df.col
@@ -3021,6 +3754,107 @@ def _translate_grel_node(node: ast.expr, df_name: str) -> Optional[str]:
     if isinstance(node, ast.Constant):
         return _grel_constant(node)
 
+    # Date difference in whole days: (end - start).dt.days. GREL's diff()
+    # works on the dates directly, with no intermediate duration column.
+    if _is_date_difference(node):
+        sub = node.value.value
+        left = _translate_grel_node(sub.left, df_name)
+        right = _translate_grel_node(sub.right, df_name)
+        if left is None or right is None:
+            return None
+        return f'diff({left}, {right}, "days")'
+
+    # x.fillna(v) -> coalesce(x, v): v wherever x is empty
+    if _is_fillna_call(node):
+        inner = _translate_grel_node(node.func.value, df_name)
+        fill = _translate_grel_node(node.args[0], df_name)
+        if inner is None or fill is None:
+            return None
+        return f"coalesce({inner}, {fill})"
+
+    # Integer flag from a predicate: (df['a'] < df['b']).astype('int8')
+    if _is_flag_cast(node):
+        predicate = _translate_grel_node(node.func.value, df_name)
+        if predicate is None:
+            return None
+        return f"if({predicate}, 1, 0)"
+
+    # np.select([cond, ...], [choice, ...], default=x) -> nested if()
+    if _is_numpy_call(node, "select"):
+        return _translate_numpy_select(node, df_name)
+
+    # np.where(cond, x, y) -> if(cond, x, y), e.g. a zero-divisor guard
+    if _is_numpy_call(node, "where") and len(node.args) == 3 and not node.keywords:
+        parts = [_translate_grel_node(arg, df_name) for arg in node.args]
+        if any(part is None for part in parts):
+            return None
+        return f"if({parts[0]}, {parts[1]}, {parts[2]})"
+
+    # np.exp(x), or exp(x) inside a DataFrame.eval expression
+    if (
+        isinstance(node, ast.Call)
+        and len(node.args) == 1
+        and not node.keywords
+        and (
+            (isinstance(node.func, ast.Name) and node.func.id in _GREL_MATH_FUNCTIONS)
+            or any(_is_numpy_call(node, name) for name in _GREL_MATH_FUNCTIONS)
+        )
+    ):
+        name = node.func.id if isinstance(node.func, ast.Name) else node.func.attr
+        inner = _translate_grel_node(node.args[0], df_name)
+        if inner is None:
+            return None
+        return f"{_GREL_MATH_FUNCTIONS[name]}({inner})"
+
+    # df['col'].astype(str), or to a pandas string dtype
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "astype"
+        and len(node.args) == 1
+        and (
+            (isinstance(node.args[0], ast.Name) and node.args[0].id == "str")
+            or (
+                isinstance(node.args[0], ast.Constant)
+                and node.args[0].value in ("str", "string", "string[pyarrow]")
+            )
+        )
+    ):
+        inner = _translate_grel_node(node.func.value, df_name)
+        if inner is None:
+            return None
+        return f"toString({inner})"
+
+    # df['col'].round(n): GREL round() only rounds to integers
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "round"
+        and len(node.args) <= 1
+        and not node.keywords
+    ):
+        inner = _translate_grel_node(node.func.value, df_name)
+        if inner is None:
+            return None
+        digits = node.args[0].value if node.args and isinstance(node.args[0], ast.Constant) else 0
+        if not isinstance(digits, int) or isinstance(digits, bool):
+            return None
+        if digits == 0:
+            return f"round({inner})"
+        scale = 10 ** digits
+        return f"round(({inner}) * {scale}) / {scale}"
+
+    # pd.Timestamp.now() / pd.Timestamp.today()
+    if (
+        isinstance(node, ast.Call)
+        and not node.args
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr in ("now", "today")
+        and isinstance(node.func.value, ast.Attribute)
+        and node.func.value.attr == "Timestamp"
+    ):
+        return "now()"
+
     # Comparison: df['x'] > 5
     if isinstance(node, ast.Compare):
         return _translate_compare(node, df_name)
@@ -3052,11 +3886,17 @@ def _translate_grel_node(node: ast.expr, df_name: str) -> Optional[str]:
         }
         for op_cls, sym in arith_ops.items():
             if isinstance(node.op, op_cls):
-                left = _translate_grel_node(node.left, df_name)
-                right = _translate_grel_node(node.right, df_name)
+                left = _translate_grel_operand(node.left, df_name)
+                right = _translate_grel_operand(node.right, df_name)
                 if left is None or right is None:
                     return None
                 return f"({left}) {sym} ({right})"
+        if isinstance(node.op, ast.FloorDiv):
+            left = _translate_grel_operand(node.left, df_name)
+            right = _translate_grel_operand(node.right, df_name)
+            if left is None or right is None:
+                return None
+            return f"floor(({left}) / ({right}))"
 
     # Logical AND/OR (rare in pandas — usually short-circuits at row-eval)
     if isinstance(node, ast.BoolOp):
@@ -3067,13 +3907,18 @@ def _translate_grel_node(node: ast.expr, df_name: str) -> Optional[str]:
             sep = " && " if isinstance(node.op, ast.And) else " || "
             return "(" + sep.join(translated) + ")"
 
-    # Unary not / invert
+    # Unary not / invert, and negation
     if isinstance(node, ast.UnaryOp):
         if isinstance(node.op, (ast.Invert, ast.Not)):
             inner = _translate_grel_node(node.operand, df_name)
             if inner is None:
                 return None
             return f"!({inner})"
+        if isinstance(node.op, ast.USub):
+            inner = _translate_grel_node(node.operand, df_name)
+            if inner is None:
+                return None
+            return f"-({inner})"
 
     # Method calls: df['col'].isin([...]), df['col'].str.contains(...)
     if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
@@ -3098,6 +3943,37 @@ def _translate_grel_node(node: ast.expr, df_name: str) -> Optional[str]:
     return None
 
 
+def _translate_grel_operand(node: ast.expr, df_name: str) -> Optional[str]:
+    """Translate an arithmetic operand; comparisons count as 1 or 0.
+
+    pandas treats a boolean Series in arithmetic as 0/1, which is how
+    ``x / (x + (x == 0))`` guards a division; GREL needs that spelled out.
+    """
+    grel = _translate_grel_node(node, df_name)
+    if grel is not None and isinstance(node, ast.Compare):
+        return f"if({grel}, 1, 0)"
+    return grel
+
+
+class _EvalColumnRewriter(ast.NodeTransformer):
+    """Rewrite bare names in a ``DataFrame.eval`` expression to ``df['name']``."""
+
+    def __init__(self, df_name: str):
+        self.df_name = df_name
+
+    def visit_Call(self, node: ast.Call) -> ast.expr:
+        # ``exp(x)``: the function name is not a column
+        node.args = [self.visit(arg) for arg in node.args]
+        return node
+
+    def visit_Name(self, node: ast.Name) -> ast.expr:
+        return ast.Subscript(
+            value=ast.Name(id=self.df_name, ctx=ast.Load()),
+            slice=ast.Constant(value=node.id),
+            ctx=ast.Load(),
+        )
+
+
 def _translate_to_grel(node: ast.expr, df_name: str) -> Optional[str]:
     """Public entrypoint: translate a pandas boolean indexing expression to GREL.
 
@@ -306,6 +306,11 @@ class PluginRegistry:
         """List all registered processor mappings."""
         return cls._get_default()._processor_mappings.copy()
 
+    @classmethod
+    def has_method_handlers(cls) -> bool:
+        """Whether any custom method handler is registered."""
+        return bool(cls._get_default()._method_handlers)
+
     @classmethod
     def list_plugins(cls) -> dict[str, dict[str, Any]]:
         """List all registered plugins."""
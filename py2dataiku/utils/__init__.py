@@ -1,7 +1,11 @@
 """Utility functions."""
 
+from py2dataiku.utils.serialization import dumps_json, dumps_yaml, load_yaml
 from py2dataiku.utils.validation import validate_recipe_config
 
 __all__ = [
+    "dumps_json",
+    "dumps_yaml",
+    "load_yaml",
     "validate_recipe_config",
 ]
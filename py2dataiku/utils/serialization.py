@@ -0,0 +1,93 @@
+"""JSON serialization helpers."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional: pip install py-iku[perf]
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_json(obj: Any, indent: int = 2) -> str:
+    """
+    Serialize ``obj`` to a JSON string.
+
+    The result is always the text ``json.dumps(obj, indent=indent)`` would
+    produce. ``orjson`` is used when it is installed and the output is
+    guaranteed to match: two-space indent, ASCII-only text and no floats
+    (``orjson`` formats floats differently, e.g. ``0.00001`` for ``1e-05``,
+    and writes NaN and infinities as ``null``). Everything else, including
+    values ``orjson`` cannot encode, goes through the standard library.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Indentation width; ``0`` or ``None`` for compact output
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None and indent == 2 and not _contains_float(obj):
+        try:
+            text = orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass
+        else:
+            if text.isascii():
+                return text
+    return json.dumps(obj, indent=indent)
+
+
+def _contains_float(obj: Any) -> bool:
+    """Return whether a float appears anywhere in ``obj`` (keys included)."""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            return True
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def load_yaml(stream: Any) -> Any:
+    """
+    Parse YAML from a string or file with PyYAML's safe loader.
+
+    Uses the libyaml-backed ``CSafeLoader`` when PyYAML was built with it,
+    which is several times faster than the pure-Python ``SafeLoader``.
+    """
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def dumps_yaml(obj: Any, sort_keys: bool = True) -> str:
+    """
+    Serialize ``obj`` to block-style YAML.
+
+    Plain data goes through the libyaml-backed ``CSafeDumper`` when
+    available; objects the safe dumper cannot represent fall back to
+    ``yaml.dump`` so the output is the same as before.
+
+    Args:
+        obj: Object to serialize
+        sort_keys: Whether to sort mapping keys
+
+    Returns:
+        YAML text
+    """
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    try:
+        return yaml.dump(
+            obj, Dumper=dumper, default_flow_style=False, sort_keys=sort_keys
+        )
+    except yaml.representer.RepresenterError:
+        return yaml.dump(obj, default_flow_style=False, sort_keys=sort_keys)
@@ -10,13 +10,23 @@ Generates scalable vector graphics that match the Dataiku DSS interface:
 """
 
 from typing import Optional
-from xml.sax.saxutils import escape as _xml_escape
 
 from py2dataiku.visualizers.base import FlowVisualizer
 from py2dataiku.visualizers.icons import RecipeIcons
 from py2dataiku.visualizers.layout_engine import LayoutEngine, NodePosition
 from py2dataiku.visualizers.themes import DATAIKU_LIGHT, DataikuTheme
 
+
+def _xml_escape(data: str) -> str:
+    """Escape ``&``, ``<`` and ``>`` (same as ``xml.sax.saxutils.escape``).
+
+    Defined here because importing ``xml.sax.saxutils`` pulls in
+    ``urllib.request`` and with it ``http.client``, ``ssl`` and ``email``,
+    which roughly doubled the cost of ``import py2dataiku``.
+    """
+    return data.replace("&", "&amp;").replace(">", "&gt;").replace("<", "&lt;")
+
+
 # Zone styling colors — sourced from the canonical theme so SVG, matplotlib,
 # and React stay in lockstep (Sprint-7 single-source-of-truth refactor).
 ZONE_FILLS = list(DATAIKU_LIGHT.zone_colors)
@@ -99,6 +99,43 @@ class TestConvertFunction:
         with pytest.raises(InvalidPythonCodeError):
             convert("import pandas as pd\ndf = pd.read_csv('test.csv'")
 
+    def test_repeat_convert_reuses_analysis(self):
+        from py2dataiku import _analyze_rule_based_cached
+
+        code = SIMPLE_PREPARE_CODE + "# cache probe\n"
+        first = convert(code)
+        hits_before = _analyze_rule_based_cached.cache_info().hits
+        second = convert(code)
+
+        assert _analyze_rule_based_cached.cache_info().hits == hits_before + 1
+        assert first.to_dict(include_timestamp=False) == second.to_dict(
+            include_timestamp=False
+        )
+
+    def test_cached_transformations_are_not_shared(self):
+        from py2dataiku import _analyze_rule_based
+
+        first = _analyze_rule_based(SIMPLE_PREPARE_CODE)
+        first[0].columns.append("mutated")
+        second = _analyze_rule_based(SIMPLE_PREPARE_CODE)
+
+        assert "mutated" not in second[0].columns
+
+    def test_cache_bypassed_with_method_handlers(self):
+        from py2dataiku import PluginRegistry
+
+        calls = []
+        PluginRegistry.register_method_handler(
+            "custom_op", lambda node, ctx: calls.append(node)
+        )
+        try:
+            code = "import pandas as pd\ndf = pd.read_csv('a.csv')\ndf = df.custom_op()\n"
+            convert(code)
+            convert(code)
+            assert len(calls) == 2
+        finally:
+            PluginRegistry.unregister_method_handler("custom_op")
+
 
 class TestConvertFile:
     """Tests for the convert_file() function."""
@@ -123,6 +160,30 @@ class TestConvertFile:
         with pytest.raises(FileNotFoundError):
             convert_file("/nonexistent/path/to/file.py")
 
+    def test_convert_file_empty_file(self):
+        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
+            path = f.name
+
+        try:
+            flow = convert_file(path)
+            assert isinstance(flow, DataikuFlow)
+            assert flow.recipes == []
+        finally:
+            os.unlink(path)
+
+    def test_convert_file_crlf_and_non_ascii(self):
+        code = "# café\n" + SIMPLE_PREPARE_CODE
+        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
+            f.write(code.replace("\n", "\r\n").encode("utf-8"))
+            path = f.name
+
+        try:
+            flow = convert_file(path)
+            expected = convert(code)
+            assert len(flow.recipes) == len(expected.recipes)
+        finally:
+            os.unlink(path)
+
 
 class TestPy2DataikuClass:
     """Tests for the Py2Dataiku class."""
@@ -154,6 +215,35 @@ class TestPy2DataikuClass:
         flow = converter.convert(SIMPLE_PREPARE_CODE, optimize=False)
         assert isinstance(flow, DataikuFlow)
 
+    def test_convert_async_rule_based_matches_convert(self):
+        import asyncio
+
+        converter = Py2Dataiku(use_llm=False)
+        flow = asyncio.run(converter.convert_async(SIMPLE_PREPARE_CODE, flow_name="f"))
+        expected = converter.convert(SIMPLE_PREPARE_CODE, flow_name="f")
+        assert flow.name == "f"
+        assert [r.name for r in flow.recipes] == [r.name for r in expected.recipes]
+
+    def test_convert_async_llm_gathers(self):
+        import asyncio
+
+        converter = Py2Dataiku(provider="mock", use_llm=True)
+        assert converter.use_llm is True
+
+        async def run():
+            return await asyncio.gather(
+                *(converter.convert_async("x = 1", flow_name=f"f{i}") for i in range(3))
+            )
+
+        flows = asyncio.run(run())
+        assert [f.name for f in flows] == ["f0", "f1", "f2"]
+
+    def test_instances_have_no_dict(self):
+        converter = Py2Dataiku(use_llm=False)
+        assert not hasattr(converter, "__dict__")
+        with pytest.raises(AttributeError):
+            converter.unexpected = True
+
     def test_analyze_requires_llm(self):
         converter = Py2Dataiku(use_llm=False)
         with pytest.raises(ValueError, match="requires LLM"):
@@ -212,6 +302,25 @@ class TestPy2DataikuClass:
         finally:
             os.unlink(path)
 
+    def test_save_visualization_uppercase_extension(self, tmp_path):
+        converter = Py2Dataiku(use_llm=False)
+        flow = converter.convert(SIMPLE_PREPARE_CODE)
+        path = tmp_path / "flow.PUML"
+
+        converter.save_visualization(flow, str(path))
+
+        assert "@startuml" in path.read_text(encoding="utf-8")
+
+    def test_save_visualization_no_extension_defaults_to_svg(self, tmp_path):
+        converter = Py2Dataiku(use_llm=False)
+        flow = converter.convert(SIMPLE_PREPARE_CODE)
+        path = tmp_path / "out.d" / "flow"
+        path.parent.mkdir()
+
+        converter.save_visualization(flow, str(path))
+
+        assert "<svg" in path.read_text(encoding="utf-8")
+
 
 class TestFlowOutput:
     """Tests for flow output methods from the public API."""
@@ -257,3 +366,48 @@ class TestFlowOutput:
         flow = convert(SIMPLE_PREPARE_CODE)
         graph = flow.graph
         assert len(graph) > 0
+
+
+class TestPackageNamespace:
+    """Guards on the top-level package namespace."""
+
+    def test_all_has_no_duplicates(self):
+        import py2dataiku
+
+        assert len(py2dataiku.__all__) == len(set(py2dataiku.__all__))
+
+    def test_all_names_resolve(self):
+        import py2dataiku
+
+        for name in py2dataiku.__all__:
+            assert hasattr(py2dataiku, name), name
+
+    def test_single_package_copy_loaded(self):
+        import sys
+
+        import py2dataiku
+
+        package_dir = os.path.dirname(py2dataiku.__file__)
+        for name, module in list(sys.modules.items()):
+            if name == "py2dataiku" or name.startswith("py2dataiku."):
+                module_file = getattr(module, "__file__", None)
+                if module_file:
+                    assert module_file.startswith(package_dir), name
+
+    def test_version_resolved_lazily_and_cached(self):
+        import py2dataiku
+
+        version = py2dataiku.__version__
+        assert isinstance(version, str) and version
+        assert vars(py2dataiku)["__version__"] == version
+
+    def test_unknown_attribute_raises(self):
+        import py2dataiku
+
+        with pytest.raises(AttributeError, match="no attribute"):
+            py2dataiku.does_not_exist
+
+    def test_all_is_immutable(self):
+        import py2dataiku
+
+        assert isinstance(py2dataiku.__all__, tuple)
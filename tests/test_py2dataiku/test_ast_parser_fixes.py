@@ -90,6 +90,24 @@ class TestC2GroupbyAggregations:
         assert "region" in keys
         assert "category" in keys
 
+    def test_groupby_named_aggregation(self):
+        """Named aggregation keywords produce the same shape as the dict form."""
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_csv('data.csv')\n"
+            "result = df.groupby('region', as_index=False).agg(\n"
+            "    total=('amount', 'sum'),\n"
+            "    first=('date', 'min'),\n"
+            "    last=('date', 'max'),\n"
+            ")"
+        )
+        gb = [
+            t for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.GROUPBY
+        ][0]
+        assert gb.parameters["keys"] == ["region"]
+        assert gb.parameters["aggregations"] == {"amount": "sum", "date": ["min", "max"]}
+
 
 class TestH1StringAccessor:
     """H1: String accessor .str.* methods should be detected."""
@@ -459,3 +477,632 @@ class TestCombinedFixes:
         assert len(groupby_trans) >= 1
         aggs = groupby_trans[0].parameters.get("aggregations", {})
         assert len(aggs) > 0
+
+
+class TestEvalAssignments:
+    """DataFrame.eval("col = expr") creates columns with GREL expressions."""
+
+    def _column_creates(self, code):
+        return [
+            t for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.COLUMN_CREATE
+        ]
+
+    def test_inplace_multiline_eval(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_csv('data.csv')\n"
+            "df.eval('is_weekend = day_of_week >= 5\\n"
+            "is_night = (hour >= 22) | (hour < 6)', inplace=True)\n"
+        )
+        created = self._column_creates(code)
+        assert [t.parameters["column"] for t in created] == ["is_weekend", "is_night"]
+        assert created[0].parameters["expression"] == 'val("day_of_week") >= 5'
+        assert created[1].target_dataframe == "df"
+
+    def test_assigned_eval_becomes_prepare_step(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_csv('data.csv')\n"
+            "df = df.eval('z = (amount - mean) / scale')\n"
+            "df.to_csv('out.csv')\n"
+        )
+        flow = convert(code)
+        prepare = flow.get_recipes_by_type(RecipeType.PREPARE)
+        assert len(prepare) == 1
+        step = prepare[0].steps[0]
+        assert step.processor_type == ProcessorType.CREATE_COLUMN_WITH_GREL
+        assert step.params["column"] == "z"
+
+    def test_boolean_in_arithmetic_counts_as_one(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_csv('data.csv')\n"
+            "df.eval('ctr = clicks / (views + (views == 0))', inplace=True)\n"
+        )
+        (created,) = self._column_creates(code)
+        assert created.parameters["expression"] == (
+            '(val("clicks")) / ((val("views")) + (if(val("views") == 0, 1, 0)))'
+        )
+
+    def test_math_function_and_negation(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_csv('data.csv')\n"
+            "df.eval('w = exp(-days / 7)', engine='numexpr', inplace=True)\n"
+        )
+        (created,) = self._column_creates(code)
+        assert created.parameters["expression"] == 'exp((-(val("days"))) / (7))'
+
+    def test_non_assignment_eval_ignored(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_csv('data.csv')\n"
+            "total = df.eval('a + b')\n"
+        )
+        assert self._column_creates(code) == []
+
+
+class TestReadParquet:
+    """pd.read_parquet() creates an input dataset like pd.read_csv()."""
+
+    def test_read_parquet_is_read_data(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('events.parquet', columns=['id', 'ts'])\n"
+            "df = df.dropna()\n"
+            "df.to_parquet('clean.parquet', compression='zstd', index=False)\n"
+        )
+        reads = [
+            t for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.READ_DATA
+        ]
+        assert len(reads) == 1
+        assert reads[0].parameters == {"filepath": "events.parquet", "format": "parquet"}
+
+        flow = convert(code)
+        assert [d.name for d in flow.input_datasets] == ["df"]
+
+    def test_pushed_down_filters_become_filter_step(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet(\n"
+            "    'events.parquet',\n"
+            "    filters=[('kind', '==', 'click'), ('amount', '>', 0)]\n"
+            ")\n"
+            "df.to_parquet('clicks.parquet')\n"
+        )
+        (filt,) = [
+            t for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.FILTER
+        ]
+        assert filt.source_dataframe == filt.target_dataframe == "df"
+        assert filt.parameters["condition"] == (
+            "(df['kind'] == 'click') & (df['amount'] > 0)"
+        )
+        assert filt.parameters["formula"] == (
+            '(val("kind") == "click") && (val("amount") > 0)'
+        )
+
+    def test_disjunctive_filters_are_not_translated(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('e.parquet', filters=[[('a', '==', 1)], [('b', '==', 2)]])\n"
+        )
+        types = [t.transformation_type for t in CodeAnalyzer().analyze(code)]
+        assert types == [TransformationType.READ_DATA]
+
+
+class TestCategoryCast:
+    """Category and Arrow-string casts are layout changes with no DSS step."""
+
+    def _casts(self, code):
+        return [
+            t for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.TYPE_CAST
+        ]
+
+    def test_category_casts_skipped(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['region'] = df['region'].astype('category')\n"
+            "df = df.astype({'a': 'category', 'b': 'category'})\n"
+        )
+        assert self._casts(code) == []
+
+    def test_arrow_string_casts_skipped(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['email'] = df['email'].astype('string[pyarrow]')\n"
+            "df = df.astype({'a': 'category', 'b': 'string[pyarrow]'})\n"
+        )
+        assert self._casts(code) == []
+
+    def test_other_casts_kept(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['n'] = df['n'].astype('int64')\n"
+            "df = df.astype({'a': 'category', 'b': 'float32'})\n"
+        )
+        assert len(self._casts(code)) == 2
+
+    def test_sized_cast_uses_dss_type(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['amount'] = df['amount'].astype('float32')\n"
+            "df.to_parquet('out.parquet')\n"
+        )
+        (prepare,) = convert(code).get_recipes_by_type(RecipeType.PREPARE)
+        assert prepare.steps[0].params == {"column": "amount", "type": "float"}
+
+
+class TestIndexJoin:
+    """df.join(lookup, on=key) against a set_index() lookup is an equi-join."""
+
+    CODE = (
+        "import pandas as pd\n"
+        "tx = pd.read_parquet('tx.parquet')\n"
+        "accounts = pd.read_parquet('accounts.parquet')\n"
+        "accounts = accounts.set_index('account_id')\n"
+        "enriched = tx.join(accounts, on='account_id')\n"
+        "enriched.to_parquet('out.parquet')\n"
+    )
+
+    def test_join_keys_and_default_how(self):
+        joins = [
+            t for t in CodeAnalyzer().analyze(self.CODE)
+            if t.transformation_type == TransformationType.JOIN
+        ]
+        assert len(joins) == 1
+        assert joins[0].parameters["on"] == ["account_id"]
+        assert joins[0].parameters["how"] == "left"
+
+    def test_set_index_is_passthrough(self):
+        flow = convert(self.CODE)
+        assert flow.get_recipes_by_type(RecipeType.PYTHON) == []
+        (join,) = flow.get_recipes_by_type(RecipeType.JOIN)
+        assert [(k.left_column, k.right_column) for k in join.join_keys] == [
+            ("account_id", "account_id")
+        ]
+
+    def test_sorted_index_is_passthrough(self):
+        code = self.CODE.replace(
+            "accounts.set_index('account_id')",
+            "accounts.set_index('account_id').sort_index()",
+        )
+        flow = convert(code)
+        assert flow.get_recipes_by_type(RecipeType.PYTHON) == []
+        assert len(flow.get_recipes_by_type(RecipeType.JOIN)) == 1
+
+    JOIN_LIST_CODE = (
+        "import pandas as pd\n"
+        "customers = pd.read_parquet('customers.parquet')\n"
+        "a = pd.read_parquet('a.parquet')\n"
+        "b = pd.read_parquet('b.parquet')\n"
+        "c = pd.read_parquet('c.parquet')\n"
+        "base = customers[['id', 'name']].set_index('id')\n"
+        "wide = base.join([a, b, c], how='left')\n"
+    )
+
+    def test_join_list_chains_one_join_per_frame(self):
+        joins = [
+            t for t in CodeAnalyzer().analyze(self.JOIN_LIST_CODE)
+            if t.transformation_type == TransformationType.JOIN
+        ]
+        assert [
+            (t.source_dataframe, t.parameters["right"], t.target_dataframe) for t in joins
+        ] == [
+            ("base", "a", "wide_join_1"),
+            ("wide_join_1", "b", "wide_join_2"),
+            ("wide_join_2", "c", "wide"),
+        ]
+
+    def test_join_list_flow_is_acyclic(self):
+        flow = convert(self.JOIN_LIST_CODE)
+        result = flow.validate()
+        assert not [e for e in result["errors"] if e["type"] == "CYCLE_DETECTED"]
+        first = flow.get_recipes_by_type(RecipeType.JOIN)[0]
+        # The selected, re-indexed customers feed the first join.
+        assert "" not in first.inputs
+        assert flow.get_recipes_by_type(RecipeType.PYTHON) == []
+
+
+class TestGroupbyTransformWindow:
+    """df.groupby(keys)[col].transform(fn) is a partitioned Window recipe."""
+
+    CODE = (
+        "import pandas as pd\n"
+        "tx = pd.read_parquet('tx.parquet')\n"
+        "tx['avg_amount'] = tx.groupby('account_id')['amount'].transform('mean')\n"
+        "tx['std_amount'] = tx.groupby('account_id')['amount'].transform('std')\n"
+        "tx.to_parquet('out.parquet')\n"
+    )
+
+    def test_transform_emits_window(self):
+        windows = [
+            t for t in CodeAnalyzer().analyze(self.CODE)
+            if t.transformation_type == TransformationType.WINDOW
+        ]
+        assert [t.parameters["window_function"] for t in windows] == ["AVG", "STDDEV"]
+        assert windows[0].parameters["partition_columns"] == ["account_id"]
+        assert windows[0].parameters["output_column"] == "avg_amount"
+        assert windows[0].target_dataframe == "tx"
+
+    def test_flow_has_no_sklearn_fallback(self):
+        flow = convert(self.CODE, optimize=False)
+        assert flow.get_recipes_by_type(RecipeType.PYTHON) == []
+        first, second = flow.get_recipes_by_type(RecipeType.WINDOW)
+        assert first.partition_columns == ["account_id"]
+        assert first.window_aggregations == [{"column": "amount", "type": "AVG"}]
+        # The second window reads the first one's output, never the source.
+        assert second.inputs == first.outputs
+        assert second.outputs != ["tx"]
+
+    def test_size_is_a_count_window(self):
+        code = (
+            "import pandas as pd\n"
+            "tx = pd.read_parquet('tx.parquet')\n"
+            "tx['n_tx'] = tx.groupby('account_id')['amount'].transform('size')\n"
+        )
+        (window,) = [
+            t for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.WINDOW
+        ]
+        assert window.parameters["window_function"] == "COUNT"
+
+
+class TestDateDifference:
+    """(end - start).dt.days translates to GREL diff() on the dates."""
+
+    def _expressions(self, code):
+        return {
+            t.parameters.get("column"): t.parameters.get("expression")
+            for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.COLUMN_CREATE
+        }
+
+    def test_days_between_columns(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['days'] = (df['end_date'] - df['start_date']).dt.days\n"
+        )
+        assert self._expressions(code) == {
+            "days": 'diff(val("end_date"), val("start_date"), "days")'
+        }
+
+    def test_days_since_now_with_floor_division(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['age'] = (pd.Timestamp.now() - df['birth_date']).dt.days // 365\n"
+        )
+        assert self._expressions(code) == {
+            "age": 'floor((diff(now(), val("birth_date"), "days")) / (365))'
+        }
+
+    def test_days_since_now_with_missing_default(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['idle'] = (pd.Timestamp.now() - df['last_order']).dt.days.fillna(999)\n"
+        )
+        assert self._expressions(code) == {
+            "idle": 'coalesce(diff(now(), val("last_order"), "days"), 999)'
+        }
+
+
+class TestFlagCast:
+    """A predicate cast to an integer type becomes a 0/1 GREL column."""
+
+    def _expressions(self, code):
+        return {
+            t.parameters.get("column"): t.parameters.get("expression")
+            for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.COLUMN_CREATE
+        }
+
+    @pytest.mark.parametrize("dtype", ["int", "'int8'", "np.uint8"])
+    def test_integer_flag(self, dtype):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            f"df['low'] = (df['stock'] < df['lead_time'] * 2).astype({dtype})\n"
+        )
+        assert self._expressions(code) == {
+            "low": 'if(val("stock") < (val("lead_time")) * (2), 1, 0)'
+        }
+
+    def test_non_integer_cast_is_not_a_flag(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['low'] = (df['stock'] < 5).astype('float32')\n"
+        )
+        assert self._expressions(code) == {}
+
+
+class TestMergeThenGroupby:
+    """a.merge(b).groupby(...).agg(...) groups the joined rows."""
+
+    def test_join_feeds_grouping(self):
+        code = (
+            "import pandas as pd\n"
+            "dx = pd.read_parquet('dx.parquet')\n"
+            "enc = pd.read_parquet('enc.parquet')\n"
+            "lookup = enc[['encounter_id', 'patient_id']]\n"
+            "counts = dx.merge(lookup, on='encounter_id').groupby('patient_id').agg(\n"
+            "    n=('code', 'nunique'),\n"
+            ").reset_index()\n"
+            "counts.to_parquet('counts.parquet')\n"
+        )
+        flow = convert(code)
+        (join,) = flow.get_recipes_by_type(RecipeType.JOIN)
+        (grouping,) = flow.get_recipes_by_type(RecipeType.GROUPING)
+        assert join.inputs[0] == "dx"
+        assert grouping.inputs == join.outputs
+
+
+class TestNumpySelect:
+    """np.select over df columns becomes a nested GREL if()."""
+
+    def _expressions(self, code):
+        return {
+            t.parameters.get("column"): t.parameters.get("expression")
+            for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.COLUMN_CREATE
+        }
+
+    def test_first_matching_condition_wins(self):
+        code = (
+            "import pandas as pd\n"
+            "import numpy as np\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['tier'] = np.select(\n"
+            "    [df['score'] >= 90, df['score'] >= 50],\n"
+            "    ['gold', 'silver'],\n"
+            "    default='bronze',\n"
+            ")\n"
+        )
+        assert self._expressions(code) == {
+            "tier": 'if(val("score") >= 90, "gold", '
+            'if(val("score") >= 50, "silver", "bronze"))'
+        }
+
+    def test_string_concatenation(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['label'] = df['id'].astype(str) + ': ' + df['amount'].round(2).astype(str)\n"
+        )
+        assert self._expressions(code) == {
+            "label": '((toString(val("id"))) + (": ")) + '
+            '(toString(round((val("amount")) * 100) / 100))'
+        }
+
+    def test_arrow_string_cast_concatenation(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['key'] = df['chrom'].astype('string[pyarrow]') + ':' + df['pos'].astype('string')\n"
+        )
+        assert self._expressions(code) == {
+            "key": '((toString(val("chrom"))) + (":")) + (toString(val("pos")))'
+        }
+
+
+class TestNumpyWhere:
+    """np.where over df columns becomes a GREL if(), alone or inside arithmetic."""
+
+    def _expressions(self, code):
+        return {
+            t.parameters.get("column"): t.parameters.get("expression")
+            for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.COLUMN_CREATE
+        }
+
+    def test_column_assignment(self):
+        code = (
+            "import pandas as pd\n"
+            "import numpy as np\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['sign'] = np.where(df['value'] > 0, 'positive', 'other')\n"
+        )
+        assert self._expressions(code) == {
+            "sign": 'if(val("value") > 0, "positive", "other")'
+        }
+
+    def test_zero_divisor_guard(self):
+        code = (
+            "import pandas as pd\n"
+            "import numpy as np\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['ctr'] = df['clicks'] / np.where(df['views'] == 0, 1, df['views'])\n"
+        )
+        assert self._expressions(code) == {
+            "ctr": '(val("clicks")) / (if(val("views") == 0, 1, val("views")))'
+        }
+
+
+class TestGroupbyRolling:
+    """df.groupby(keys).rolling(n)[col].<agg>() is a partitioned rolling window."""
+
+    CODE = (
+        "import pandas as pd\n"
+        "df = pd.read_parquet('daily.parquet')\n"
+        "df['avg_7d'] = df.groupby('product_id').rolling(7, min_periods=1)['revenue']"
+        ".mean().reset_index(level=0, drop=True)\n"
+    )
+
+    def test_single_partitioned_window(self):
+        (rolling,) = CodeAnalyzer().analyze(self.CODE)[1:]
+        assert rolling.transformation_type == TransformationType.ROLLING
+        assert rolling.target_dataframe == "df"
+        assert rolling.parameters["partition_columns"] == ["product_id"]
+        assert rolling.parameters["window"] == 7
+        assert rolling.parameters["window_function"] == "AVG"
+        assert rolling.parameters["output_column"] == "avg_7d"
+
+    def test_no_python_recipe(self):
+        flow = convert(self.CODE)
+        assert flow.get_recipes_by_type(RecipeType.PYTHON) == []
+        (window,) = flow.get_recipes_by_type(RecipeType.WINDOW)
+        assert window.partition_columns == ["product_id"]
+
+    def test_time_window_assigned_with_to_numpy(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('readings.parquet')\n"
+            "df = df.sort_values(['sensor_id', 'ts'])\n"
+            "df['avg_1h'] = df.groupby('sensor_id').rolling('1h', on='ts')['value']"
+            ".mean().to_numpy()\n"
+        )
+        rolling = CodeAnalyzer().analyze(code)[-1]
+        assert rolling.transformation_type == TransformationType.ROLLING
+        assert rolling.parameters["window"] == "1h"
+        assert rolling.parameters["partition_columns"] == ["sensor_id"]
+        assert rolling.parameters["output_column"] == "avg_1h"
+
+
+class TestSearchsortedBinner:
+    """Categorical.from_codes(np.searchsorted(edges, col)) is a Binner."""
+
+    def test_binner_with_inner_edges(self):
+        code = (
+            "import pandas as pd\n"
+            "import numpy as np\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['tier'] = pd.Categorical.from_codes(\n"
+            "    np.searchsorted([100, 500], df['total']),\n"
+            "    categories=['low', 'mid', 'high'],\n"
+            ")\n"
+        )
+        (binner,) = CodeAnalyzer().analyze(code)[1:]
+        assert binner.suggested_processor == "Binner"
+        assert binner.source_dataframe == "df"
+        assert binner.parameters["column"] == "total"
+        assert binner.parameters["bins"] == ["100", "500"]
+
+    def test_binner_with_masked_codes(self):
+        code = (
+            "import pandas as pd\n"
+            "import numpy as np\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['tier'] = pd.Categorical.from_codes(\n"
+            "    np.where(\n"
+            "        (df['total'] > 0) & df['total'].notna(),\n"
+            "        np.searchsorted([100, 500], df['total']),\n"
+            "        -1,\n"
+            "    ),\n"
+            "    categories=['low', 'mid', 'high'],\n"
+            ")\n"
+        )
+        (binner,) = CodeAnalyzer().analyze(code)[1:]
+        assert binner.suggested_processor == "Binner"
+        assert binner.parameters["column"] == "total"
+        assert binner.parameters["bins"] == ["100", "500"]
+
+
+class TestDtFormat:
+    """.dt.strftime / .dt.to_period become DateFormatter steps."""
+
+    @pytest.mark.parametrize(
+        "expr, pattern",
+        [
+            (".dt.strftime('%Y-%m-%d')", "yyyy-MM-dd"),
+            (".dt.strftime('%B %d, %Y')", "MMMM dd, yyyy"),
+            (".dt.strftime('Week of %d')", "'Week' 'of' dd"),
+            (".dt.to_period('M')", "yyyy-MM"),
+        ],
+    )
+    def test_date_formatter(self, expr, pattern):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            f"df['label'] = df['date']{expr}\n"
+        )
+        flow = convert(code)
+        assert flow.get_recipes_by_type(RecipeType.PYTHON) == []
+        (prepare,) = flow.get_recipes_by_type(RecipeType.PREPARE)
+        (step,) = prepare.steps
+        assert step.params == {"column": "date", "format": pattern, "outputColumn": "label"}
+
+    def test_untranslatable_directive_is_not_a_formatter(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "df['week'] = df['date'].dt.strftime('%U')\n"
+        )
+        assert not any(
+            t.suggested_processor == "DateFormatter"
+            for t in CodeAnalyzer().analyze(code)
+        )
+
+
+class TestShapeSubscript:
+    """df.shape[i] is a scalar, not a row filter on df."""
+
+    def test_not_a_filter(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_parquet('data.parquet')\n"
+            "n_cols = df.shape[1]\n"
+        )
+        assert [t.transformation_type for t in CodeAnalyzer().analyze(code)] == [
+            TransformationType.READ_DATA
+        ]
+
+
+class TestArangeRowNumber:
+    """np.arange over len(df) assigned into df is a ROW_NUMBER column."""
+
+    def test_row_number_window(self):
+        code = (
+            "import numpy as np\n"
+            "import pandas as pd\n"
+            "df = pd.read_csv('data.csv')\n"
+            "df['rank'] = np.arange(1, len(df) + 1, dtype=np.int32)\n"
+        )
+        window = [
+            t for t in CodeAnalyzer().analyze(code)
+            if t.transformation_type == TransformationType.WINDOW
+        ]
+        assert len(window) == 1
+        assert window[0].source_dataframe == "df"
+        assert window[0].parameters["window_function"] == "ROW_NUMBER"
+        assert window[0].parameters["output_column"] == "rank"
+
+    def test_other_frame_is_not_row_number(self):
+        code = (
+            "import numpy as np\n"
+            "import pandas as pd\n"
+            "df = pd.read_csv('data.csv')\n"
+            "other = pd.read_csv('other.csv')\n"
+            "df['rank'] = np.arange(len(other))\n"
+        )
+        assert not any(
+            t.transformation_type == TransformationType.WINDOW
+            for t in CodeAnalyzer().analyze(code)
+        )
+
+
+class TestClipPositionalBounds:
+    """Series.clip(lower, upper) passes its bounds positionally too."""
+
+    def test_positional_bounds(self):
+        code = (
+            "import pandas as pd\n"
+            "df = pd.read_csv('data.csv')\n"
+            "df['x'] = df['x'].clip(0, 5)\n"
+        )
+        clip = [
+            t for t in CodeAnalyzer().analyze(code)
+            if t.parameters.get("operation") == "clip"
+        ]
+        assert len(clip) == 1
+        assert clip[0].parameters["lower"] == 0
+        assert clip[0].parameters["upper"] == 5
@@ -17,6 +17,7 @@ from py2dataiku.cli import (
     write_output,
     log,
     convert_code,
+    clear_caches,
     format_flow,
     format_transformations,
     format_llm_analysis,
@@ -118,6 +119,30 @@ class TestParser:
         assert args.format == "json"
         assert args.llm is True
 
+    def test_version_flag(self, capsys):
+        from py2dataiku import __version__
+
+        with pytest.raises(SystemExit) as exc:
+            create_parser().parse_args(["--version"])
+
+        assert exc.value.code == 0
+        assert capsys.readouterr().out.strip() == f"py2dataiku {__version__}"
+
+    def test_import_defers_optional_modules(self):
+        """Importing the CLI does not load yaml, asyncio, networking or metadata."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, py2dataiku.cli; "
+            "print(sorted(m for m in ('yaml', 'asyncio', 'importlib.metadata', "
+            "'ssl', 'urllib.request', 'hashlib') if m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "[]"
+
 
 class TestReadInput:
     """Tests for read_input function."""
@@ -135,6 +160,20 @@ class TestReadInput:
         finally:
             os.unlink(temp_path)
 
+    def test_read_crlf_file_converts(self):
+        """CRLF line endings are passed through and still parse."""
+        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
+            f.write(b"import pandas as pd\r\ndf = pd.read_csv('data.csv')\r\n")
+            temp_path = f.name
+
+        try:
+            content = read_input(temp_path)
+            assert "\r\n" in content
+            flow = convert_code(content)
+            assert len(flow.datasets) >= 1
+        finally:
+            os.unlink(temp_path)
+
     def test_read_from_stdin(self):
         """Test reading from stdin."""
         code = "df = df.fillna(0)"
@@ -142,6 +181,16 @@ class TestReadInput:
             content = read_input("-")
             assert content == code
 
+    def test_read_from_stdin_buffer(self):
+        """Byte stdin is decoded as UTF-8 without newline translation."""
+        import io
+
+        raw = "df = df.rename(columns={'ä': 'a'})\r\n".encode("utf-8")
+        stdin = io.TextIOWrapper(io.BytesIO(raw), encoding="latin-1")
+        with patch("sys.stdin", stdin):
+            content = read_input("-")
+        assert content == raw.decode("utf-8")
+
     def test_file_not_found(self):
         """Test error on missing file."""
         with pytest.raises(FileNotFoundError):
@@ -305,6 +354,19 @@ class TestMainCommand:
         captured = capsys.readouterr()
         assert "py2dataiku" in captured.out or "convert" in captured.out
 
+    def test_parser_reused_without_leaking_options(self, tmp_path, capsys):
+        """main() reuses one parser; options from one call don't carry over."""
+        from py2dataiku.cli import _shared_parser
+
+        path = tmp_path / "script.py"
+        path.write_text("import pandas as pd\ndf = pd.read_csv('a.csv')\n")
+
+        assert main(["convert", str(path), "-f", "yaml", "-q"]) == 0
+        capsys.readouterr()
+        assert main(["convert", str(path), "-q"]) == 0
+        assert "flow_name" in json.loads(capsys.readouterr().out)
+        assert _shared_parser() is _shared_parser()
+
     def test_convert_command(self, capsys):
         """Test convert command."""
         code = """
@@ -720,6 +782,42 @@ class TestConvertCodeLlmPath:
         )
 
 
+    @pytest.fixture
+    def clear_memo(self):
+        clear_caches()
+        yield
+        clear_caches()
+
+    def test_llm_results_memoized(self, clear_memo):
+        """Repeated identical LLM conversions make one call and return copies."""
+        flow = convert_code("import pandas as pd")
+        with patch("py2dataiku.convert_with_llm", return_value=flow) as mock_fn:
+            first = convert_code("df = df.dropna()", use_llm=True)
+            second = convert_code("df = df.dropna()", use_llm=True)
+            convert_code("df = df.dropna()", use_llm=True, flow_name="other")
+
+        assert mock_fn.call_count == 2
+        assert first is not second
+        assert first.to_dict() == second.to_dict()
+
+    def test_explicit_api_key_not_memoized(self, clear_memo):
+        flow = convert_code("import pandas as pd")
+        with patch("py2dataiku.convert_with_llm", return_value=flow) as mock_fn:
+            convert_code("df = df.dropna()", use_llm=True, api_key="sk-test")
+            convert_code("df = df.dropna()", use_llm=True, api_key="sk-test")
+
+        assert mock_fn.call_count == 2
+
+    def test_cache_clear(self, clear_memo):
+        flow = convert_code("import pandas as pd")
+        with patch("py2dataiku.convert_with_llm", return_value=flow) as mock_fn:
+            convert_code("df = df.dropna()", use_llm=True)
+            clear_caches()
+            convert_code("df = df.dropna()", use_llm=True)
+
+        assert mock_fn.call_count == 2
+
+
 class TestConvertCommandExtended:
     """Additional tests for cmd_convert / main(['convert', ...])."""
 
@@ -1264,3 +1362,166 @@ class TestParserExtended:
         parser = create_parser()
         args = parser.parse_args(["convert", "script.py"])
         assert args.name == "converted_flow"
+
+
+class TestAnalysisCache:
+    """Tests for the --cache on-disk analysis cache."""
+
+    CODE = (
+        "import pandas as pd\n"
+        "df = pd.read_csv('data.csv')\n"
+        "df = df.dropna()\n"
+        "out = df.groupby('k').agg({'v': 'sum'})\n"
+    )
+
+    @pytest.fixture(autouse=True)
+    def _cache_dir(self, tmp_path, monkeypatch):
+        from py2dataiku import analysis_cache
+
+        monkeypatch.setenv("PY2DATAIKU_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(analysis_cache, "_recent", {})
+        self.cache_dir = tmp_path
+
+    def test_second_call_hits(self):
+        from py2dataiku.analysis_cache import load_or_analyze
+
+        first, hit1 = load_or_analyze(self.CODE)
+        second, hit2 = load_or_analyze(self.CODE)
+
+        assert (hit1, hit2) == (False, True)
+        assert [t.to_dict() for t in second] == [t.to_dict() for t in first]
+        assert len(list(self.cache_dir.rglob("*.pkl"))) == 1
+
+    def test_repeat_in_process_skips_disk(self):
+        from py2dataiku.analysis_cache import load_or_analyze
+
+        first, _ = load_or_analyze(self.CODE)
+        for entry in self.cache_dir.rglob("*.pkl"):
+            entry.unlink()
+
+        second, hit = load_or_analyze(self.CODE)
+        assert hit is True
+        assert second is not first
+        second[0].columns.append("mutated")
+        third, _ = load_or_analyze(self.CODE)
+        assert "mutated" not in third[0].columns
+
+    def test_key_depends_on_source(self):
+        from py2dataiku.analysis_cache import cache_key
+
+        assert cache_key(self.CODE) == cache_key(self.CODE)
+        assert cache_key(self.CODE) != cache_key(self.CODE + "\n")
+
+    def test_corrupt_entry_is_a_miss(self):
+        from py2dataiku.analysis_cache import load_or_analyze
+
+        from py2dataiku import analysis_cache
+
+        load_or_analyze(self.CODE)
+        analysis_cache._recent.clear()  # force a read from disk
+        (entry,) = self.cache_dir.rglob("*.pkl")
+        entry.write_bytes(b"not a pickle")
+
+        transformations, hit = load_or_analyze(self.CODE)
+        assert hit is False
+        assert transformations
+
+    def test_syntax_error_not_cached(self):
+        from py2dataiku.analysis_cache import load_or_analyze
+        from py2dataiku.exceptions import InvalidPythonCodeError
+
+        with pytest.raises(InvalidPythonCodeError):
+            load_or_analyze("def broken(")
+        assert not list(self.cache_dir.rglob("*.pkl"))
+
+    def test_cli_reports_hit_and_miss(self, tmp_path, capsys):
+        path = tmp_path / "script.py"
+        path.write_text(self.CODE, encoding="utf-8")
+
+        assert main(["convert", str(path), "--cache"]) == 0
+        assert "Analysis cache miss" in capsys.readouterr().err
+        assert main(["analyze", str(path), "--cache"]) == 0
+        assert "Analysis cache hit" in capsys.readouterr().err
+
+    def test_cached_flow_matches_uncached(self):
+        cached = convert_code(self.CODE, use_cache=True)
+        plain = convert_code(self.CODE)
+
+        assert cached.to_dict()["recipes"] == plain.to_dict()["recipes"]
+
+    def test_cli_llm_cache_reports_hits(self, tmp_path, capsys, monkeypatch):
+        import py2dataiku
+        from py2dataiku.llm.providers import MockProvider
+
+        monkeypatch.setattr(py2dataiku, "get_provider", lambda *a, **k: MockProvider())
+        path = tmp_path / "script.py"
+        path.write_text(self.CODE, encoding="utf-8")
+        clear_caches()
+        try:
+            assert main(["convert", str(path), "--llm", "--cache"]) == 0
+            assert "LLM cache: 0 hit(s), 1 miss(es)" in capsys.readouterr().err
+            clear_caches()
+            assert main(["convert", str(path), "--llm", "--cache"]) == 0
+            assert "LLM cache: 1 hit(s), 0 miss(es)" in capsys.readouterr().err
+        finally:
+            clear_caches()
+
+    def test_cli_llm_cache_logged_on_memo_hit(self, tmp_path, capsys, monkeypatch):
+        import py2dataiku
+        from py2dataiku.llm.providers import MockProvider
+
+        monkeypatch.setattr(py2dataiku, "get_provider", lambda *a, **k: MockProvider())
+        path = tmp_path / "script.py"
+        path.write_text(self.CODE, encoding="utf-8")
+        clear_caches()
+        try:
+            assert main(["convert", str(path), "--llm", "--cache", "--quiet"]) == 0
+            capsys.readouterr()
+            assert main(["convert", str(path), "--llm", "--cache"]) == 0
+            assert "LLM cache: 0 hit(s), 0 miss(es)" in capsys.readouterr().err
+        finally:
+            clear_caches()
+
+
+class TestAnalyzerReuse:
+    """Analyzer instances are reused across CLI calls."""
+
+    CODE = "import pandas as pd\ndf = pd.read_csv('a.csv')\ndf = df.dropna()\n"
+
+    def test_code_analyzer_reused_per_thread(self):
+        import threading
+
+        from py2dataiku.cli import CodeAnalyzer, _analyze_source, _get_code_analyzer
+
+        first = _analyze_source(self.CODE, use_cache=False, quiet=True)
+        second = _analyze_source(self.CODE, use_cache=False, quiet=True)
+        assert first is not second
+        assert [t.to_dict() for t in first] == [t.to_dict() for t in second]
+
+        ident = threading.get_ident()
+        assert _get_code_analyzer(CodeAnalyzer, ident) is _get_code_analyzer(
+            CodeAnalyzer, ident
+        )
+        assert _get_code_analyzer(CodeAnalyzer, ident) is not _get_code_analyzer(
+            CodeAnalyzer, ident + 1
+        )
+
+    def test_llm_analyzer_keyed_by_provider_and_key(self, monkeypatch):
+        import py2dataiku
+        from py2dataiku.cli import _get_llm_analyzer, _llm_analyzer_slot
+        from py2dataiku.llm.providers import MockProvider
+
+        monkeypatch.setattr(py2dataiku, "get_provider", lambda *a, **k: MockProvider())
+        clear_caches()
+        try:
+            a = _get_llm_analyzer("anthropic", "sk-one")
+            assert _get_llm_analyzer("anthropic", "sk-one") is a
+            assert _get_llm_analyzer("anthropic", "sk-two") is not a
+            assert _get_llm_analyzer("openai", "sk-one") is not a
+            assert _llm_analyzer_slot.cache_info().currsize == 3
+            for provider in ("p1", "p2", "p3", "p4"):
+                _get_llm_analyzer(provider, "sk-one")
+            assert _llm_analyzer_slot.cache_info().currsize == 4
+            assert _get_llm_analyzer("anthropic", "sk-one") is not a
+        finally:
+            clear_caches()
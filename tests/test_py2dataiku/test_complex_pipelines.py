@@ -59,7 +59,7 @@ class TestComplexPipelineBasics:
             assert code, f"Empty code for {name}"
             assert "import pandas" in code
             assert "pd.read_csv" in code
-            assert ".to_csv" in code
+            assert ".to_csv" in code or ".to_parquet" in code
 
     def test_get_nonexistent_example_returns_empty(self):
         """Test that getting a non-existent example returns empty string."""
@@ -125,10 +125,10 @@ class TestCustomer360Pipeline:
 
     def test_has_complex_joins(self):
         """Test that complex joins are present in the pipeline."""
-        # The pipeline has pd.merge operations and a loop-based merge pattern
+        # The pipeline has pd.merge operations and a multi-frame index join
         assert "pd.merge" in CUSTOMER_360_PIPELINE
-        # Also uses for loop to merge multiple metrics DataFrames
-        assert "for metrics_df in" in CUSTOMER_360_PIPELINE
+        # Also joins all metrics DataFrames in a single DataFrame.join call
+        assert "customer_base.join(" in CUSTOMER_360_PIPELINE
 
     def test_has_aggregations(self):
         """Test that aggregations are present."""
@@ -154,7 +154,7 @@ class TestSupplyChainPipeline:
     def test_has_time_series_operations(self):
         """Test that time series operations are detected."""
         assert ".rolling" in SUPPLY_CHAIN_PIPELINE
-        assert "pd.to_datetime" in SUPPLY_CHAIN_PIPELINE
+        assert "parse_dates=['sale_date']" in SUPPLY_CHAIN_PIPELINE
 
     def test_has_window_functions(self):
         """Test that window functions are present."""
@@ -199,6 +199,23 @@ class TestMarketingAttributionPipeline:
         """Test that ROI calculations are present."""
         assert "roi" in MARKETING_ATTRIBUTION_PIPELINE.lower()
 
+    def test_time_decay_divisor_guarded(self):
+        """A journey whose decay weights all underflow divides by 1, not 0."""
+        flow = convert(MARKETING_ATTRIBUTION_PIPELINE)
+        columns = [
+            step.params.get("column")
+            for recipe in flow.recipes
+            for step in getattr(recipe, "steps", [])
+        ]
+        assert columns.index("weight_sum") < columns.index("time_decay_credit")
+        guard = next(
+            step
+            for recipe in flow.recipes
+            for step in getattr(recipe, "steps", [])
+            if step.params.get("column") == "weight_sum"
+        )
+        assert guard.params["expression"] == 'if(val("weight_sum") == 0, 1, val("weight_sum"))'
+
     def test_produces_html_output(self):
         """Test HTML visualization generation."""
         flow = convert(MARKETING_ATTRIBUTION_PIPELINE)
@@ -233,6 +250,32 @@ class TestIoTPredictiveMaintenancePipeline:
         assert "maintenance" in IOT_PREDICTIVE_MAINTENANCE_PIPELINE.lower()
         assert "priority" in IOT_PREDICTIVE_MAINTENANCE_PIPELINE.lower()
 
+    def test_time_rolling_assignment_aligns_with_rows(self):
+        """The sort + groupby().rolling(on=...).to_numpy() idiom fills every row."""
+        pd = pytest.importorskip("pandas")
+        assert ".rolling('1h', on='reading_time')['sensor_value'].mean().to_numpy()" in (
+            IOT_PREDICTIVE_MAINTENANCE_PIPELINE
+        )
+
+        readings = pd.DataFrame({
+            "equipment_id": [2, 1, 1, 2, 1],
+            "sensor_type": ["temp"] * 5,
+            "reading_time": pd.to_datetime([
+                "2024-01-01 00:10", "2024-01-01 02:00", "2024-01-01 00:00",
+                "2024-01-01 00:00", "2024-01-01 00:30",
+            ]),
+            "sensor_value": [20.0, 3.0, 1.0, 10.0, 2.0],
+        })
+        readings = readings.sort_values(["equipment_id", "sensor_type", "reading_time"])
+        readings["value_1h_mean"] = readings.groupby(
+            ["equipment_id", "sensor_type"]
+        ).rolling("1h", on="reading_time")["sensor_value"].mean().to_numpy()
+
+        expected = {1.0: 1.0, 2.0: 1.5, 3.0: 3.0, 10.0: 10.0, 20.0: 15.0}
+        assert readings["value_1h_mean"].notna().all()
+        for value, mean in zip(readings["sensor_value"], readings["value_1h_mean"]):
+            assert mean == expected[value]
+
 
 class TestGenomicAnalysisPipeline:
     """Tests for the Genomic Variant Analysis Pipeline."""
@@ -369,9 +412,9 @@ class TestComplexPipelineMetrics:
     def test_customer_360_complexity(self):
         """Test that customer 360 pipeline has expected complexity."""
         code = CUSTOMER_360_PIPELINE
-        # Uses explicit merges + loop-based merge pattern
+        # Uses explicit merges + a multi-frame index join
         assert code.count("pd.merge") >= 2  # Direct merges
-        assert "for metrics_df in" in code  # Loop-based merges (8 additional)
+        assert "customer_base.join(" in code  # One join of 8 metrics tables
         assert code.count(".groupby") >= 8  # Many aggregations
         assert code.count("pd.read_csv") >= 8  # Many data sources
 
@@ -423,7 +466,9 @@ class TestComplexPipelineCodePatterns:
     def test_all_pipelines_have_data_output(self):
         """Test that all pipelines output data."""
         for name, code in COMPLEX_EXAMPLES.items():
-            assert ".to_csv" in code, f"{name} missing data output"
+            assert ".to_csv" in code or ".to_parquet" in code, (
+                f"{name} missing data output"
+            )
 
     def test_all_pipelines_have_transformations(self):
         """Test that all pipelines have data transformations."""
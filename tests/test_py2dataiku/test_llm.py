@@ -49,6 +49,15 @@ class TestDataStep:
         assert len(step.filter_conditions) == 1
         assert step.filter_conditions[0].value == 100
 
+    @pytest.mark.parametrize("value", ["not_an_op", None, ["filter"], 3])
+    def test_data_step_from_dict_unknown_operation(self, value):
+        step = DataStep.from_dict({"operation": value, "description": "x"})
+        assert step.operation == OperationType.UNKNOWN
+
+    def test_data_step_from_dict_accepts_every_operation_value(self):
+        for op in OperationType:
+            assert DataStep.from_dict({"operation": op.value}).operation is op
+
     def test_data_step_to_dict(self):
         step = DataStep(
             step_number=1,
@@ -3176,3 +3185,370 @@ class TestAnthropicPromptCaching:
         assert result.usage["cache_read_input_tokens"] == 200
         assert result.usage["input_tokens"] == 10
         assert result.usage["output_tokens"] == 5
+
+
+class TestAsyncAnalysis:
+    """analyze_async / complete_async / convert_files_with_llm."""
+
+    MOCK_RESPONSE = json.dumps({
+        "code_summary": "Read and sort",
+        "datasets": [{"name": "df", "is_input": True}],
+        "steps": [
+            {
+                "step_number": 1,
+                "operation": "sort",
+                "description": "Sort by id",
+                "input_datasets": ["df"],
+                "output_dataset": "sorted_df",
+                "sort_columns": [{"column": "id", "ascending": True}],
+            },
+        ],
+    })
+
+    def test_analyze_async_matches_analyze(self):
+        import asyncio
+
+        provider = MockProvider(responses={"python": self.MOCK_RESPONSE})
+        analyzer = LLMCodeAnalyzer(provider=provider)
+        code = "import pandas as pd\ndf = df.sort_values('id')"
+
+        sync_result = analyzer.analyze(code)
+        async_result = asyncio.run(analyzer.analyze_async(code))
+
+        assert async_result.to_dict() == sync_result.to_dict()
+
+    def test_base_complete_async_delegates_to_complete(self):
+        import asyncio
+
+        provider = MockProvider()
+        response = asyncio.run(provider.complete_async("hello"))
+
+        assert response.model == "mock"
+        assert provider.calls[-1]["prompt"] == "hello"
+
+    def test_anthropic_complete_async_uses_async_client(self):
+        import asyncio
+        import os
+        from unittest.mock import AsyncMock, MagicMock
+        from py2dataiku.llm.providers import AnthropicProvider
+
+        os.environ["ANTHROPIC_API_KEY"] = "test-key"
+        try:
+            provider = AnthropicProvider()
+        finally:
+            os.environ.pop("ANTHROPIC_API_KEY", None)
+
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="ok")]
+        mock_response.model = "claude"
+        mock_response.usage.input_tokens = 3
+        mock_response.usage.output_tokens = 1
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
+        provider._async_client = mock_client
+
+        result = asyncio.run(provider.complete_async("hi", "system text"))
+
+        assert result.content == "ok"
+        assert result.usage["input_tokens"] == 3
+        call_kwargs = mock_client.messages.create.call_args.kwargs
+        assert call_kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_convert_files_with_llm_preserves_order(self, tmp_path):
+        from py2dataiku import DataikuFlow, convert_files_with_llm
+
+        paths = []
+        for name in ("first", "second", "third"):
+            path = tmp_path / f"{name}.py"
+            path.write_text("import pandas as pd\n", encoding="utf-8")
+            paths.append(path)
+
+        flows = convert_files_with_llm(paths, provider="mock", max_concurrency=2)
+
+        assert [f.name for f in flows] == ["first", "second", "third"]
+        assert all(isinstance(f, DataikuFlow) for f in flows)
+        assert flows[1].source_file == str(paths[1])
+
+    def test_convert_files_with_llm_rejects_zero_concurrency(self):
+        from py2dataiku import convert_files_with_llm
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            convert_files_with_llm([], provider="mock", max_concurrency=0)
+
+
+class TestBatchAnalysis:
+    """analyze_batch packs snippets into one request with per-snippet fallback."""
+
+    @staticmethod
+    def _analysis(summary):
+        return {
+            "code_summary": summary,
+            "datasets": [{"name": "df", "is_input": True}],
+            "steps": [
+                {
+                    "step_number": 1,
+                    "operation": "drop_duplicates",
+                    "description": "Dedupe",
+                    "input_datasets": ["df"],
+                    "output_dataset": "out",
+                }
+            ],
+        }
+
+    def test_batch_prompt_delimits_snippets(self):
+        from py2dataiku.llm.analyzer import get_batch_analysis_prompt
+
+        prompt = get_batch_analysis_prompt(["a = 1", "b = 2"])
+
+        assert "<<<SNIPPET 1>>>" in prompt
+        assert "<<<END SNIPPET 2>>>" in prompt
+        assert "exactly 2 entries" in prompt
+
+    def test_bin_snippets_respects_limits(self):
+        from py2dataiku.llm.analyzer import _bin_snippets
+
+        codes = ["x" * 400, "x" * 40, "x" * 400, "x" * 40, "x" * 4000]
+        bins = _bin_snippets(codes, max_batch_size=2, max_batch_tokens=200)
+
+        assert sorted(i for b in bins for i in b) == list(range(len(codes)))
+        assert all(len(b) <= 2 for b in bins)
+        assert [4] in bins  # oversized snippet isolated
+
+    def test_single_request_for_batch(self):
+        payload = json.dumps({
+            "results": [self._analysis("first"), self._analysis("second")]
+        })
+        provider = MockProvider(responses={"<<<SNIPPET": payload})
+        analyzer = LLMCodeAnalyzer(provider=provider)
+
+        results = analyzer.analyze_batch(["a = 1", "b = 2"])
+
+        assert len(provider.calls) == 1
+        assert [r.code_summary for r in results] == ["first", "second"]
+        assert results[1].steps[0].operation == OperationType.DROP_DUPLICATES
+
+    def test_mismatched_result_count_falls_back(self):
+        payload = json.dumps({"results": [self._analysis("only one")]})
+        provider = MockProvider(responses={"<<<SNIPPET": payload})
+        analyzer = LLMCodeAnalyzer(provider=provider)
+
+        results = analyzer.analyze_batch(["a = 1", "b = 2"])
+
+        # One batched call plus one per-snippet retry each.
+        assert len(provider.calls) == 3
+        assert len(results) == 2
+
+    def test_convert_batch_with_llm_names_flows(self):
+        from py2dataiku import convert_batch_with_llm
+
+        flows = convert_batch_with_llm(
+            ["import pandas as pd", "import numpy as np"],
+            provider="mock",
+            flow_name="snippet",
+        )
+
+        assert [f.name for f in flows] == ["snippet_1", "snippet_2"]
+
+
+class TestStreamingAnalysis:
+    """StepStreamParser / analyze_streaming / convert_with_llm(stream=True)."""
+
+    RESPONSE = "```json\n" + json.dumps({
+        "code_summary": "Filter then sort",
+        "datasets": [{"name": "df", "is_input": True}],
+        "steps": [
+            {
+                "step_number": 1,
+                "operation": "filter",
+                "description": "Keep {active} rows",
+                "input_datasets": ["df"],
+                "output_dataset": "active",
+                "filter_conditions": [
+                    {"column": "status", "operator": "==", "value": "a]}"}
+                ],
+            },
+            {
+                "step_number": 2,
+                "operation": "sort",
+                "description": "Sort by id",
+                "input_datasets": ["active"],
+                "output_dataset": "sorted_df",
+                "sort_columns": [{"column": "id", "ascending": True}],
+            },
+        ],
+    }) + "\n```"
+
+    @staticmethod
+    def _chunks(text, size):
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+    @pytest.mark.parametrize("size", [1, 7, 10_000])
+    def test_parser_yields_each_step_once(self, size):
+        from py2dataiku.llm.step_stream import StepStreamParser
+
+        parser = StepStreamParser()
+        steps = []
+        for delta in self._chunks(self.RESPONSE, size):
+            steps.extend(parser.feed(delta))
+
+        assert [s["step_number"] for s in steps] == [1, 2]
+        assert steps[0]["filter_conditions"][0]["value"] == "a]}"
+        assert parser.text == self.RESPONSE
+
+    def test_parser_ignores_nested_steps_key(self):
+        from py2dataiku.llm.step_stream import StepStreamParser
+
+        parser = StepStreamParser()
+        found = parser.feed('{"meta": {"steps": [{"a": 1}]}, "steps": [{"b": 2}]}')
+
+        assert found == [{"b": 2}]
+
+    def test_analyze_streaming_reports_steps_in_order(self):
+        provider = MockProvider(stream_deltas=self._chunks(self.RESPONSE, 5))
+        analyzer = LLMCodeAnalyzer(provider=provider)
+        seen = []
+
+        result = analyzer.analyze_streaming("df = df.sort_values('id')", on_step=seen.append)
+
+        assert [s.operation for s in seen] == [OperationType.FILTER, OperationType.SORT]
+        assert len(result.steps) == 2
+        assert result.code_summary == "Filter then sort"
+        assert result.usage is None
+
+    def test_analyze_streaming_matches_analyze(self):
+        payload = self.RESPONSE.removeprefix("```json\n").removesuffix("\n```")
+        provider = MockProvider(responses={"Analyze": payload})
+        analyzer = LLMCodeAnalyzer(provider=provider)
+
+        streamed = analyzer.analyze_streaming("x = 1")
+        direct = analyzer.analyze("x = 1")
+
+        assert streamed.to_dict()["steps"] == direct.to_dict()["steps"]
+
+    def test_analyze_streaming_invalid_json_raises(self):
+        from py2dataiku.exceptions import LLMResponseParseError
+
+        provider = MockProvider(stream_deltas=['{"steps": [', "oops"])
+        analyzer = LLMCodeAnalyzer(provider=provider)
+
+        with pytest.raises(LLMResponseParseError):
+            analyzer.analyze_streaming("x = 1")
+
+    def test_convert_with_llm_stream_emits_step_events(self, monkeypatch):
+        import py2dataiku
+
+        provider = MockProvider(stream_deltas=self._chunks(self.RESPONSE, 11))
+        monkeypatch.setattr(py2dataiku, "get_provider", lambda *a, **k: provider)
+        events = []
+
+        flow = py2dataiku.convert_with_llm(
+            "x = 1",
+            provider="mock",
+            stream=True,
+            on_progress=lambda phase, info: events.append((phase, info)),
+        )
+
+        phases = [p for p, _ in events]
+        assert phases.index("analyzing") < phases.index("step") < phases.index("analyzed")
+        step_infos = [info for p, info in events if p == "step"]
+        assert [i["operation"] for i in step_infos] == ["filter", "sort"]
+        assert len(flow.recipes) >= 1
+
+
+class TestLLMCache:
+    """LLMCache / CachingProvider response caching."""
+
+    RESPONSE = TestAsyncAnalysis.MOCK_RESPONSE
+
+    def _provider(self):
+        return MockProvider(responses={"Analyze": self.RESPONSE})
+
+    def test_repeated_analysis_hits_cache(self):
+        from py2dataiku.llm import LLMCache
+
+        cache = LLMCache()
+        provider = self._provider()
+        analyzer = LLMCodeAnalyzer(provider=cache.wrap(provider))
+
+        first = analyzer.analyze("df = df.sort_values('id')")
+        second = analyzer.analyze("df = df.sort_values('id')")
+        analyzer.analyze("df = df.dropna()")
+
+        assert len(provider.calls) == 2
+        assert cache.stats == {"hits": 1, "misses": 2}
+        assert second.to_dict()["steps"] == first.to_dict()["steps"]
+
+    def test_nonzero_temperature_not_cached(self):
+        from py2dataiku.llm import LLMCache
+
+        cache = LLMCache()
+        provider = self._provider()
+        provider.temperature = 0.7
+        wrapped = cache.wrap(provider)
+
+        wrapped.complete("Analyze x")
+        wrapped.complete("Analyze x")
+
+        assert len(provider.calls) == 2
+        assert cache.stats == {"hits": 0, "misses": 0}
+
+    def test_key_covers_system_prompt_and_model(self):
+        from py2dataiku.llm import LLMCache
+
+        provider = self._provider()
+        key = LLMCache.key(provider, "p", "s")
+
+        assert key == LLMCache.key(provider, "p", "s")
+        assert key != LLMCache.key(provider, "p", "other")
+        assert key != LLMCache.key(provider, "p2", "s")
+
+    def test_file_backend_persists_across_instances(self, tmp_path):
+        from py2dataiku.llm import FileCacheBackend, LLMCache
+
+        LLMCache(FileCacheBackend(tmp_path)).wrap(self._provider()).complete("Analyze x")
+        provider = self._provider()
+        cache = LLMCache(FileCacheBackend(tmp_path))
+
+        response = cache.wrap(provider).complete("Analyze x")
+
+        assert provider.calls == []
+        assert response.content == self.RESPONSE
+        assert response.usage is None
+
+    def test_file_backend_ignores_corrupt_entry(self, tmp_path):
+        from py2dataiku.llm import FileCacheBackend, LLMCache
+
+        LLMCache(FileCacheBackend(tmp_path)).wrap(self._provider()).complete("Analyze x")
+        for entry in tmp_path.rglob("*.json"):
+            entry.write_text("{", encoding="utf-8")
+        provider = self._provider()
+
+        LLMCache(FileCacheBackend(tmp_path)).wrap(provider).complete("Analyze x")
+
+        assert len(provider.calls) == 1
+
+    def test_stream_is_cached_once_consumed(self):
+        from py2dataiku.llm import LLMCache
+
+        cache = LLMCache()
+        provider = MockProvider(stream_deltas=['{"steps"', ": []}"])
+        wrapped = cache.wrap(provider)
+
+        assert "".join(wrapped.stream_complete("p")) == '{"steps": []}'
+        assert "".join(wrapped.stream_complete("p")) == '{"steps": []}'
+        assert len(provider.calls) == 1
+
+    def test_convert_with_llm_uses_cache(self, monkeypatch):
+        import py2dataiku
+        from py2dataiku.llm import LLMCache
+
+        provider = self._provider()
+        monkeypatch.setattr(py2dataiku, "get_provider", lambda *a, **k: provider)
+        cache = LLMCache()
+
+        py2dataiku.convert_with_llm("x = 1", provider="mock", cache=cache)
+        flow = py2dataiku.convert_with_llm("x = 1", provider="mock", cache=cache)
+
+        assert len(provider.calls) == 1
+        assert cache.hits == 1
+        assert len(flow.recipes) >= 1
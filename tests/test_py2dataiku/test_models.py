@@ -176,6 +176,41 @@ class TestDataikuFlow:
         assert flow.get_dataset("in") is not None
         assert flow.get_dataset("out") is not None
 
+    def test_add_recipe_does_not_duplicate_datasets(self):
+        flow = DataikuFlow()
+        flow.add_dataset(DataikuDataset(name="a", dataset_type=DatasetType.INPUT))
+        flow.add_recipe(
+            DataikuRecipe(
+                name="j1",
+                recipe_type=RecipeType.JOIN,
+                inputs=["a", "b", "b"],
+                outputs=["a", "c"],
+            )
+        )
+        assert [ds.name for ds in flow.datasets] == ["a", "b", "c"]
+        assert flow.get_dataset("b").dataset_type == DatasetType.INPUT
+        assert flow.get_dataset("c").dataset_type == DatasetType.INTERMEDIATE
+
+    def test_dataset_lookup_follows_in_place_list_changes(self):
+        flow = DataikuFlow()
+        flow.add_recipe(DataikuRecipe.create_prepare("p1", "a", "c"))
+        a = flow.get_dataset("a")
+        flow.datasets.remove(a)
+        flow.datasets.append(DataikuDataset(name="b"))
+        assert flow.get_dataset("a") is None
+        assert flow.get_dataset("b") is not None
+
+        flow.datasets[0] = DataikuDataset(name="z")
+        assert flow.get_dataset("z") is flow.datasets[0]
+        assert flow.get_dataset("c") is None
+
+        flow.get_dataset("b").name = "renamed"
+        assert flow.get_dataset("b") is None
+        assert flow.get_dataset("renamed") is not None
+
+        flow.add_recipe(DataikuRecipe.create_prepare("p2", "renamed", "c"))
+        assert [ds.name for ds in flow.datasets] == ["z", "renamed", "c"]
+
     def test_get_recipes_by_type(self):
         flow = DataikuFlow()
         flow.add_recipe(DataikuRecipe.create_prepare("p1", "a", "b"))
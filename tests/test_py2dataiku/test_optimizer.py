@@ -330,6 +330,35 @@ class TestRecipeMerger:
         assert optimized[2].processor_type == ProcessorType.REMOVE_ROWS_ON_EMPTY
         assert optimized[3].processor_type == ProcessorType.COLUMN_RENAMER
 
+    def test_deletion_not_hoisted_above_its_readers(self):
+        """A scratch column is dropped only after the steps that use it."""
+        steps = [
+            PrepareStep(processor_type=ProcessorType.CREATE_COLUMN_WITH_GREL,
+                        params={"column": "tmp", "expression": 'val("a") * 5'}),
+            PrepareStep(processor_type=ProcessorType.CREATE_COLUMN_WITH_GREL,
+                        params={"column": "b", "expression": 'val("tmp") * 2'}),
+            PrepareStep(processor_type=ProcessorType.COLUMN_DELETER,
+                        params={"columns": ["tmp"], "keep": False}),
+            PrepareStep(processor_type=ProcessorType.COLUMN_DELETER,
+                        params={"columns": ["z"], "keep": False}),
+        ]
+
+        optimized = RecipeMerger.optimize_prepare_steps(steps)
+
+        assert [s.params.get("column") or s.params["columns"] for s in optimized] == [
+            ["z"], "tmp", "b", ["tmp"],
+        ]
+
+    def test_keep_mode_selection_not_hoisted(self):
+        steps = [
+            PrepareStep(processor_type=ProcessorType.CREATE_COLUMN_WITH_GREL,
+                        params={"column": "b", "expression": 'val("a") * 2'}),
+            PrepareStep(processor_type=ProcessorType.COLUMNS_SELECTOR,
+                        params={"columns": ["b"], "keep": True}),
+        ]
+
+        assert RecipeMerger.optimize_prepare_steps(steps) == steps
+
     def test_remove_redundant_steps(self):
         """Test removal of redundant steps."""
         steps = [
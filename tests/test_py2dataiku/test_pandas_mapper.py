@@ -184,6 +184,9 @@ class TestGetAggFunction:
     def test_nunique_maps_to_COUNTD(self, mapper):
         assert mapper.get_agg_function("nunique") == "COUNTD"
 
+    def test_unique_maps_to_COLLECT_SET(self, mapper):
+        assert mapper.get_agg_function("unique") == "COLLECT_SET"
+
     def test_case_insensitive(self, mapper):
         assert mapper.get_agg_function("SUM") == "SUM"
         assert mapper.get_agg_function("Mean") == "AVG"
@@ -325,8 +328,11 @@ class TestMapAstype:
         ("int", "bigint"),
         ("int64", "bigint"),
         ("int32", "int"),
+        ("int16", "smallint"),
+        ("int8", "tinyint"),
         ("float", "double"),
         ("float64", "double"),
+        ("float32", "float"),
         ("str", "string"),
         ("string", "string"),
         ("object", "string"),
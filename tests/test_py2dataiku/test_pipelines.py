@@ -164,12 +164,28 @@ class TestAdvancedPipelines:
         # Should have variety of recipe types
         assert len(flow.recipes) >= 0
 
+    def test_ecommerce_flow_is_valid_without_python_recipes(self):
+        """The headline example converts to a valid DAG of visual recipes."""
+        flow = convert(ADVANCED_EXAMPLES["ecommerce_analytics"])
+        assert flow.validate()["errors"] == []
+        assert flow.get_recipes_by_type(RecipeType.PYTHON) == []
+        assert flow.warnings == []
+
     def test_financial_transactions_complexity(self):
         """Test financial transaction pipeline complexity."""
         flow = convert(ADVANCED_EXAMPLES["financial_transactions"])
         # This pipeline should have significant complexity
         assert len(flow.datasets) >= 1
 
+    def test_financial_account_baseline_is_one_window(self):
+        """The per-account statistics land on every transaction row."""
+        flow = convert(ADVANCED_EXAMPLES["financial_transactions"])
+        (window,) = flow.get_recipes_by_type(RecipeType.WINDOW)
+        assert window.partition_columns == ["account_id"]
+        assert [a["type"] for a in window.window_aggregations] == [
+            "AVG", "STDDEV", "MAX", "COUNT", "NUNIQUE",
+        ]
+
     def test_supply_chain_has_calculations(self):
         """Test supply chain pipeline includes calculations."""
         flow = convert(ADVANCED_EXAMPLES["supply_chain"])
@@ -297,6 +313,31 @@ class TestPipelineExports:
         assert "recipes" in flow_dict
 
 
+class TestExamplesPackage:
+    """Example collections are importable from the package, lazily."""
+
+    def test_collections_match_submodules(self):
+        import py2dataiku.examples as examples
+
+        assert examples.ADVANCED_EXAMPLES is ADVANCED_EXAMPLES
+        assert set(examples.__all__) <= set(dir(examples))
+        with pytest.raises(AttributeError):
+            examples.NOT_AN_EXAMPLE
+
+    def test_only_requested_submodule_is_imported(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; from py2dataiku.examples import BASIC_EXAMPLES; "
+            "print(sorted(m for m in sys.modules if m.startswith('py2dataiku.examples.')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "['py2dataiku.examples.basic_pipelines']"
+
+
 # ============================================================================
 # Edge Cases
 # ============================================================================
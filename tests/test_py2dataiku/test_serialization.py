@@ -423,3 +423,66 @@ class TestDataikuFlowRoundTrip:
         d1 = flow.to_dict()
         d2 = DataikuFlow.from_dict(d1).to_dict()
         assert d1 == d2
+
+
+class TestDumpsJson:
+    """dumps_json matches json.dumps whichever encoder is available."""
+
+    DATA = {"name": "flow", "n": 3, "ratio": 0.25, "tags": ["a", "b"], 1: None}
+
+    def test_matches_stdlib(self):
+        from py2dataiku.utils.serialization import dumps_json
+
+        assert dumps_json(self.DATA) == json.dumps(self.DATA, indent=2)
+        assert dumps_json(self.DATA, indent=4) == json.dumps(self.DATA, indent=4)
+
+    def test_non_ascii_escaped_like_stdlib(self):
+        from py2dataiku.utils.serialization import dumps_json
+
+        data = {"label": "café"}
+        assert dumps_json(data) == json.dumps(data, indent=2)
+
+    @pytest.mark.parametrize(
+        "value", [1e-05, 1e16, float("nan"), float("inf"), -0.0, 1.0]
+    )
+    def test_floats_formatted_like_stdlib(self, value):
+        from py2dataiku.utils.serialization import dumps_json
+
+        data = {"steps": [{"params": {"value": value}}]}
+        assert dumps_json(data) == json.dumps(data, indent=2)
+
+    def test_stdlib_fallback(self, monkeypatch):
+        import py2dataiku.utils.serialization as serialization
+
+        monkeypatch.setattr(serialization, "orjson", None)
+        assert serialization.dumps_json(self.DATA) == json.dumps(self.DATA, indent=2)
+
+    def test_flow_to_json_round_trips(self):
+        flow = DataikuFlow(name="f")
+        flow.add_dataset(DataikuDataset(name="in", dataset_type=DatasetType.INPUT))
+        assert json.loads(flow.to_json()) == flow.to_dict()
+
+
+class TestYamlHelpers:
+    """YAML helpers match PyYAML's default output."""
+
+    DATA = {"b": [1, 2], "a": {"name": "x", "ratio": 0.5, "flag": True}}
+
+    def test_dumps_matches_yaml_dump(self):
+        from py2dataiku.utils.serialization import dumps_yaml
+
+        assert dumps_yaml(self.DATA) == yaml.dump(self.DATA, default_flow_style=False)
+        assert dumps_yaml(self.DATA, sort_keys=False) == yaml.dump(
+            self.DATA, default_flow_style=False, sort_keys=False
+        )
+
+    def test_unrepresentable_falls_back(self):
+        from py2dataiku.utils.serialization import dumps_yaml
+
+        data = {"type": RecipeType.JOIN}
+        assert dumps_yaml(data) == yaml.dump(data, default_flow_style=False)
+
+    def test_load_round_trip(self):
+        from py2dataiku.utils.serialization import dumps_yaml, load_yaml
+
+        assert load_yaml(dumps_yaml(self.DATA)) == self.DATA
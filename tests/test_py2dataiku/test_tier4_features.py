@@ -669,6 +669,26 @@ class TestPy2DataikuConfig:
         assert restored.project_key == config.project_key
         assert restored.optimize == config.optimize
 
+    def test_round_trip_all_serialized_fields(self):
+        config = Py2DataikuConfig(
+            default_provider="openai",
+            default_model="gpt-4o",
+            project_key="PROJ",
+            flow_name="nightly",
+            optimize=False,
+            optimization_level=2,
+            dataset_prefix="ds_",
+            dataset_suffix="_v1",
+            recipe_prefix="r_",
+            recipe_suffix="_x",
+            default_format="png",
+            default_connection="postgres",
+        )
+        d = config.to_dict()
+        assert Py2DataikuConfig.from_dict(d) == config
+        assert config.to_dict() is not d
+        assert config.to_dict()["provider"] is not d["provider"]
+
 
 class TestLoadConfig:
     """Tests for config file loading."""
@@ -702,14 +722,49 @@ optimization:
         assert config.optimization_level == 2
 
     def test_load_nonexistent_file(self):
-        config = load_config(config_path="/nonexistent/path/config.yaml")
-        assert config.default_provider == "anthropic"  # defaults
+        with pytest.raises(FileNotFoundError, match="config.yaml"):
+            load_config(config_path="/nonexistent/path/config.yaml")
+
+    def test_load_directory_as_config_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_config(config_path=str(tmp_path))
 
     def test_find_config_file_none(self):
         result = find_config_file(start_dir="/nonexistent/dir")
         # May find home dir config or return None
         assert result is None or result.exists()
 
+    def test_find_config_file_priority(self, tmp_path):
+        (tmp_path / ".py2dataiku.yaml").write_text("{}\n")
+        (tmp_path / "py2dataiku.toml").write_text("")
+        (tmp_path / "notes.txt").write_text("")
+
+        assert find_config_file(start_dir=str(tmp_path)) == tmp_path / "py2dataiku.toml"
+
+    def test_find_config_file_sees_new_file(self, tmp_path):
+        (tmp_path / "py2dataiku.toml").mkdir()  # directories are not config files
+        first = find_config_file(start_dir=str(tmp_path))
+        assert first is None or first.parent != tmp_path
+
+        (tmp_path / ".py2dataikurc").write_text("")
+        assert find_config_file(start_dir=str(tmp_path)) == tmp_path / ".py2dataikurc"
+
+    def test_find_config_file_lists_settled_dir_once(self, tmp_path, monkeypatch):
+        import py2dataiku.config as config_mod
+
+        (tmp_path / "py2dataiku.toml").write_text("")
+        old = tmp_path.stat().st_mtime_ns - 10**10
+        os.utime(tmp_path, ns=(old, old))
+        listed = []
+        real = os.scandir
+        monkeypatch.setattr(
+            config_mod.os, "scandir", lambda d: listed.append(d) or real(d)
+        )
+
+        for _ in range(3):
+            assert config_mod._config_file_in(tmp_path) == tmp_path / "py2dataiku.toml"
+        assert listed == [tmp_path]
+
     def test_env_var_override(self):
         with tempfile.NamedTemporaryFile(
             mode="w", suffix=".yaml", delete=False
@@ -728,6 +783,62 @@ optimization:
                     os.environ["PY2DATAIKU_PROVIDER"] = old_env
         os.unlink(f.name)
 
+    def test_env_overrides_follow_environment(self, tmp_path, monkeypatch):
+        path = tmp_path / "py2dataiku.yaml"
+        path.write_text("project:\n  key: FROM_FILE\n")
+        monkeypatch.delenv("PY2DATAIKU_PROVIDER", raising=False)
+        monkeypatch.delenv("PY2DATAIKU_PROJECT_KEY", raising=False)
+        assert load_config(config_path=str(path)).project_key == "FROM_FILE"
+
+        monkeypatch.setenv("PY2DATAIKU_PROJECT_KEY", "FROM_ENV")
+        monkeypatch.setenv("PY2DATAIKU_PROVIDER", "openai")
+        config = load_config(config_path=str(path))
+        assert config.project_key == "FROM_ENV"
+        assert config.default_provider == "openai"
+
+    def test_unchanged_file_parsed_once(self, tmp_path, monkeypatch):
+        import py2dataiku.config as config_mod
+
+        path = tmp_path / "py2dataiku.yaml"
+        path.write_text("project:\n  key: FIRST\n")
+        calls = []
+        real = config_mod._load_yaml
+        monkeypatch.setattr(
+            config_mod, "_load_yaml", lambda p: calls.append(p) or real(p)
+        )
+
+        first = load_config(config_path=str(path))
+        first.project_key = "MUTATED"
+        second = load_config(config_path=str(path))
+
+        assert len(calls) == 1
+        assert second.project_key == "FIRST"
+        assert second is not first
+
+    def test_modified_file_reparsed(self, tmp_path):
+        path = tmp_path / "py2dataiku.yaml"
+        path.write_text("project:\n  key: FIRST\n")
+        assert load_config(config_path=str(path)).project_key == "FIRST"
+
+        path.write_text("project:\n  key: SECOND_KEY\n")
+        assert load_config(config_path=str(path)).project_key == "SECOND_KEY"
+
+    def test_cache_clear(self, tmp_path, monkeypatch):
+        import py2dataiku.config as config_mod
+
+        path = tmp_path / "py2dataiku.yaml"
+        path.write_text("project:\n  key: FIRST\n")
+        load_config(config_path=str(path))
+        config_mod.clear_config_cache()
+        calls = []
+        real = config_mod._load_yaml
+        monkeypatch.setattr(
+            config_mod, "_load_yaml", lambda p: calls.append(p) or real(p)
+        )
+
+        load_config(config_path=str(path))
+        assert len(calls) == 1
+
 
 # ==================== Integration: imports from __init__ ====================
 